@@ -18,7 +18,8 @@ from utils.validation import (
     validate_list_input,
     validate_numeric_range,
     validate_positive_integer_input,
-    validate_non_negative_integer_input
+    validate_non_negative_integer_input,
+    InputError
 )
 from utils.helper_functions import format_currency, format_percentage, format_number
 
@@ -27,6 +28,9 @@ logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# How often call_when_done checks a background future, in milliseconds
+_FUTURE_POLL_MS = 20
+
 class BaseGUI(ttk.Frame):
     """
     Base class for all financial calculator GUI modules.
@@ -39,6 +43,7 @@ class BaseGUI(ttk.Frame):
 
         self.input_fields = {} # <--- Ensure this is initialized here
         self.calculation_result_label = None
+        self._future_polls = {} # Pending after() id for each future watched by call_when_done
 
         style = ttk.Style()
         try:
@@ -118,7 +123,8 @@ class BaseGUI(ttk.Frame):
                          tooltip_text="",           # Existing optional parameter
                          entry_key=None,            # <--- ADDED: New optional parameter
                          is_currency=False,         # <--- ADDED: New optional parameter
-                         is_percentage=False):      # <--- ADDED: New optional parameter
+                         is_percentage=False,       # <--- ADDED: New optional parameter
+                         entry_style=None):
         """
         Helper method to create a label and an Entry widget for input.
         Stores the Entry's StringVar in self.input_fields.
@@ -133,13 +139,17 @@ class BaseGUI(ttk.Frame):
                                        If None, a key is derived from label_text.
             is_currency (bool): If True, indicates a currency input for potential formatting/symbol.
             is_percentage (bool): If True, indicates a percentage input for potential formatting/symbol.
+            entry_style (str, optional): A shared ttk style name for the Entry. If None, the default TEntry style is used.
         """
         label = ttk.Label(parent_frame, text=label_text)
         label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
 
         # --- IMPORTANT CHANGE: Use tk.StringVar for robust data handling ---
         entry_var = tk.StringVar(value=str(default_value))
-        entry = ttk.Entry(parent_frame, textvariable=entry_var, width=30)
+        if entry_style is None:
+            entry = ttk.Entry(parent_frame, textvariable=entry_var, width=30)
+        else:
+            entry = ttk.Entry(parent_frame, textvariable=entry_var, width=30, style=entry_style)
         entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
         
         # --- Add currency/percentage indicators if needed ---
@@ -208,6 +218,24 @@ class BaseGUI(ttk.Frame):
         self.display_result("Calculation logic not implemented for this module.", is_error=True)
         logger.warning("BaseGUI's calculate method called. This should be overridden.")
 
+    def call_when_done(self, future, callback, *args):
+        """
+        Calls callback(future, *args) on the Tk thread once future has finished.
+        The future is polled with after(), so the worker running it never calls into Tk.
+        Polling stops when this frame is destroyed.
+        """
+        if future.done():
+            self._future_polls.pop(future, None)
+            callback(future, *args)
+        else:
+            self._future_polls[future] = self.after(_FUTURE_POLL_MS, self.call_when_done, future, callback, *args)
+
+    def destroy(self):
+        for after_id in self._future_polls.values():
+            self.after_cancel(after_id)
+        self._future_polls.clear()
+        super().destroy()
+
     def validate_input(self, value: str, validation_type: str, field_name: str = "Input") -> tuple[bool, Union[float, str]]:
         """
         Validates a single input string using a specified validation type.
@@ -233,6 +261,16 @@ class BaseGUI(ttk.Frame):
             logger.error(f"Unknown validation type requested: {validation_type}")
             return False, "Internal error: Invalid validation type."
 
+    def require_input(self, value: str, validation_type: str, field_name: str = "Input") -> Union[float, int]:
+        """
+        Like validate_input, but returns the validated value directly and raises
+        InputError(field_name, message) when validation fails.
+        """
+        is_valid, result = self.validate_input(value, validation_type, field_name)
+        if not is_valid:
+            raise InputError(field_name, result)
+        return result
+
     def validate_input_list(self, input_str: str, expected_type: str, field_name: str) -> tuple[bool, Union[list, str]]:
         """
         Validates a comma-separated string of inputs, delegating to utils.validation.validate_list_input.
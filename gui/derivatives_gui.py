@@ -1,34 +1,51 @@
 # financial_calculator/gui/derivatives_gui.py
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import logging
-from typing import Union, List, Dict, Any
+import functools
+import math
+import csv
+import types
+from typing import Union, List, Dict, Any, Tuple, Optional
 import re # Needed for field key generation consistency
 
 # Import BaseGUI for inheritance
 from .base_gui import BaseGUI
 
-# Import Derivatives mathematical functions as per PROJECT_STRUCTURE.md
-# From options_bsm.py (keeping for reference, but will primarily use generic black_scholes_option_price)
-from mathematical_functions.options_bsm import (
-    black_scholes_call_price, # Specific call
-    black_scholes_put_price   # Specific put
-)
-# From option_greeks.py
-from mathematical_functions.option_greeks import (
-    black_scholes_delta,
-    black_scholes_gamma,
-    black_scholes_vega,
-    black_scholes_theta,
-    black_scholes_rho
-)
-# From derivatives_advanced.py (preferred for generic BSM and other derivatives)
-from mathematical_functions.derivatives_advanced import (
-    binomial_option_price,
-    black_scholes_option_price, # Generic BSM call/put
-    calculate_futures_price
-)
+# The Derivatives mathematical functions (and numpy/scipy behind them) are imported on
+# first calculation via _funcs(), so opening this module does not pay for them.
+@functools.lru_cache(maxsize=1)
+def _funcs() -> types.SimpleNamespace:
+    """Imports the derivatives math functions once and returns them as a namespace."""
+    # From option_greeks.py
+    from mathematical_functions.option_greeks import (
+        black_scholes_delta,
+        black_scholes_gamma,
+        black_scholes_vega,
+        black_scholes_theta,
+        black_scholes_rho
+    )
+    # From derivatives_advanced.py (preferred for generic BSM and other derivatives)
+    from mathematical_functions.derivatives_advanced import (
+        binomial_option_price,
+        black_scholes_option_price, # Generic BSM call/put
+        calculate_futures_price
+    )
+    # From options_chain.py (vectorized BSM for pricing many contracts at once)
+    from mathematical_functions.options_chain import black_scholes_option_price_vec
+
+    return types.SimpleNamespace(
+        black_scholes_delta=black_scholes_delta,
+        black_scholes_gamma=black_scholes_gamma,
+        black_scholes_vega=black_scholes_vega,
+        black_scholes_theta=black_scholes_theta,
+        black_scholes_rho=black_scholes_rho,
+        binomial_option_price=binomial_option_price,
+        black_scholes_option_price=black_scholes_option_price,
+        calculate_futures_price=calculate_futures_price,
+        black_scholes_option_price_vec=black_scholes_option_price_vec,
+    )
 
 # Import constants (for formatting, if needed in the future directly)
 from config import DEFAULT_WINDOW_WIDTH # for example usage
@@ -38,11 +55,70 @@ logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Pricing results are pure functions of the numeric inputs, so repeated clicks and
+# Call/Put round trips on unchanged inputs are served from these caches.
+@functools.lru_cache(maxsize=1024)
+def _cached_bsm(s: float, k: float, t: float, r: float, sigma: float, option_type: str, q: float) -> float:
+    return _funcs().black_scholes_option_price(s, k, t, r, sigma, option_type, q)
+
+@functools.lru_cache(maxsize=1024)
+def _cached_greeks(s: float, k: float, t: float, r: float, sigma: float, option_type: str, q: float) -> Tuple[float, float, float, float, float]:
+    """Returns (delta, gamma, vega, theta, rho)."""
+    f = _funcs()
+    return (
+        f.black_scholes_delta(s, k, t, r, sigma, option_type, q),
+        f.black_scholes_gamma(s, k, t, r, sigma, q),
+        f.black_scholes_vega(s, k, t, r, sigma, q),
+        f.black_scholes_theta(s, k, t, r, sigma, option_type, q),
+        f.black_scholes_rho(s, k, t, r, sigma, option_type, q),
+    )
+
+# Storage keys for the input rows (as derived from their labels by create_input_row).
+# The futures rows repeat some option labels, so they get their own keys to stop the two
+# frames from overwriting each other's entries in self.input_fields.
+_KEY_SPOT = "spot_price_s"
+_KEY_STRIKE = "strike_price_k"
+_KEY_TIME = "time_to_maturity_t_years"
+_KEY_RATE = "risk_free_rate_annual"
+_KEY_VOL = "volatility_annual"
+_KEY_Q = "dividend_yield_q_annual"
+_KEY_STEPS = "number_of_steps_binomial"
+_KEY_FUT_SPOT = "futures_spot_price_s"
+_KEY_FUT_TIME = "futures_time_to_maturity_t_years"
+_KEY_FUT_RATE = "futures_risk_free_rate_annual"
+_KEY_COC = "cost_of_carry_annual"
+
+# Ordered (key, validation_type, display_name) per model group; the order matches the
+# positional arguments unpacked in calculate_selected_model.
+_OPTIONS_FIELDS = (
+    (_KEY_SPOT, 'positive_numeric', "Spot Price S"),
+    (_KEY_STRIKE, 'positive_numeric', "Strike Price K"),
+    (_KEY_TIME, 'positive_numeric', "Time To Maturity T Years"),
+    (_KEY_RATE, 'numeric', "Risk Free Rate Annual"),  # Can be negative
+    (_KEY_VOL, 'positive_numeric', "Volatility Annual"),
+    (_KEY_Q, 'numeric', "Dividend Yield Q Annual"),  # Can be negative
+    (_KEY_STEPS, 'positive_integer', "Number Of Steps Binomial"),
+)
+_FUTURES_FIELDS = (
+    (_KEY_FUT_SPOT, 'positive_numeric', "Spot Price S"),
+    (_KEY_FUT_TIME, 'positive_numeric', "Time To Maturity T Years"),
+    (_KEY_FUT_RATE, 'numeric', "Risk Free Rate Annual"),  # Can be negative
+    (_KEY_COC, 'numeric', "Cost Of Carry Annual"),  # Can be negative
+)
+# Option inputs shared by every contract of a CSV option chain: spot, rate, default volatility, dividend yield
+_CHAIN_SHARED_FIELDS = tuple(field for field in _OPTIONS_FIELDS if field[0] in (_KEY_SPOT, _KEY_RATE, _KEY_VOL, _KEY_Q))
+
+# The option chain is priced with the vectorized Black-Scholes-Merton model, which has no early exercise
+_CHAIN_EUROPEAN_ONLY = "Option chain pricing uses Black-Scholes-Merton and supports European options only."
+
 class DerivativesGUI(BaseGUI):
     """
     GUI module for Derivatives (Options & Futures) calculations.
     Inherits from BaseGUI for common functionalities.
     """
+    # Fields entered as annual percentages and converted to decimals before calculation
+    _PCT_FIELDS = frozenset({_KEY_RATE, _KEY_VOL, _KEY_Q, _KEY_FUT_RATE, _KEY_COC})
+
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
         
@@ -54,14 +130,26 @@ class DerivativesGUI(BaseGUI):
 
         # Variables for model selection
         self.selected_model_var = tk.StringVar(value="Select a Model")
-        self.option_type_var = tk.StringVar(value="CALL")   # Default: Call (remains radio button)
-        self.option_style_var = tk.StringVar(value="EUROPEAN") # Default: European (remains radio button)
+        self.option_type_var = tk.StringVar(value="CALL")   # Default: Call
+        self.option_style_var = tk.StringVar(value="EUROPEAN") # Default: European
 
         # Dictionary to hold frames for each model group's inputs
         self.model_input_frames: Dict[str, ttk.LabelFrame] = {}
         # Dictionary to store the specific input field keys for each model
         self.model_field_keys: Dict[str, List[str]] = {}
 
+        # Group whose input frame is currently gridded (None when no model is shown)
+        self._visible_group: Optional[str] = None
+
+        # Last state applied to each managed widget, so unchanged widgets are not reconfigured
+        self._widget_states: Dict[tk.Widget, str] = {}
+
+        # Group frames are built on first selection; map each group to its builder
+        self._frame_builders = {
+            "Options_Group": (self._create_option_widgets, "Option Pricing Inputs"),
+            "Futures_Group": (self._create_futures_widgets, "Futures Pricing Inputs"),
+        }
+
         self._create_model_selection_widgets(self.scrollable_frame, start_row=1)
         self._create_all_model_input_widgets(start_row=2) # Start below model selection
 
@@ -96,23 +184,23 @@ class DerivativesGUI(BaseGUI):
 
     def _create_all_model_input_widgets(self, start_row: int):
         """
-        Creates all input fields and frames for each derivative model,
-        but keeps them hidden initially.
+        Lays out the area that hosts the model input frames. The frames themselves
+        are created lazily by _get_group_frame the first time a model needs them,
+        so models the user never opens cost no widgets.
         """
-        parent_for_models = self.scrollable_frame
-
-        # Options related inputs (BSM, Binomial, Greeks) - share one frame
-        self.model_input_frames["Options_Group"] = self._create_option_widgets(parent_for_models, "Option Pricing Inputs")
-        self.model_input_frames["Options_Group"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Futures related inputs - separate frame
-        self.model_input_frames["Futures_Group"] = self._create_futures_widgets(parent_for_models, "Futures Pricing Inputs")
-        self.model_input_frames["Futures_Group"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
         # Adjust common buttons and result frame positions relative to this GUI's grid
         self.result_frame.grid(row=start_row + 1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
         self.common_buttons_frame.grid(row=start_row + 2, column=0, columnspan=2, pady=5)
 
+    def _get_group_frame(self, group: str) -> ttk.LabelFrame:
+        """Returns the input frame for a model group, building it on first use."""
+        frame = self.model_input_frames.get(group)
+        if frame is None:
+            builder, title = self._frame_builders[group]
+            frame = builder(self.scrollable_frame, title)
+            self.model_input_frames[group] = frame
+        return frame
+
     def _hide_all_input_frames(self):
         """Hides all model-specific input frames by forgetting their grid positions."""
         for frame in self.model_input_frames.values():
@@ -123,20 +211,30 @@ class DerivativesGUI(BaseGUI):
         """Callback when a model is selected from the combobox."""
         selected_model = self.selected_model_var.get()
         logger.info(f"Selected model for Derivatives: {selected_model}")
-        self._hide_all_input_frames()
 
         # Determine which group frame to show
         if selected_model in ["Black-Scholes Option Price", "Binomial Option Price", "All Option Greeks"]:
-            frame_to_show = self.model_input_frames["Options_Group"]
-            self._update_specific_option_input_states(selected_model)
+            new_group = "Options_Group"
         elif selected_model == "Futures Price":
-            frame_to_show = self.model_input_frames["Futures_Group"]
-            self._update_specific_futures_input_states(selected_model)
+            new_group = "Futures_Group"
         else:
+            self._hide_all_input_frames()
+            self._visible_group = None
             self.display_result("Please select a valid model.", is_error=True)
             return
 
-        frame_to_show.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        # Models within the same group share a frame, so only the field states need refreshing
+        if new_group != self._visible_group:
+            self._hide_all_input_frames()
+            frame_to_show = self._get_group_frame(new_group)
+            frame_to_show.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+            self._visible_group = new_group
+
+        if new_group == "Options_Group":
+            self._update_specific_option_input_states(selected_model)
+        else:
+            self._update_specific_futures_input_states(selected_model)
+
         self.display_result("Ready for calculation.", is_error=False)
 
     def _get_field_key_from_label(self, label_text: str) -> str:
@@ -150,50 +248,70 @@ class DerivativesGUI(BaseGUI):
 
     def _update_specific_option_input_states(self, selected_model: str):
         """
-        Enables/disables individual input fields and option type/style radio buttons
+        Enables/disables individual input fields and the option type/style comboboxes
         within the 'Options_Group' frame based on the selected option model.
         """
-        # All relevant option-specific fields in this group
-        option_fields_to_manage = self.model_field_keys["Options_Group"]
+        set_state = self._set_widget_state
+
+        # BSM and Greeks do not use Number of Steps; every other option field is enabled
+        if selected_model == "Black-Scholes Option Price" or selected_model == "All Option Greeks":
+            disabled_widget = self._steps_widget
+        else:
+            disabled_widget = None
 
-        # First, enable all fields that are part of the 'Options_Group'
-        for key in option_fields_to_manage:
-            if key in self.input_fields:
-                self.input_fields[key].config(state="normal")
+        # Single pass over the group's cached entries, only touching widgets whose state actually changes
+        for widget in self._options_widgets:
+            set_state(widget, "disabled" if widget is disabled_widget else "normal")
         
-        # Enable option type/style radio buttons
-        for rb in self.option_type_radiobuttons + self.option_style_radiobuttons:
-            rb.config(state="normal")
+        # Enable option type/style comboboxes (readonly is their enabled state)
+        for combo in self._option_spec_combos:
+            set_state(combo, "readonly")
 
-        # Now, apply specific disabling logic based on the precise model
+        # Now, apply specific messaging based on the precise model
         if selected_model == "Black-Scholes Option Price" or selected_model == "All Option Greeks":
-            # BSM and Greeks do not use Number of Steps
-            self.input_fields[self._get_field_key_from_label("Number of Steps (Binomial):")].config(state="disabled")
-            if self.option_style_var.get() == "AMERICAN":
-                # Only European style is generally supported for BSM and direct Greeks
-                self.display_result("Black-Scholes-Merton model and its Greeks are for European options only.", is_error=True)
-            else:
-                 self.display_result("Ready for calculation.", is_error=False) # Clear previous warning
+            self._refresh_style_warning()
 
         elif selected_model == "Binomial Option Price":
             # Binomial uses all option inputs including number of steps
             self.display_result("Ready for Binomial Option Pricing.", is_error=False)
 
+    def _set_widget_state(self, widget: tk.Widget, state: str):
+        """
+        Applies a widget state, skipping the Tcl configure call when the widget is
+        already in that state. Widgets are created 'normal', so that is the default.
+        """
+        if self._widget_states.get(widget, "normal") != state:
+            widget.config(state=state)
+            self._widget_states[widget] = state
+
+    def _refresh_style_warning(self, event=None):
+        """
+        Callback for the option type/style comboboxes. Only the European-only
+        warning for BSM and Greeks depends on them, so the frame layout and field
+        states are left untouched.
+        """
+        if self.selected_model_var.get() in ("Black-Scholes Option Price", "All Option Greeks"):
+            if self.option_style_var.get() == "AMERICAN":
+                # Only European style is generally supported for BSM and direct Greeks
+                self.display_result("Black-Scholes-Merton model and its Greeks are for European options only.", is_error=True)
+            else:
+                self.display_result("Ready for calculation.", is_error=False) # Clear previous warning
+
     def _update_specific_futures_input_states(self, selected_model: str):
         """
         Enables/disables individual input fields within the 'Futures_Group' frame.
         """
-        # All relevant futures-specific fields in this group
-        futures_fields_to_manage = self.model_field_keys["Futures Price"]
+        set_state = self._set_widget_state
 
         # First, enable all fields that are part of the 'Futures_Group'
-        for key in futures_fields_to_manage:
-            if key in self.input_fields:
-                self.input_fields[key].config(state="normal")
+        for widget in self._futures_widgets:
+            set_state(widget, "normal")
 
-        # Disable option type/style radio buttons (they are not in this frame, but manage state for completeness)
-        for rb in self.option_type_radiobuttons + self.option_style_radiobuttons:
-            rb.config(state="disabled")
+        # Disable option type/style comboboxes (they are not in this frame, but manage state for completeness)
+        # The option frame may not have been built yet, in which case there is nothing to disable.
+        if "Options_Group" in self.model_input_frames:
+            for combo in self._option_spec_combos:
+                set_state(combo, "disabled")
 
         self.display_result("Ready for Futures Price calculation.", is_error=False)
 
@@ -236,28 +354,30 @@ class DerivativesGUI(BaseGUI):
         field_keys.append(self._get_field_key_from_label("Number of Steps (Binomial):"))
         row_idx += 1
 
-        # Option Type & Style Selection (These remain radio buttons as they are parameters)
+        # Option Type & Style Selection (one readonly combobox per parameter)
         option_spec_subframe = ttk.LabelFrame(frame, text="Option Type & Style")
         option_spec_subframe.grid(row=row_idx, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
         option_spec_subframe.grid_columnconfigure(0, weight=1) # Allow expansion
         option_spec_subframe.grid_columnconfigure(1, weight=1)
-        option_spec_subframe.grid_columnconfigure(2, weight=1)
 
         ttk.Label(option_spec_subframe, text="Type:").grid(row=0, column=0, padx=5, pady=2, sticky="w")
-        self.option_type_radiobuttons = [
-            ttk.Radiobutton(option_spec_subframe, text="Call", variable=self.option_type_var, value="CALL", command=self._on_model_selected),
-            ttk.Radiobutton(option_spec_subframe, text="Put", variable=self.option_type_var, value="PUT", command=self._on_model_selected)
-        ]
-        self.option_type_radiobuttons[0].grid(row=0, column=1, padx=5, pady=2, sticky="w")
-        self.option_type_radiobuttons[1].grid(row=0, column=2, padx=5, pady=2, sticky="w")
+        self.type_combo = ttk.Combobox(option_spec_subframe, textvariable=self.option_type_var, values=("CALL", "PUT"), state="readonly", width=10)
+        self.type_combo.grid(row=0, column=1, padx=5, pady=2, sticky="w")
+        self.type_combo.bind("<<ComboboxSelected>>", self._refresh_style_warning)
 
         ttk.Label(option_spec_subframe, text="Style:").grid(row=1, column=0, padx=5, pady=2, sticky="w")
-        self.option_style_radiobuttons = [
-            ttk.Radiobutton(option_spec_subframe, text="European", variable=self.option_style_var, value="EUROPEAN", command=self._on_model_selected),
-            ttk.Radiobutton(option_spec_subframe, text="American", variable=self.option_style_var, value="AMERICAN", command=self._on_model_selected)
-        ]
-        self.option_style_radiobuttons[0].grid(row=1, column=1, padx=5, pady=2, sticky="w")
-        self.option_style_radiobuttons[1].grid(row=1, column=2, padx=5, pady=2, sticky="w")
+        self.style_combo = ttk.Combobox(option_spec_subframe, textvariable=self.option_style_var, values=("EUROPEAN", "AMERICAN"), state="readonly", width=10)
+        self.style_combo.grid(row=1, column=1, padx=5, pady=2, sticky="w")
+        self.style_combo.bind("<<ComboboxSelected>>", self._refresh_style_warning)
+
+        self._option_spec_combos = (self.type_combo, self.style_combo)
+        # Record the initial state so _set_widget_state doesn't assume 'normal' for these
+        for combo in self._option_spec_combos:
+            self._widget_states[combo] = "readonly"
+
+        # Batch pricing of a whole chain (European, BSM) from a CSV of strikes and maturities
+        self.price_chain_button = ttk.Button(frame, text="Price Option Chain from CSV...", command=self._on_price_chain_clicked)
+        self.price_chain_button.grid(row=row_idx + 1, column=0, columnspan=2, padx=5, pady=5, sticky="w")
 
         # Store these keys under a group name, as these fields are shared by multiple option models
         self.model_field_keys["Options_Group"] = field_keys
@@ -266,6 +386,10 @@ class DerivativesGUI(BaseGUI):
         self.model_field_keys["Binomial Option Price"] = field_keys
         self.model_field_keys["All Option Greeks"] = field_keys
 
+        # Widget references cached for the state updaters, which run on every model switch
+        self._options_widgets = tuple(self.input_fields[key] for key in field_keys)
+        self._steps_widget = self.input_fields[_KEY_STEPS]
+
         return frame
 
     def _create_futures_widgets(self, parent_frame: ttk.Frame, title: str) -> ttk.LabelFrame:
@@ -276,16 +400,16 @@ class DerivativesGUI(BaseGUI):
         field_keys = []
         row_idx = 0
 
-        self.create_input_row(frame, row_idx, "Spot Price (S):", "100.00", "Current market price of the underlying asset for futures.")
-        field_keys.append(self._get_field_key_from_label("Spot Price (S):"))
+        self.create_input_row(frame, row_idx, "Spot Price (S):", "100.00", "Current market price of the underlying asset for futures.", entry_key=_KEY_FUT_SPOT)
+        field_keys.append(_KEY_FUT_SPOT)
         row_idx += 1
 
-        self.create_input_row(frame, row_idx, "Time to Maturity (T, years):", "0.50", "Time until futures expiration, in years.")
-        field_keys.append(self._get_field_key_from_label("Time to Maturity (T, years):"))
+        self.create_input_row(frame, row_idx, "Time to Maturity (T, years):", "0.50", "Time until futures expiration, in years.", entry_key=_KEY_FUT_TIME)
+        field_keys.append(_KEY_FUT_TIME)
         row_idx += 1
 
-        self.create_input_row(frame, row_idx, "Risk-Free Rate (Annual %):", "5.00", "Annual risk-free interest rate as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Risk-Free Rate (Annual %):"))
+        self.create_input_row(frame, row_idx, "Risk-Free Rate (Annual %):", "5.00", "Annual risk-free interest rate as a percentage.", entry_key=_KEY_FUT_RATE)
+        field_keys.append(_KEY_FUT_RATE)
         row_idx += 1
 
         self.create_input_row(frame, row_idx, "Cost of Carry (Annual %):", "0.00", "Cost of holding the underlying asset (e.g., storage, insurance, negative if dividends).")
@@ -293,6 +417,7 @@ class DerivativesGUI(BaseGUI):
         row_idx += 1
 
         self.model_field_keys["Futures Price"] = field_keys # Map directly to its own keys
+        self._futures_widgets = tuple(self.input_fields[key] for key in field_keys)
 
         return frame
 
@@ -311,61 +436,44 @@ class DerivativesGUI(BaseGUI):
             self.display_result("Please select a derivative model to calculate.", is_error=True)
             return
 
-        # Determine which set of field keys to use for validation
-        field_keys_for_model: List[str] = []
+        # Pick the ordered field table for the selected model's group
         if selected_model in ["Black-Scholes Option Price", "Binomial Option Price", "All Option Greeks"]:
-            field_keys_for_model = self.model_field_keys.get("Options_Group", [])
+            field_table = _OPTIONS_FIELDS
         elif selected_model == "Futures Price":
-            field_keys_for_model = self.model_field_keys.get("Futures Price", [])
-        
-        if not field_keys_for_model:
+            field_table = _FUTURES_FIELDS
+        else:
             self.display_result("Internal error: Field keys not found for selected model.", is_error=True)
             logger.error(f"Field keys missing for model: {selected_model}")
             return
 
-        # Prepare a dictionary to hold all validated inputs for the current calculation
-        validated_inputs = {}
+        # Validated values in the table's order, ready for positional unpacking
+        args = []
 
         try:
-            # Extract and validate values for relevant fields
-            for key in field_keys_for_model:
-                value_str = self.get_input_value(key)
-                field_name_for_display = key.replace('_', ' ').title()
-
-                validation_type = 'numeric' # Default
-
-                if key == self._get_field_key_from_label("Spot Price (S):") or \
-                   key == self._get_field_key_from_label("Strike Price (K):") or \
-                   key == self._get_field_key_from_label("Volatility (Annual %):") or \
-                   key == self._get_field_key_from_label("Time to Maturity (T, years):"):
-                    validation_type = 'positive_numeric'
-                elif key == self._get_field_key_from_label("Number of Steps (Binomial):"):
-                    validation_type = 'positive_integer'
-                elif key == self._get_field_key_from_label("Risk-Free Rate (Annual %):") or \
-                     key == self._get_field_key_from_label("Dividend Yield (q, Annual %):") or \
-                     key == self._get_field_key_from_label("Cost of Carry (Annual %):"):
-                    validation_type = 'numeric' # Can be negative
-
-                is_valid, processed_value = self.validate_input(value_str, validation_type, field_name_for_display)
+            # Extract and validate values for relevant fields in a single pass
+            pct_fields = self._PCT_FIELDS
+            for key, validation_type, field_name_for_display in field_table:
+                is_valid, processed_value = self.validate_input(self.get_input_value(key), validation_type, field_name_for_display)
                 
                 if not is_valid:
                     return self.display_result(processed_value, is_error=True)
 
                 # Convert percentages to decimals
-                if "%" in field_name_for_display: # Generic check for percentage fields
+                if key in pct_fields:
                     processed_value /= 100.0
 
-                validated_inputs[key] = processed_value
-            
-            # Retrieve validated values (using .get() with default 0.0 for potentially disabled fields)
-            s = validated_inputs.get(self._get_field_key_from_label("Spot Price (S):"), 0.0)
-            k = validated_inputs.get(self._get_field_key_from_label("Strike Price (K):"), 0.0)
-            t = validated_inputs.get(self._get_field_key_from_label("Time to Maturity (T, years):"), 0.0)
-            r = validated_inputs.get(self._get_field_key_from_label("Risk-Free Rate (Annual %):"), 0.0)
-            sigma = validated_inputs.get(self._get_field_key_from_label("Volatility (Annual %):"), 0.0)
-            q = validated_inputs.get(self._get_field_key_from_label("Dividend Yield (q, Annual %):"), 0.0)
-            n_steps = int(validated_inputs.get(self._get_field_key_from_label("Number of Steps (Binomial):"), 0))
-            cost_of_carry = validated_inputs.get(self._get_field_key_from_label("Cost of Carry (Annual %):"), 0.0)
+                args.append(processed_value)
+
+            if field_table is _OPTIONS_FIELDS:
+                s, k, t, r, sigma, q, n_steps = args
+                cost_of_carry = 0.0
+            else:
+                s, t, r, cost_of_carry = args
+                k = sigma = q = 0.0
+                n_steps = 0
+
+            # Plain Python floats keep the scalar math on the C-backed math.* path downstream
+            s, k, t, r, sigma, q, cost_of_carry = map(float, (s, k, t, r, sigma, q, cost_of_carry))
 
             # Specific validation for volatility
             if selected_model in ["Black-Scholes Option Price", "Binomial Option Price", "All Option Greeks"] and t > 0 and sigma == 0:
@@ -373,16 +481,17 @@ class DerivativesGUI(BaseGUI):
                 return
 
             # --- Perform Calculation ---
+            f = _funcs()
             if selected_model == "Black-Scholes Option Price":
                 if option_style == "AMERICAN":
                     self.display_result("Black-Scholes-Merton model is designed for European options only. For American options, please select Binomial.", is_error=True)
                     return
                 
-                price = black_scholes_option_price(s, k, t, r, sigma, option_type, q)
+                price = _cached_bsm(s, k, t, r, sigma, option_type, q)
                 self.display_result(f"Black-Scholes {option_type} Price: {self.format_currency_output(price)}")
 
             elif selected_model == "Binomial Option Price":
-                price = binomial_option_price(s, k, t, r, sigma, n_steps, option_type, option_style == "AMERICAN", q)
+                price = f.binomial_option_price(s, k, t, r, sigma, n_steps, option_type, option_style == "AMERICAN", q)
                 self.display_result(f"Binomial {option_style} {option_type} Price ({n_steps} steps): {self.format_currency_output(price)}")
 
             elif selected_model == "All Option Greeks":
@@ -390,11 +499,7 @@ class DerivativesGUI(BaseGUI):
                     self.display_result("Option Greeks (Black-Scholes based) are generally for European options only. Consider numerical methods for American option Greeks.", is_error=True)
                     return
 
-                delta_val = black_scholes_delta(s, k, t, r, sigma, option_type, q)
-                gamma_val = black_scholes_gamma(s, k, t, r, sigma, q)
-                vega_val = black_scholes_vega(s, k, t, r, sigma, q)
-                theta_val = black_scholes_theta(s, k, t, r, sigma, option_type, q)
-                rho_val = black_scholes_rho(s, k, t, r, sigma, option_type, q)
+                delta_val, gamma_val, vega_val, theta_val, rho_val = _cached_greeks(s, k, t, r, sigma, option_type, q)
 
                 result_msg = (
                     f"Option Greeks for {option_type} (European):\n"
@@ -407,7 +512,7 @@ class DerivativesGUI(BaseGUI):
                 self.display_result(result_msg)
 
             elif selected_model == "Futures Price":
-                price = calculate_futures_price(s, r, t, cost_of_carry)
+                price = f.calculate_futures_price(s, r, t, cost_of_carry)
                 self.display_result(f"Futures Price: {self.format_currency_output(price)}")
 
         except ValueError as e:
@@ -420,6 +525,83 @@ class DerivativesGUI(BaseGUI):
             logger.critical(f"An unexpected error occurred during Derivatives calculation for {selected_model}: {e}", exc_info=True)
             self.display_result(f"An unexpected error occurred: {e}", is_error=True)
 
+    def _on_price_chain_clicked(self):
+        """Asks for a CSV file and prices every contract in it."""
+        if self.option_style_var.get() != "EUROPEAN":
+            return self.display_result(_CHAIN_EUROPEAN_ONLY, is_error=True)
+        file_path = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Select Option Chain CSV"
+        )
+        if not file_path: # User cancelled the dialog
+            logger.info("Option chain pricing cancelled by user.")
+            return
+        self.calculate_chain_from_csv(file_path)
+
+    def calculate_chain_from_csv(self, path: str):
+        """
+        Prices a chain of European options read from a CSV file with a single vectorized
+        Black-Scholes-Merton call. The CSV needs 'strike' and 'maturity' (years) columns and may
+        have a 'volatility' column (annual %); spot, rate, dividend yield and the default
+        volatility come from the option inputs, and the type from the Call/Put selection.
+        """
+        if self.option_style_var.get() != "EUROPEAN":
+            return self.display_result(_CHAIN_EUROPEAN_ONLY, is_error=True)
+        option_type = self.option_type_var.get()
+
+        # Validate the inputs shared by every contract in the chain
+        shared_inputs = []
+        pct_fields = self._PCT_FIELDS
+        for key, validation_type, field_name_for_display in _CHAIN_SHARED_FIELDS:
+            is_valid, processed_value = self.validate_input(self.get_input_value(key), validation_type, field_name_for_display)
+            if not is_valid:
+                return self.display_result(processed_value, is_error=True)
+            if key in pct_fields:
+                processed_value /= 100.0
+            shared_inputs.append(processed_value)
+        s, r, default_sigma, q = shared_inputs
+
+        strikes, maturities, sigmas = [], [], []
+        try:
+            with open(path, newline='') as csvfile:
+                reader = csv.DictReader(csvfile)
+                if reader.fieldnames is None:
+                    return self.display_result("Option chain CSV is empty.", is_error=True)
+                columns = {name.strip().lower(): name for name in reader.fieldnames}
+                if "strike" not in columns or "maturity" not in columns:
+                    return self.display_result("Option chain CSV must have 'strike' and 'maturity' columns.", is_error=True)
+
+                for line_no, row in enumerate(reader, start=2):
+                    try:
+                        strikes.append(float(row[columns["strike"]]))
+                        maturities.append(float(row[columns["maturity"]]))
+                        vol_str = row[columns["volatility"]].strip() if "volatility" in columns else ""
+                        sigmas.append(float(vol_str) / 100.0 if vol_str else default_sigma)
+                        if not (math.isfinite(strikes[-1]) and math.isfinite(maturities[-1]) and math.isfinite(sigmas[-1])):
+                            raise ValueError("non-finite value") # float() accepts 'nan' and 'inf'
+                    except (TypeError, ValueError):
+                        return self.display_result(f"Invalid number in option chain CSV on line {line_no}.", is_error=True)
+        except OSError as e:
+            logger.error(f"Could not read option chain CSV '{path}': {e}")
+            return self.display_result(f"Could not read option chain CSV: {e}", is_error=True)
+
+        if not strikes:
+            return self.display_result("Option chain CSV contains no contracts.", is_error=True)
+
+        try:
+            prices = _funcs().black_scholes_option_price_vec(s, strikes, maturities, r, sigmas, option_type, q)
+        except ValueError as e:
+            logger.error(f"Option chain pricing error: {e}")
+            return self.display_result(f"Calculation Error: {e}", is_error=True)
+
+        lines = [f"Black-Scholes {option_type} Option Chain ({len(strikes)} contracts):"]
+        for strike, maturity, sigma, price in zip(strikes, maturities, sigmas, prices):
+            lines.append(
+                f"  K={self.format_currency_output(strike)}  T={self.format_number_output(maturity, 4)}y  "
+                f"σ={self.format_percentage_output(sigma, 2)}  Price: {self.format_currency_output(price)}"
+            )
+        self.display_result("\n".join(lines))
+
     def clear_inputs(self):
         """
         Overrides BaseGUI's clear_inputs to also reset the model selection,
@@ -3,7 +3,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Dict, Any, List, Callable, Union
+import functools
+from typing import Dict, Any, List, Callable, Union, Tuple
 import re # Needed for field key generation consistency
 
 # Import BaseGUI for inheritance
@@ -30,11 +31,58 @@ logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Same pattern BaseGUI.create_input_row uses to derive entry keys, compiled once
+_KEY_RE = re.compile(r'[^a-z0-9]+')
+
 class EquityPortfolioGUI(BaseGUI):
     """
     GUI module for Equity Valuation and Portfolio Management calculations.
     Inherits from BaseGUI for common functionalities.
     """
+    # Input rows per model: (label, default, tooltip, validation_type, is_percentage).
+    # The CAPM and FF3 rows are the leading rows of the FF5 entry (see _FACTOR_MODEL_LAYOUT).
+    _MODEL_SCHEMA: Dict[str, Tuple[Tuple[str, str, str, str, bool], ...]] = {
+        "Gordon Growth Model (Stock Price)": (
+            ("Next Year's Dividend (D1):", "1.00", "Expected dividend per share in the next period.", 'non_negative_numeric', False), # Dividend can be 0 or positive
+            ("Required Rate of Return (r, %):", "10.00", "The required rate of return for the equity, as a percentage.", 'numeric', True),
+            ("Constant Growth Rate (g, %):", "5.00", "The constant growth rate of dividends, as a percentage.", 'numeric', True),
+        ),
+        "Fama-French 5-Factor Expected Return": (
+            # CAPM inputs
+            ("Risk-Free Rate (CAPM, %):", "3.00", "The risk-free rate of return, as a percentage.", 'numeric', True),
+            ("Market Return (CAPM, %):", "8.00", "The expected return of the overall market, as a percentage.", 'numeric', True),
+            ("Beta (CAPM):", "1.20", "A measure of the asset's systematic risk relative to the market.", 'numeric', False), # Beta can be positive or negative
+            # FF3 inputs
+            ("SMB Factor Return (FF3, %):", "1.50", "Return of the Small Minus Big (SMB) factor, as a percentage.", 'numeric', True),
+            ("HML Factor Return (FF3, %):", "2.00", "Return of the High Minus Low (HML) factor, as a percentage.", 'numeric', True),
+            ("SMB Beta (FF3):", "0.30", "Sensitivity to the SMB factor.", 'numeric', False),
+            ("HML Beta (FF3):", "0.40", "Sensitivity to the HML factor.", 'numeric', False),
+            # FF5-only inputs
+            ("RMW Factor Return (FF5, %):", "0.80", "Return of the Robust Minus Weak (RMW) factor, as a percentage.", 'numeric', True),
+            ("CMA Factor Return (FF5, %):", "1.20", "Return of the Conservative Minus Aggressive (CMA) factor, as a percentage.", 'numeric', True),
+            ("RMW Beta (FF5):", "0.20", "Sensitivity to the RMW factor.", 'numeric', False),
+            ("CMA Beta (FF5):", "0.15", "Sensitivity to the CMA factor.", 'numeric', False),
+        ),
+        "Sharpe Ratio": (
+            ("Portfolio Return (Sharpe, %):", "12.00", "The total return of the portfolio, as a percentage.", 'numeric', True),
+            ("Portfolio Std Dev (Sharpe, %):", "15.00", "The standard deviation of the portfolio's returns, as a percentage.", 'positive_numeric', True), # Std dev must be positive
+            ("Risk-Free Rate (Sharpe, %):", "3.00", "The risk-free rate of return for Sharpe Ratio, as a percentage.", 'numeric', True),
+        ),
+    }
+
+    # Extra per-field checks applied during validation, after percentage conversion:
+    # label -> (predicate on the converted value, error message when it fails)
+    _POST_CHECKS: Dict[str, Tuple[Callable[[float], bool], str]] = {
+        "Portfolio Std Dev (Sharpe, %):": (lambda v: v > 0, "Portfolio Standard Deviation must be positive for Sharpe Ratio calculation."),
+    }
+
+    # Models sharing the factor input frame: (number of leading factor rows used, frame title)
+    _FACTOR_MODEL_LAYOUT = {
+        "CAPM Expected Return": (3, "CAPM Expected Return Inputs"),
+        "Fama-French 3-Factor Expected Return": (7, "Fama-French 3-Factor Inputs"),
+        "Fama-French 5-Factor Expected Return": (11, "Fama-French 5-Factor Inputs"),
+    }
+
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
 
@@ -44,6 +92,11 @@ class EquityPortfolioGUI(BaseGUI):
         self.scrollable_frame.grid_columnconfigure(0, weight=1) # Center the title
         self.scrollable_frame.grid_columnconfigure(1, weight=1) # Span across 2 columns
 
+        # Inherited helpers used on every calculation, bound once instead of resolved per click
+        self._fmt_cur = self.format_currency_output
+        self._fmt_pct = self.format_percentage_output
+        self._fmt_num = self.format_number_output
+
         # Variables for model selection (replaces solve_for_var radiobuttons)
         self.selected_model_var = tk.StringVar(value="Select a Model")
 
@@ -51,6 +104,28 @@ class EquityPortfolioGUI(BaseGUI):
         self.model_input_frames: Dict[str, ttk.LabelFrame] = {}
         # Dictionary to store the specific input field keys for each model
         self.model_field_keys: Dict[str, List[str]] = {}
+        # (model, field_key) -> (validation_type, is_percentage, post_check or None), filled in as each row is created
+        self._field_spec: Dict[Tuple[str, str], Tuple[str, bool, Any]] = {}
+
+        # Model frames are built on first selection; map each model to its builder
+        self._frame_builders: Dict[str, Callable[[ttk.Frame], ttk.LabelFrame]] = {
+            "Gordon Growth Model (Stock Price)": self._create_gordon_growth_widgets,
+            "CAPM Expected Return": self._create_factor_model_widgets,
+            "Fama-French 3-Factor Expected Return": self._create_factor_model_widgets,
+            "Fama-French 5-Factor Expected Return": self._create_factor_model_widgets,
+            "Sharpe Ratio": self._create_sharpe_ratio_widgets,
+        }
+        # Model name -> calculator taking the validated values and returning (prefix, formatted result)
+        self._calculators: Dict[str, Callable[[List[float]], Tuple[str, str]]] = {
+            "Gordon Growth Model (Stock Price)": self._calc_gordon_growth,
+            "CAPM Expected Return": self._calc_capm,
+            "Fama-French 3-Factor Expected Return": self._calc_ff3,
+            "Fama-French 5-Factor Expected Return": self._calc_ff5,
+            "Sharpe Ratio": self._calc_sharpe,
+        }
+        # The model frame currently shown and the model it is shown for (None when no model is shown)
+        self._visible_frame: Union[ttk.LabelFrame, None] = None
+        self._visible_model: Union[str, None] = None
 
         self._create_model_selection_widgets(self.scrollable_frame, start_row=1)
         self._create_all_model_input_widgets(start_row=2) # Start below model selection
@@ -87,227 +162,141 @@ class EquityPortfolioGUI(BaseGUI):
 
     def _create_all_model_input_widgets(self, start_row: int):
         """
-        Creates all input fields and frames for each model supported by this GUI,
-        but keeps them hidden initially.
+        Lays out the area that hosts the model input frames. The frames themselves
+        are created lazily by _show_model_frame the first time a model is selected.
         """
-        parent_for_models = self.scrollable_frame
-
-        # Gordon Growth Model Inputs
-        self.model_input_frames["Gordon Growth Model (Stock Price)"] = self._create_gordon_growth_widgets(parent_for_models)
-        self.model_input_frames["Gordon Growth Model (Stock Price)"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # CAPM Expected Return Inputs
-        self.model_input_frames["CAPM Expected Return"] = self._create_capm_widgets(parent_for_models)
-        self.model_input_frames["CAPM Expected Return"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Fama-French 3-Factor Expected Return Inputs
-        self.model_input_frames["Fama-French 3-Factor Expected Return"] = self._create_ff3_widgets(parent_for_models)
-        self.model_input_frames["Fama-French 3-Factor Expected Return"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Fama-French 5-Factor Expected Return Inputs
-        self.model_input_frames["Fama-French 5-Factor Expected Return"] = self._create_ff5_widgets(parent_for_models)
-        self.model_input_frames["Fama-French 5-Factor Expected Return"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Sharpe Ratio Inputs
-        self.model_input_frames["Sharpe Ratio"] = self._create_sharpe_ratio_widgets(parent_for_models)
-        self.model_input_frames["Sharpe Ratio"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
         # Adjust common buttons and result frame positions relative to this GUI's grid
         self.result_frame.grid(row=start_row + 1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
         self.common_buttons_frame.grid(row=start_row + 2, column=0, columnspan=2, pady=5)
 
+    def _show_model_frame(self, model: str) -> ttk.LabelFrame:
+        """
+        Shows the input frame for a model, building and gridding it on first use.
+        Later shows call grid() with no arguments, reusing the options kept by grid_remove.
+        A frame that is already shown (the shared factor frame) is only re-laid out.
+        """
+        frame = self.model_input_frames.get(model)
+        if frame is None:
+            frame = self._frame_builders[model](self.scrollable_frame)
+            self.model_input_frames[model] = frame
+            frame.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        elif frame is not self._visible_frame:
+            frame.grid()
+        if model in self._FACTOR_MODEL_LAYOUT:
+            self._show_factor_rows(model)
+        self._visible_frame = frame
+        return frame
 
     def _hide_all_input_frames(self):
-        """Hides all model-specific input frames."""
-        for frame in self.model_input_frames.values():
-            frame.grid_forget()
+        """Hides the model-specific input frame currently shown, keeping its grid options."""
+        if self._visible_frame is not None:
+            self._visible_frame.grid_remove()
+            self._visible_frame = None
         self.display_result("Select a model to view its inputs and calculate.", is_error=False)
 
     def _on_model_selected(self, event=None):
         """Callback when a model is selected from the combobox."""
         selected_model = self.selected_model_var.get()
+        # The combobox can fire again for the model already shown; there is nothing to update
+        if selected_model == self._visible_model:
+            return
         logger.info(f"Selected model for Equity/Portfolio: {selected_model}")
-        self._hide_all_input_frames()
-        if selected_model in self.model_input_frames:
-            self.model_input_frames[selected_model].grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        if selected_model in self._frame_builders:
+            frame = self.model_input_frames.get(selected_model)
+            if frame is None or frame is not self._visible_frame:
+                self._hide_all_input_frames()
+            self._show_model_frame(selected_model)
+            self._visible_model = selected_model
         else:
+            self._hide_all_input_frames()
+            self._visible_model = None
             self.display_result("Please select a valid model.", is_error=True)
 
-    def _get_field_key_from_label(self, label_text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_field_key_from_label(label_text: str) -> str:
         """
         Replicates the field key generation logic from BaseGUI's create_input_row.
+        The label set is small and fixed, so results are memoized across calls.
         """
-        field_key = label_text.lower()
-        field_key = re.sub(r'[^a-z0-9]+', ' ', field_key).strip()
-        field_key = field_key.replace(' ', '_')
-        return field_key
+        return _KEY_RE.sub(' ', label_text.lower()).strip().replace(' ', '_')
 
     # --- Widget creation methods for each model ---
 
-    def _create_gordon_growth_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
-        """Creates widgets for the Gordon Growth Model."""
-        frame = ttk.LabelFrame(parent_frame, text="Gordon Growth Model Inputs")
-        frame.grid_columnconfigure(1, weight=1)
+    def _add_row(self, frame: ttk.LabelFrame, row: int, label: str, default: str, tooltip: str) -> str:
+        """
+        Creates one input row and returns its field key. The key is derived here (memoized)
+        and passed to create_input_row as entry_key, so the label is never regexed twice.
+        """
+        key = self._get_field_key_from_label(label)
+        self.create_input_row(frame, row, label, default, tooltip, entry_key=key)
+        return key
 
+    def _add_schema_rows(self, frame: ttk.LabelFrame, model_name: str) -> List[str]:
+        """
+        Creates the input rows listed in _MODEL_SCHEMA for a model, registering each
+        row's field key and validation spec in lockstep. Returns the field keys in order.
+        """
         field_keys = []
-        row_idx = 0
-
-        self.create_input_row(frame, row_idx, "Next Year's Dividend (D1):", "1.00", "Expected dividend per share in the next period.")
-        field_keys.append(self._get_field_key_from_label("Next Year's Dividend (D1):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Required Rate of Return (r, %):", "10.00", "The required rate of return for the equity, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Required Rate of Return (r, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Constant Growth Rate (g, %):", "5.00", "The constant growth rate of dividends, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Constant Growth Rate (g, %):"))
-        row_idx += 1
+        for row_idx, (label, default, tooltip, validation_type, is_percentage) in enumerate(self._MODEL_SCHEMA[model_name]):
+            key = self._add_row(frame, row_idx, label, default, tooltip)
+            field_keys.append(key)
+            self._field_spec[(model_name, key)] = (validation_type, is_percentage, self._POST_CHECKS.get(label))
+        self.model_field_keys[model_name] = field_keys
+        return field_keys
 
-        self.model_field_keys["Gordon Growth Model (Stock Price)"] = field_keys
-        return frame
-
-    def _create_capm_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
-        """Creates widgets for the CAPM Expected Return."""
-        frame = ttk.LabelFrame(parent_frame, text="CAPM Expected Return Inputs")
+    def _create_gordon_growth_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
+        """Creates widgets for the Gordon Growth Model."""
+        frame = ttk.LabelFrame(parent_frame, text="Gordon Growth Model Inputs")
         frame.grid_columnconfigure(1, weight=1)
-
-        field_keys = []
-        row_idx = 0
-
-        self.create_input_row(frame, row_idx, "Risk-Free Rate (CAPM, %):", "3.00", "The risk-free rate of return, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Risk-Free Rate (CAPM, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Market Return (CAPM, %):", "8.00", "The expected return of the overall market, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Market Return (CAPM, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Beta (CAPM):", "1.20", "A measure of the asset's systematic risk relative to the market.")
-        field_keys.append(self._get_field_key_from_label("Beta (CAPM):"))
-        row_idx += 1
-
-        self.model_field_keys["CAPM Expected Return"] = field_keys
+        self._add_schema_rows(frame, "Gordon Growth Model (Stock Price)")
         return frame
 
-    def _create_ff3_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
-        """Creates widgets for the Fama-French 3-Factor Expected Return."""
-        frame = ttk.LabelFrame(parent_frame, text="Fama-French 3-Factor Inputs")
-        frame.grid_columnconfigure(1, weight=1)
-
-        field_keys = []
-        row_idx = 0
-
-        # Inherits from CAPM, so need those fields too, plus FF3 specific ones
-        # Using specific keys to ensure they are looked up correctly by _get_field_key_from_label
-        self.create_input_row(frame, row_idx, "Risk-Free Rate (CAPM, %):", "3.00", "The risk-free rate of return, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Risk-Free Rate (CAPM, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Market Return (CAPM, %):", "8.00", "The expected return of the overall market, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Market Return (CAPM, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Beta (CAPM):", "1.20", "A measure of the asset's systematic risk relative to the market.")
-        field_keys.append(self._get_field_key_from_label("Beta (CAPM):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "SMB Factor Return (FF3, %):", "1.50", "Return of the Small Minus Big (SMB) factor, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("SMB Factor Return (FF3, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "HML Factor Return (FF3, %):", "2.00", "Return of the High Minus Low (HML) factor, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("HML Factor Return (FF3, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "SMB Beta (FF3):", "0.30", "Sensitivity to the SMB factor.")
-        field_keys.append(self._get_field_key_from_label("SMB Beta (FF3):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "HML Beta (FF3):", "0.40", "Sensitivity to the HML factor.")
-        field_keys.append(self._get_field_key_from_label("HML Beta (FF3):"))
-        row_idx += 1
-
-        self.model_field_keys["Fama-French 3-Factor Expected Return"] = field_keys
-        return frame
-
-    def _create_ff5_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
-        """Creates widgets for the Fama-French 5-Factor Expected Return."""
+    def _create_factor_model_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
+        """
+        Creates one shared frame for the CAPM, Fama-French 3-Factor and 5-Factor models.
+        Each model's inputs are a leading subset of the 5-factor rows, so every entry is
+        created once and _show_factor_rows grids only the rows the selected model uses.
+        """
         frame = ttk.LabelFrame(parent_frame, text="Fama-French 5-Factor Inputs")
         frame.grid_columnconfigure(1, weight=1)
 
-        field_keys = []
-        row_idx = 0
-
-        # Inherits from FF3, so need those fields too, plus FF5 specific ones
-        self.create_input_row(frame, row_idx, "Risk-Free Rate (CAPM, %):", "3.00", "The risk-free rate of return, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Risk-Free Rate (CAPM, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Market Return (CAPM, %):", "8.00", "The expected return of the overall market, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Market Return (CAPM, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Beta (CAPM):", "1.20", "A measure of the asset's systematic risk relative to the market.")
-        field_keys.append(self._get_field_key_from_label("Beta (CAPM):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "SMB Factor Return (FF3, %):", "1.50", "Return of the Small Minus Big (SMB) factor, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("SMB Factor Return (FF3, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "HML Factor Return (FF3, %):", "2.00", "Return of the High Minus Low (HML) factor, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("HML Factor Return (FF3, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "SMB Beta (FF3):", "0.30", "Sensitivity to the SMB factor.")
-        field_keys.append(self._get_field_key_from_label("SMB Beta (FF3):"))
-        row_idx += 1
+        ff5_model = "Fama-French 5-Factor Expected Return"
+        field_keys = self._add_schema_rows(frame, ff5_model)
 
-        self.create_input_row(frame, row_idx, "HML Beta (FF3):", "0.40", "Sensitivity to the HML factor.")
-        field_keys.append(self._get_field_key_from_label("HML Beta (FF3):"))
-        row_idx += 1
+        # Label and entry widgets of each row, in field order, for showing/hiding per model
+        self._factor_rows = [tuple(frame.grid_slaves(row=row)) for row in range(len(field_keys))]
+        self._factor_rows_shown = len(field_keys)
 
-        self.create_input_row(frame, row_idx, "RMW Factor Return (FF5, %):", "0.80", "Return of the Robust Minus Weak (RMW) factor, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("RMW Factor Return (FF5, %):"))
-        row_idx += 1
+        # Register the shared frame, keys and specs under every model that uses it
+        for model_name, (field_count, _title) in self._FACTOR_MODEL_LAYOUT.items():
+            self.model_input_frames[model_name] = frame
+            self.model_field_keys[model_name] = field_keys[:field_count]
+            for key in field_keys[:field_count]:
+                self._field_spec[(model_name, key)] = self._field_spec[(ff5_model, key)]
 
-        self.create_input_row(frame, row_idx, "CMA Factor Return (FF5, %):", "1.20", "Return of the Conservative Minus Aggressive (CMA) factor, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("CMA Factor Return (FF5, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "RMW Beta (FF5):", "0.20", "Sensitivity to the RMW factor.")
-        field_keys.append(self._get_field_key_from_label("RMW Beta (FF5):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "CMA Beta (FF5):", "0.15", "Sensitivity to the CMA factor.")
-        field_keys.append(self._get_field_key_from_label("CMA Beta (FF5):"))
-        row_idx += 1
-
-        self.model_field_keys["Fama-French 5-Factor Expected Return"] = field_keys
         return frame
 
+    def _show_factor_rows(self, model: str):
+        """Shows only the leading rows of the shared factor frame that the model uses."""
+        field_count, title = self._FACTOR_MODEL_LAYOUT[model]
+        frame = self.model_input_frames[model]
+        frame.config(text=title)
+        if field_count == self._factor_rows_shown:
+            return
+        for row, widgets in enumerate(self._factor_rows):
+            for widget in widgets:
+                if row < field_count:
+                    widget.grid()
+                else:
+                    widget.grid_remove()
+        self._factor_rows_shown = field_count
+
     def _create_sharpe_ratio_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
         """Creates widgets for the Sharpe Ratio calculation."""
         frame = ttk.LabelFrame(parent_frame, text="Sharpe Ratio Inputs")
         frame.grid_columnconfigure(1, weight=1)
-
-        field_keys = []
-        row_idx = 0
-
-        self.create_input_row(frame, row_idx, "Portfolio Return (Sharpe, %):", "12.00", "The total return of the portfolio, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Portfolio Return (Sharpe, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Portfolio Std Dev (Sharpe, %):", "15.00", "The standard deviation of the portfolio's returns, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Portfolio Std Dev (Sharpe, %):"))
-        row_idx += 1
-
-        self.create_input_row(frame, row_idx, "Risk-Free Rate (Sharpe, %):", "3.00", "The risk-free rate of return for Sharpe Ratio, as a percentage.")
-        field_keys.append(self._get_field_key_from_label("Risk-Free Rate (Sharpe, %):"))
-        row_idx += 1
-
-        self.model_field_keys["Sharpe Ratio"] = field_keys
+        self._add_schema_rows(frame, "Sharpe Ratio")
         return frame
 
     # --- Calculation Logic ---
@@ -330,74 +319,18 @@ class EquityPortfolioGUI(BaseGUI):
             logger.error(f"Field keys missing for model: {selected_model}")
             return
 
-        validated_inputs = {}
+        validated_list = [] # In field_keys_for_model order
         all_valid = True
+        field_spec = self._field_spec
+        get_input_value = self.get_input_value
+        validate_input = self.validate_input
 
         for key in field_keys_for_model:
-            value_str = self.get_input_value(key)
+            value_str = get_input_value(key)
             field_name_for_display = key.replace('_', ' ').title()
+            validation_type, is_percentage_field, post_check = field_spec[(selected_model, key)]
 
-            # Initialize for each key iteration
-            is_percentage_field = False
-            validation_type = 'numeric' # Default
-
-            # Determine specific validation type and if it's a percentage
-            if selected_model == "Gordon Growth Model (Stock Price)":
-                if key in [self._get_field_key_from_label("Next Year's Dividend (D1):")]:
-                    validation_type = 'non_negative_numeric' # Dividend can be 0 or positive
-                elif key in [self._get_field_key_from_label("Required Rate of Return (r, %):"),
-                             self._get_field_key_from_label("Constant Growth Rate (g, %):")]:
-                    validation_type = 'numeric' # Can be negative, but validate as percent
-                    is_percentage_field = True
-
-            elif selected_model == "CAPM Expected Return":
-                if key in [self._get_field_key_from_label("Risk-Free Rate (CAPM, %):"),
-                           self._get_field_key_from_label("Market Return (CAPM, %):")]:
-                    validation_type = 'numeric'
-                    is_percentage_field = True
-                elif key == self._get_field_key_from_label("Beta (CAPM):"):
-                    validation_type = 'numeric' # Beta can be positive or negative
-
-            elif selected_model == "Fama-French 3-Factor Expected Return":
-                # CAPM related inputs
-                if key in [self._get_field_key_from_label("Risk-Free Rate (CAPM, %):"),
-                           self._get_field_key_from_label("Market Return (CAPM, %):"),
-                           self._get_field_key_from_label("SMB Factor Return (FF3, %):"),
-                           self._get_field_key_from_label("HML Factor Return (FF3, %):")]:
-                    validation_type = 'numeric'
-                    is_percentage_field = True
-                elif key in [self._get_field_key_from_label("Beta (CAPM):"),
-                             self._get_field_key_from_label("SMB Beta (FF3):"),
-                             self._get_field_key_from_label("HML Beta (FF3):")]:
-                    validation_type = 'numeric'
-
-            elif selected_model == "Fama-French 5-Factor Expected Return":
-                # FF3 related inputs
-                if key in [self._get_field_key_from_label("Risk-Free Rate (CAPM, %):"),
-                           self._get_field_key_from_label("Market Return (CAPM, %):"),
-                           self._get_field_key_from_label("SMB Factor Return (FF3, %):"),
-                           self._get_field_key_from_label("HML Factor Return (FF3, %):"),
-                           self._get_field_key_from_label("RMW Factor Return (FF5, %):"),
-                           self._get_field_key_from_label("CMA Factor Return (FF5, %):")]:
-                    validation_type = 'numeric'
-                    is_percentage_field = True
-                elif key in [self._get_field_key_from_label("Beta (CAPM):"),
-                             self._get_field_key_from_label("SMB Beta (FF3):"),
-                             self._get_field_key_from_label("HML Beta (FF3):"),
-                             self._get_field_key_from_label("RMW Beta (FF5):"),
-                             self._get_field_key_from_label("CMA Beta (FF5):")]:
-                    validation_type = 'numeric'
-
-            elif selected_model == "Sharpe Ratio":
-                if key in [self._get_field_key_from_label("Portfolio Return (Sharpe, %):"),
-                           self._get_field_key_from_label("Risk-Free Rate (Sharpe, %):")]:
-                    validation_type = 'numeric'
-                    is_percentage_field = True
-                elif key == self._get_field_key_from_label("Portfolio Std Dev (Sharpe, %):"):
-                    validation_type = 'positive_numeric' # Std dev must be positive
-                    is_percentage_field = True
-
-            is_valid, processed_value = self.validate_input(value_str, validation_type, field_name_for_display)
+            is_valid, processed_value = validate_input(value_str, validation_type, field_name_for_display)
 
             if not is_valid:
                 self.display_result(processed_value, is_error=True)
@@ -407,83 +340,19 @@ class EquityPortfolioGUI(BaseGUI):
             if is_percentage_field:
                 processed_value /= 100.0
 
-            validated_inputs[key] = processed_value
+            if post_check is not None and not post_check[0](processed_value):
+                self.display_result(post_check[1], is_error=True)
+                all_valid = False
+                break
+
+            validated_list.append(processed_value)
 
         if not all_valid:
             return
 
         try:
-            if selected_model == "Gordon Growth Model (Stock Price)":
-                d1 = validated_inputs[self._get_field_key_from_label("Next Year's Dividend (D1):")]
-                r_gg = validated_inputs[self._get_field_key_from_label("Required Rate of Return (r, %):")]
-                g_gg = validated_inputs[self._get_field_key_from_label("Constant Growth Rate (g, %):")]
-
-                if r_gg <= g_gg:
-                    self.display_result("Required Rate of Return (r) must be greater than Growth Rate (g) for Gordon Growth Model.", is_error=True)
-                    return
-                
-                result = gordon_growth_model(d1, r_gg, g_gg)
-                self.display_result(f"Stock Price (Gordon Growth): {self.format_currency_output(result)}")
-
-            elif selected_model == "CAPM Expected Return":
-                rf_capm = validated_inputs[self._get_field_key_from_label("Risk-Free Rate (CAPM, %):")]
-                rm_capm = validated_inputs[self._get_field_key_from_label("Market Return (CAPM, %):")]
-                beta_capm = validated_inputs[self._get_field_key_from_label("Beta (CAPM):")]
-                
-                market_risk_premium = rm_capm - rf_capm
-                
-                result_decimal = calculate_capm_return(rf_capm, market_risk_premium, beta_capm)
-                self.display_result(f"CAPM Expected Return: {self.format_percentage_output(result_decimal)}")
-
-            elif selected_model == "Fama-French 3-Factor Expected Return":
-                rf_capm = validated_inputs[self._get_field_key_from_label("Risk-Free Rate (CAPM, %):")]
-                rm_capm = validated_inputs[self._get_field_key_from_label("Market Return (CAPM, %):")]
-                beta_capm = validated_inputs[self._get_field_key_from_label("Beta (CAPM):")]
-                smb_ret = validated_inputs[self._get_field_key_from_label("SMB Factor Return (FF3, %):")]
-                hml_ret = validated_inputs[self._get_field_key_from_label("HML Factor Return (FF3, %):")]
-                smb_beta = validated_inputs[self._get_field_key_from_label("SMB Beta (FF3):")]
-                hml_beta = validated_inputs[self._get_field_key_from_label("HML Beta (FF3):")]
-                
-                market_excess_return = rm_capm - rf_capm
-
-                result_decimal = fama_french_3_factor_expected_return(
-                    rf_capm, beta_capm, smb_beta, hml_beta,
-                    market_excess_return, smb_ret, hml_ret
-                )
-                self.display_result(f"Fama-French 3-Factor Expected Return: {self.format_percentage_output(result_decimal)}")
-
-            elif selected_model == "Fama-French 5-Factor Expected Return":
-                rf_capm = validated_inputs[self._get_field_key_from_label("Risk-Free Rate (CAPM, %):")]
-                rm_capm = validated_inputs[self._get_field_key_from_label("Market Return (CAPM, %):")]
-                beta_capm = validated_inputs[self._get_field_key_from_label("Beta (CAPM):")]
-                smb_ret = validated_inputs[self._get_field_key_from_label("SMB Factor Return (FF3, %):")]
-                hml_ret = validated_inputs[self._get_field_key_from_label("HML Factor Return (FF3, %):")]
-                rmw_ret = validated_inputs[self._get_field_key_from_label("RMW Factor Return (FF5, %):")]
-                cma_ret = validated_inputs[self._get_field_key_from_label("CMA Factor Return (FF5, %):")]
-                smb_beta = validated_inputs[self._get_field_key_from_label("SMB Beta (FF3):")]
-                hml_beta = validated_inputs[self._get_field_key_from_label("HML Beta (FF3):")]
-                rmw_beta = validated_inputs[self._get_field_key_from_label("RMW Beta (FF5):")]
-                cma_beta = validated_inputs[self._get_field_key_from_label("CMA Beta (FF5):")]
-                
-                market_excess_return = rm_capm - rf_capm
-
-                result_decimal = fama_french_5_factor_expected_return(
-                    rf_capm, beta_capm, smb_beta, hml_beta, rmw_beta, cma_beta,
-                    market_excess_return, smb_ret, hml_ret, rmw_ret, cma_ret
-                )
-                self.display_result(f"Fama-French 5-Factor Expected Return: {self.format_percentage_output(result_decimal)}")
-
-            elif selected_model == "Sharpe Ratio":
-                port_ret_sharpe = validated_inputs[self._get_field_key_from_label("Portfolio Return (Sharpe, %):")]
-                port_std_dev_sharpe = validated_inputs[self._get_field_key_from_label("Portfolio Std Dev (Sharpe, %):")]
-                rf_sharpe = validated_inputs[self._get_field_key_from_label("Risk-Free Rate (Sharpe, %):")]
-                
-                if port_std_dev_sharpe <= 0: # Ensure positive standard deviation
-                    self.display_result("Portfolio Standard Deviation must be positive for Sharpe Ratio calculation.", is_error=True)
-                    return
-
-                result = calculate_sharpe_ratio(port_ret_sharpe, rf_sharpe, port_std_dev_sharpe)
-                self.display_result(f"Sharpe Ratio: {self.format_number_output(result, 4)}")
+            prefix, text = self._calculators[selected_model](validated_list)
+            self.display_result(f"{prefix}: {text}")
 
         except ValueError as e:
             logger.error(f"Equity/Portfolio Calculation Error (ValueError) for {selected_model}: {e}")
@@ -495,6 +364,45 @@ class EquityPortfolioGUI(BaseGUI):
             logger.critical(f"An unexpected error occurred during Equity/Portfolio calculation for {selected_model}: {e}", exc_info=True)
             self.display_result(f"An unexpected error occurred: {e}", is_error=True)
 
+    # --- Per-model calculators (values arrive in field_keys_for_model order) ---
+
+    def _calc_gordon_growth(self, values: List[float]) -> Tuple[str, str]:
+        d1, r_gg, g_gg = values
+        if r_gg <= g_gg:
+            raise ValueError("Required Rate of Return (r) must be greater than Growth Rate (g) for Gordon Growth Model.")
+        result = gordon_growth_model(d1, r_gg, g_gg)
+        return "Stock Price (Gordon Growth)", self._fmt_cur(result)
+
+    def _calc_capm(self, values: List[float]) -> Tuple[str, str]:
+        rf_capm, rm_capm, beta_capm = values
+        market_risk_premium = rm_capm - rf_capm
+        result_decimal = calculate_capm_return(rf_capm, market_risk_premium, beta_capm)
+        return "CAPM Expected Return", self._fmt_pct(result_decimal)
+
+    def _calc_ff3(self, values: List[float]) -> Tuple[str, str]:
+        rf_capm, rm_capm, beta_capm, smb_ret, hml_ret, smb_beta, hml_beta = values
+        market_excess_return = rm_capm - rf_capm
+        result_decimal = fama_french_3_factor_expected_return(
+            rf_capm, beta_capm, smb_beta, hml_beta,
+            market_excess_return, smb_ret, hml_ret
+        )
+        return "Fama-French 3-Factor Expected Return", self._fmt_pct(result_decimal)
+
+    def _calc_ff5(self, values: List[float]) -> Tuple[str, str]:
+        (rf_capm, rm_capm, beta_capm, smb_ret, hml_ret, smb_beta, hml_beta,
+         rmw_ret, cma_ret, rmw_beta, cma_beta) = values
+        market_excess_return = rm_capm - rf_capm
+        result_decimal = fama_french_5_factor_expected_return(
+            rf_capm, beta_capm, smb_beta, hml_beta, rmw_beta, cma_beta,
+            market_excess_return, smb_ret, hml_ret, rmw_ret, cma_ret
+        )
+        return "Fama-French 5-Factor Expected Return", self._fmt_pct(result_decimal)
+
+    def _calc_sharpe(self, values: List[float]) -> Tuple[str, str]:
+        port_ret_sharpe, port_std_dev_sharpe, rf_sharpe = values
+        result = calculate_sharpe_ratio(port_ret_sharpe, rf_sharpe, port_std_dev_sharpe)
+        return "Sharpe Ratio", self._fmt_num(result, 4)
+
     def clear_inputs(self):
         """
         Overrides BaseGUI's clear_inputs to also reset the model selection
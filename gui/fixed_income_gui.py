@@ -3,53 +3,190 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import functools
+import concurrent.futures
+import types
+from enum import IntEnum
 from typing import Union
 
 # Import BaseGUI for inheritance
 from .base_gui import BaseGUI
+from utils.validation import InputError
 
-# Import Fixed Income mathematical functions as per PROJECT_STRUCTURE.md
-# From bonds.py
-from mathematical_functions.bonds import (
-    calculate_bond_price,
-    calculate_zero_coupon_bond_price,
-    calculate_zero_coupon_bond_yield
-)
-# From bond_risk.py (Note: _calculate_macaulay_duration_helper is for internal use within math functions)
-from mathematical_functions.bond_risk import (
-    calculate_modified_duration,
-    calculate_convexity as calculate_bond_risk_convexity # Alias to avoid name conflict if both are imported
-)
-# From fixed_income_advanced.py (These versions are preferred for GUI as they are higher-level)
-from mathematical_functions.fixed_income_advanced import (
-    calculate_macaulay_duration, # This is the main one for GUI use
-    calculate_convexity,         # This is the main one for GUI use
-    calculate_forward_rate,      # Yield curve specific
-    calculate_yield_curve_spot_rate,
-    bootstrap_yield_curve,       # Complex input
-    calculate_par_rate           # Complex input
-)
+# The Fixed Income mathematical functions (and numpy/numpy_financial behind them) are
+# imported on first calculation via _funcs(), so opening this module does not pay for them.
+@functools.lru_cache(maxsize=1)
+def _funcs() -> types.SimpleNamespace:
+    """Imports the fixed income math functions once and returns them as a namespace."""
+    # From bonds.py
+    from mathematical_functions.bonds import (
+        calculate_bond_price,
+        calculate_zero_coupon_bond_price,
+        calculate_zero_coupon_bond_yield
+    )
+    # From fixed_income_advanced.py (These versions are preferred for GUI as they are higher-level)
+    from mathematical_functions.fixed_income_advanced import (
+        calculate_forward_rate,      # Yield curve specific
+        calculate_yield_curve_spot_rate,
+        calculate_bond_analytics     # Price, durations and convexity in one pass
+    )
+
+    return types.SimpleNamespace(
+        calculate_bond_price=calculate_bond_price,
+        calculate_zero_coupon_bond_price=calculate_zero_coupon_bond_price,
+        calculate_zero_coupon_bond_yield=calculate_zero_coupon_bond_yield,
+        calculate_forward_rate=calculate_forward_rate,
+        calculate_yield_curve_spot_rate=calculate_yield_curve_spot_rate,
+        calculate_bond_analytics=calculate_bond_analytics,
+    )
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+class _Field(IntEnum):
+    """Index of each Fixed Income input field, in grid order."""
+    FACE_VALUE = 0
+    COUPON_RATE_ANNUAL = 1
+    YIELD_TO_MATURITY_ANNUAL = 2
+    YEARS_TO_MATURITY = 3
+    COMPOUNDING_FREQ_PER_YEAR = 4
+    CURRENT_PRICE_FOR_YIELD = 5
+    SPOT_RATE_T1_ANNUAL = 6
+    YEARS_T1 = 7
+    SPOT_RATE_T2_ANNUAL = 8
+    YEARS_T2 = 9
+
+def _mask(*fields: _Field) -> int:
+    """Bitmask with bit i set for each given field."""
+    mask = 0
+    for field in fields:
+        mask |= 1 << field
+    return mask
+
 class FixedIncomeGUI(BaseGUI):
     """
     GUI module for Fixed Income (Bonds) calculations.
     Inherits from BaseGUI for common functionalities.
     """
+    # ttk style shared by every input Entry; configured once in __init__ and inherits the rest from TEntry
+    _ENTRY_STYLE = "FI.TEntry"
+
+    # 'Solve For' radio buttons as (label, option), laid out two per row at the matching _SOLVE_GRID cell
+    _SOLVE_OPTIONS = (
+        ("Coupon Bond Price", "COUPON_BOND_PRICE"),
+        ("Zero-Coupon Bond Price", "ZERO_COUPON_BOND_PRICE"),
+        ("Zero-Coupon Bond Yield", "ZERO_COUPON_BOND_YIELD"),
+        ("Macaulay Duration", "MACAULAY_DURATION"),
+        ("Modified Duration", "MODIFIED_DURATION"),
+        ("Convexity", "CONVEXITY"),
+        ("Forward Rate (Yield Curve)", "FORWARD_RATE_YC"),
+        ("Spot Rate (from ZC Bond)", "SPOT_RATE_ZC"),
+    )
+    _SOLVE_GRID = tuple((i // 2, i % 2) for i in range(len(_SOLVE_OPTIONS)))
+
+    # All fields defined by create_input_row, in grid order; each key is the lowercased member name
+    _ALL_FIELD_KEYS = tuple(field.name.lower() for field in _Field)
+
+    # Bitmask of the fields that do not apply to each 'Solve For' option (bit i is _Field i);
+    # every other field is enabled
+    _YIELD_CURVE_MASK = _mask(_Field.SPOT_RATE_T1_ANNUAL, _Field.YEARS_T1, _Field.SPOT_RATE_T2_ANNUAL, _Field.YEARS_T2)
+    _DISABLED_MASK = {
+        "COUPON_BOND_PRICE": _YIELD_CURVE_MASK | _mask(_Field.CURRENT_PRICE_FOR_YIELD),
+        "ZERO_COUPON_BOND_PRICE": _YIELD_CURVE_MASK | _mask(_Field.COUPON_RATE_ANNUAL, _Field.CURRENT_PRICE_FOR_YIELD),
+        "ZERO_COUPON_BOND_YIELD": _YIELD_CURVE_MASK | _mask(_Field.COUPON_RATE_ANNUAL, _Field.YIELD_TO_MATURITY_ANNUAL),
+        "MACAULAY_DURATION": _YIELD_CURVE_MASK | _mask(_Field.CURRENT_PRICE_FOR_YIELD),
+        "MODIFIED_DURATION": _YIELD_CURVE_MASK | _mask(_Field.CURRENT_PRICE_FOR_YIELD),
+        "CONVEXITY": _YIELD_CURVE_MASK | _mask(_Field.CURRENT_PRICE_FOR_YIELD),
+        "FORWARD_RATE_YC": _mask(
+            _Field.FACE_VALUE, _Field.COUPON_RATE_ANNUAL, _Field.YIELD_TO_MATURITY_ANNUAL,
+            _Field.YEARS_TO_MATURITY, _Field.COMPOUNDING_FREQ_PER_YEAR, _Field.CURRENT_PRICE_FOR_YIELD
+        ),
+        "SPOT_RATE_ZC": _YIELD_CURVE_MASK | _mask(_Field.COUPON_RATE_ANNUAL, _Field.YIELD_TO_MATURITY_ANNUAL),
+    }
+
+    # Inputs validated for each option, in validation order:
+    # (field, validation_type, display_name, argument_name, is_percentage)
+    _FACE_VALUE = (_Field.FACE_VALUE, 'positive_numeric', "Face Value", "fv", False)
+    _YTM = (_Field.YIELD_TO_MATURITY_ANNUAL, 'numeric', "Yield to Maturity", "ytm", True)
+    _YEARS = (_Field.YEARS_TO_MATURITY, 'positive_numeric', "Years to Maturity", "n_years", False)
+    _COMP_FREQ = (_Field.COMPOUNDING_FREQ_PER_YEAR, 'positive_integer', "Compounding Frequency", "comp_freq", False)
+    _COUPON_RATE = (_Field.COUPON_RATE_ANNUAL, 'numeric', "Coupon Rate", "cr", True)
+    _CURRENT_PRICE = (_Field.CURRENT_PRICE_FOR_YIELD, 'positive_numeric', "Current Price", "current_price", False)
+    _COUPON_BOND_INPUTS = (_FACE_VALUE, _YTM, _YEARS, _COMP_FREQ, _COUPON_RATE)
+    _SCHEMA = {
+        "COUPON_BOND_PRICE": _COUPON_BOND_INPUTS,
+        "ZERO_COUPON_BOND_PRICE": (_FACE_VALUE, _YTM, _YEARS, _COMP_FREQ),
+        "ZERO_COUPON_BOND_YIELD": (_FACE_VALUE, _CURRENT_PRICE, _YEARS, _COMP_FREQ),
+        "MACAULAY_DURATION": _COUPON_BOND_INPUTS,
+        "MODIFIED_DURATION": _COUPON_BOND_INPUTS,
+        "CONVEXITY": _COUPON_BOND_INPUTS,
+        "FORWARD_RATE_YC": (
+            (_Field.SPOT_RATE_T1_ANNUAL, 'numeric', "Spot Rate T1", "sr_t1", True),
+            (_Field.YEARS_T1, 'positive_numeric', "Years T1", "t1", False),
+            (_Field.SPOT_RATE_T2_ANNUAL, 'numeric', "Spot Rate T2", "sr_t2", True),
+            (_Field.YEARS_T2, 'positive_numeric', "Years T2", "t2", False),
+        ),
+        "SPOT_RATE_ZC": (_CURRENT_PRICE, _FACE_VALUE, _YEARS),
+    }
+
+    # Math function per option, by its _funcs() name:
+    # (function name, argument names in call order, formatter(gui, result) -> display text)
+    _BOND_ARGS = ("fv", "cr", "ytm", "n_years", "comp_freq")
+    _DISPATCH = {
+        "COUPON_BOND_PRICE": ("calculate_bond_price", _BOND_ARGS,
+                              lambda gui, v: f"Coupon Bond Price: {gui.format_currency_output(v)}"),
+        "ZERO_COUPON_BOND_PRICE": ("calculate_zero_coupon_bond_price", ("fv", "ytm", "n_years", "comp_freq"),
+                                   lambda gui, v: f"Zero-Coupon Bond Price: {gui.format_currency_output(v)}"),
+        "ZERO_COUPON_BOND_YIELD": ("calculate_zero_coupon_bond_yield", ("fv", "current_price", "n_years", "comp_freq"),
+                                   lambda gui, v: f"Zero-Coupon Bond Yield: {gui.format_percentage_output(v)}"),
+        # Duration and convexity options read one field of the shared bond analytics result (see _ANALYTICS_FIELDS)
+        "MACAULAY_DURATION": ("calculate_bond_analytics", _BOND_ARGS,
+                              lambda gui, v: f"Macaulay Duration: {gui.format_number_output(v, 4)} periods"),
+        "MODIFIED_DURATION": ("calculate_bond_analytics", _BOND_ARGS,
+                              lambda gui, v: f"Modified Duration: {gui.format_number_output(v, 4)}"),
+        "CONVEXITY": ("calculate_bond_analytics", _BOND_ARGS,
+                      lambda gui, v: f"Convexity: {gui.format_number_output(v, 6)}"),
+        "FORWARD_RATE_YC": ("calculate_forward_rate", ("sr_t1", "t1", "sr_t2", "t2"),
+                            lambda gui, v: f"Implied Forward Rate: {gui.format_percentage_output(v)}"),
+        "SPOT_RATE_ZC": ("calculate_yield_curve_spot_rate", ("current_price", "fv", "n_years"),
+                         lambda gui, v: f"Calculated Spot Rate (from ZCB): {gui.format_percentage_output(v)}"),
+    }
+    _ANALYTICS_FIELDS = {
+        "MACAULAY_DURATION": "macaulay_duration",
+        "MODIFIED_DURATION": "modified_duration",
+        "CONVEXITY": "convexity",
+    }
+
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
         
         self.solve_for_var = tk.StringVar(value="COUPON_BOND_PRICE") # Default calculation
 
+        # One-entry memo of the last calculation: (solve_for, argument values) -> displayed text
+        self._last_key = None
+        self._last_result = None
+        # Bond analytics of the last bond, shared by the duration and convexity options
+        self._analytics_args = None
+        self._analytics = None
+        # Pending after() id of a debounced field-state update (see _schedule_state_update)
+        self._state_update_after = None
+
+        # Math calls run on this worker so a slow first call (imports, heavy routines) never blocks Tk
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="fixed-income")
+        self._calc_future = None # Last calculation submitted to the worker
+
+        ttk.Style().configure(self._ENTRY_STYLE, padding=2)
         self._create_fixed_income_widgets(self.scrollable_frame)
         self._update_input_fields_state() # Initial state update
 
         # Override the calculate button command from BaseGUI
         self.calculate_button.config(text="Calculate Fixed Income", command=self.calculate_fixed_income)
+
+        # Warm the math imports on the worker once the window is idle, so the first
+        # Calculate click does not pay for them
+        self._warmup_after = self.after_idle(self._pool.submit, _funcs)
         logger.info("FixedIncomeGUI initialized.")
 
     def _create_fixed_income_widgets(self, parent_frame):
@@ -60,253 +197,169 @@ class FixedIncomeGUI(BaseGUI):
         fixed_income_inputs_frame.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         fixed_income_inputs_frame.grid_columnconfigure(1, weight=1) # Allow input entries to expand
 
+        # One named Entry style shared by all ten rows
+        entry_style = self._ENTRY_STYLE
+
         # Core Bond Inputs
-        self.create_input_row(fixed_income_inputs_frame, 0, "Face Value:", "1000.00", "The par value of the bond.")
-        self.create_input_row(fixed_income_inputs_frame, 1, "Coupon Rate (Annual %):", "5.00", "Annual coupon rate as a percentage (e.g., 5 for 5%).")
-        self.create_input_row(fixed_income_inputs_frame, 2, "Yield to Maturity (Annual %):", "6.00", "Required annual rate of return as a percentage (YTM).")
-        self.create_input_row(fixed_income_inputs_frame, 3, "Years to Maturity:", "10.00", "Number of years until the bond matures.")
-        self.create_input_row(fixed_income_inputs_frame, 4, "Compounding Freq. (per year):", "2", "Number of times interest is compounded per year (e.g., 2 for semi-annual).")
-        self.create_input_row(fixed_income_inputs_frame, 5, "Current Price (for Yield):", "950.00", "Current market price of the bond (used when calculating yield).")
+        self.create_input_row(fixed_income_inputs_frame, 0, "Face Value:", "1000.00", "The par value of the bond.", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 1, "Coupon Rate (Annual %):", "5.00", "Annual coupon rate as a percentage (e.g., 5 for 5%).", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 2, "Yield to Maturity (Annual %):", "6.00", "Required annual rate of return as a percentage (YTM).", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 3, "Years to Maturity:", "10.00", "Number of years until the bond matures.", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 4, "Compounding Freq. (per year):", "2", "Number of times interest is compounded per year (e.g., 2 for semi-annual).", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 5, "Current Price (for Yield):", "950.00", "Current market price of the bond (used when calculating yield).", entry_style=entry_style)
 
         # Inputs for Forward/Spot Rates (simplified for single calculations)
-        self.create_input_row(fixed_income_inputs_frame, 6, "Spot Rate T1 (Annual %):", "1.00", "Spot rate for period T1 (for forward rate calculation).")
-        self.create_input_row(fixed_income_inputs_frame, 7, "Years T1:", "1.00", "Years for spot rate T1.")
-        self.create_input_row(fixed_income_inputs_frame, 8, "Spot Rate T2 (Annual %):", "2.00", "Spot rate for period T2 (for forward rate calculation).")
-        self.create_input_row(fixed_income_inputs_frame, 9, "Years T2:", "2.00", "Years for spot rate T2.")
+        self.create_input_row(fixed_income_inputs_frame, 6, "Spot Rate T1 (Annual %):", "1.00", "Spot rate for period T1 (for forward rate calculation).", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 7, "Years T1:", "1.00", "Years for spot rate T1.", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 8, "Spot Rate T2 (Annual %):", "2.00", "Spot rate for period T2 (for forward rate calculation).", entry_style=entry_style)
+        self.create_input_row(fixed_income_inputs_frame, 9, "Years T2:", "2.00", "Years for spot rate T2.", entry_style=entry_style)
+
+        # Every _Field must have an entry; a mismatch is a programming error caught here, not per click
+        missing = set(self._ALL_FIELD_KEYS).difference(self.input_fields)
+        assert not missing, f"Fixed income input rows missing for fields: {sorted(missing)}"
+
+        # Direct Entry references indexed by _Field, for the per-click state updates
+        self._widgets = [self.input_fields[key] for key in self._ALL_FIELD_KEYS]
         
         # --- Solve For Section ---
         solve_for_frame = ttk.LabelFrame(parent_frame, text="Calculate")
         solve_for_frame.grid(row=1, column=0, padx=10, pady=10, sticky="ew")
         solve_for_frame.grid_columnconfigure(0, weight=1)
 
-        solve_options = {
-            "Coupon Bond Price": "COUPON_BOND_PRICE",
-            "Zero-Coupon Bond Price": "ZERO_COUPON_BOND_PRICE",
-            "Zero-Coupon Bond Yield": "ZERO_COUPON_BOND_YIELD",
-            "Macaulay Duration": "MACAULAY_DURATION",
-            "Modified Duration": "MODIFIED_DURATION",
-            "Convexity": "CONVEXITY",
-            "Forward Rate (Yield Curve)": "FORWARD_RATE_YC",
-            "Spot Rate (from ZC Bond)": "SPOT_RATE_ZC",
-        }
-
-        row_num = 0
-        for text, value in solve_options.items():
+        for (text, value), (row, column) in zip(self._SOLVE_OPTIONS, self._SOLVE_GRID):
             rb = ttk.Radiobutton(solve_for_frame, text=text, variable=self.solve_for_var,
-                                 value=value, command=self._update_input_fields_state)
-            rb.grid(row=row_num // 2, column=row_num % 2, sticky="w", padx=5, pady=2)
-            row_num += 1
+                                 value=value, command=self._schedule_state_update)
+            rb.grid(row=row, column=column, sticky="w", padx=5, pady=2)
         
         # Adjust common buttons and result frame positions
         self.common_buttons_frame.grid(row=2, column=0, columnspan=1, pady=5)
         self.result_frame.grid(row=3, column=0, columnspan=1, padx=10, pady=10, sticky="ew")
 
+    def _schedule_state_update(self):
+        """
+        Coalesces rapid 'Solve For' changes (e.g. arrowing through the radio buttons)
+        into a single field-state update 50 ms after the last one.
+        """
+        if self._state_update_after is not None:
+            self.after_cancel(self._state_update_after)
+        self._state_update_after = self.after(50, self._do_state_update)
+
+    def _do_state_update(self):
+        self._state_update_after = None
+        self._update_input_fields_state()
+
     def _update_input_fields_state(self):
         """
         Enables/disables input fields based on the selected 'Solve For' option.
         """
-        selected_option = self.solve_for_var.get()
-
-        # All fields defined by create_input_row using their generated keys
-        all_field_keys = [
-            "face_value", "coupon_rate_annual", "yield_to_maturity_annual",
-            "years_to_maturity", "compounding_freq_per_year",
-            "current_price_for_yield",
-            "spot_rate_t1_annual", "years_t1", "spot_rate_t2_annual", "years_t2"
-        ]
-
-        # Enable all fields first
-        for key in all_field_keys:
-            if key in self.input_fields:
-                self.input_fields[key].config(state="normal")
-            else:
-                logger.warning(f"Field key '{key}' not found in input_fields during state update in FixedIncomeGUI.")
-        
-        # Then disable specific fields based on selected_option
-        if selected_option == "COUPON_BOND_PRICE":
-            self.input_fields["current_price_for_yield"].config(state="disabled")
-            self.input_fields["spot_rate_t1_annual"].config(state="disabled")
-            self.input_fields["years_t1"].config(state="disabled")
-            self.input_fields["spot_rate_t2_annual"].config(state="disabled")
-            self.input_fields["years_t2"].config(state="disabled")
-        elif selected_option == "ZERO_COUPON_BOND_PRICE":
-            self.input_fields["coupon_rate_annual"].config(state="disabled")
-            self.input_fields["current_price_for_yield"].config(state="disabled")
-            self.input_fields["spot_rate_t1_annual"].config(state="disabled")
-            self.input_fields["years_t1"].config(state="disabled")
-            self.input_fields["spot_rate_t2_annual"].config(state="disabled")
-            self.input_fields["years_t2"].config(state="disabled")
-        elif selected_option == "ZERO_COUPON_BOND_YIELD":
-            self.input_fields["coupon_rate_annual"].config(state="disabled")
-            self.input_fields["yield_to_maturity_annual"].config(state="disabled")
-            self.input_fields["spot_rate_t1_annual"].config(state="disabled")
-            self.input_fields["years_t1"].config(state="disabled")
-            self.input_fields["spot_rate_t2_annual"].config(state="disabled")
-            self.input_fields["years_t2"].config(state="disabled")
-        elif selected_option in ["MACAULAY_DURATION", "MODIFIED_DURATION", "CONVEXITY"]:
-            self.input_fields["current_price_for_yield"].config(state="disabled")
-            self.input_fields["spot_rate_t1_annual"].config(state="disabled")
-            self.input_fields["years_t1"].config(state="disabled")
-            self.input_fields["spot_rate_t2_annual"].config(state="disabled")
-            self.input_fields["years_t2"].config(state="disabled")
-        elif selected_option == "FORWARD_RATE_YC":
-            self.input_fields["face_value"].config(state="disabled")
-            self.input_fields["coupon_rate_annual"].config(state="disabled")
-            self.input_fields["yield_to_maturity_annual"].config(state="disabled")
-            self.input_fields["years_to_maturity"].config(state="disabled")
-            self.input_fields["compounding_freq_per_year"].config(state="disabled")
-            self.input_fields["current_price_for_yield"].config(state="disabled")
-        elif selected_option == "SPOT_RATE_ZC":
-            self.input_fields["coupon_rate_annual"].config(state="disabled")
-            self.input_fields["yield_to_maturity_annual"].config(state="disabled")
-            self.input_fields["spot_rate_t1_annual"].config(state="disabled")
-            self.input_fields["years_t1"].config(state="disabled")
-            self.input_fields["spot_rate_t2_annual"].config(state="disabled")
-            self.input_fields["years_t2"].config(state="disabled")
+        mask = self._DISABLED_MASK.get(self.solve_for_var.get(), 0)
+
+        # Single pass: each field is set to its final state, and only if that state changes
+        for i, widget in enumerate(self._widgets):
+            state = "disabled" if mask >> i & 1 else "normal"
+            if str(widget.cget("state")) != state:
+                widget.config(state=state)
 
     def calculate_fixed_income(self):
         """
         Performs the Fixed Income calculation based on user inputs and the selected option.
         """
-        self.display_result("Calculating...", is_error=False)
+        widgets, require, show = self._widgets, self.require_input, self.display_result
+        show("Calculating...", is_error=False)
         solve_for = self.solve_for_var.get()
 
-        # --- Get and Validate Inputs ---
-        # Note: All rates are assumed to be percentages (e.g., "5" for 5%) from GUI.
-        # They will be converted to decimals (e.g., 0.05) for math functions.
-
-        face_value_str = self.get_input_value("face_value")
-        coupon_rate_str = self.get_input_value("coupon_rate_annual")
-        ym_str = self.get_input_value("yield_to_maturity_annual")
-        years_str = self.get_input_value("years_to_maturity")
-        comp_freq_str = self.get_input_value("compounding_freq_per_year") # Corrected key
-        current_price_str = self.get_input_value("current_price_for_yield")
-
-        # Yield curve specific inputs
-        spot_rate_t1_str = self.get_input_value("spot_rate_t1_annual") # Corrected key
-        years_t1_str = self.get_input_value("years_t1")
-        spot_rate_t2_str = self.get_input_value("spot_rate_t2_annual") # Corrected key
-        years_t2_str = self.get_input_value("years_t2")
-        
-        # --- Common Validation & Conversion ---
-        # Initialize variables
-        fv, cr, ytm, n_years, comp_freq, current_price = 0.0, 0.0, 0.0, 0.0, 1.0, 0.0
-        sr_t1, t1, sr_t2, t2 = 0.0, 0.0, 0.0, 0.0
+        schema = self._SCHEMA.get(solve_for)
+        if schema is None:
+            return show("Please select a valid calculation.", is_error=True)
 
         try:
-            if solve_for in ["COUPON_BOND_PRICE", "ZERO_COUPON_BOND_PRICE", "MACAULAY_DURATION", "MODIFIED_DURATION", "CONVEXITY"]:
-                is_valid, fv = self.validate_input(face_value_str, 'positive_numeric', "Face Value")
-                if not is_valid: return self.display_result(fv, is_error=True)
-                
-                is_valid, ytm = self.validate_input(ym_str, 'numeric', "Yield to Maturity")
-                if not is_valid: return self.display_result(ytm, is_error=True)
-                ytm /= 100.0 # Convert to decimal
-
-                is_valid, n_years = self.validate_input(years_str, 'positive_numeric', "Years to Maturity")
-                if not is_valid: return self.display_result(n_years, is_error=True)
-                
-                is_valid, comp_freq = self.validate_input(comp_freq_str, 'positive_integer', "Compounding Frequency")
-                if not is_valid: return self.display_result(comp_freq, is_error=True)
-                
-                if solve_for == "COUPON_BOND_PRICE" or solve_for in ["MACAULAY_DURATION", "MODIFIED_DURATION", "CONVEXITY"]:
-                    is_valid, cr = self.validate_input(coupon_rate_str, 'numeric', "Coupon Rate")
-                    if not is_valid: return self.display_result(cr, is_error=True)
-                    cr /= 100.0 # Convert to decimal
-            
-            elif solve_for == "ZERO_COUPON_BOND_YIELD":
-                is_valid, fv = self.validate_input(face_value_str, 'positive_numeric', "Face Value")
-                if not is_valid: return self.display_result(fv, is_error=True)
-                
-                is_valid, current_price = self.validate_input(current_price_str, 'positive_numeric', "Current Price")
-                if not is_valid: return self.display_result(current_price, is_error=True)
-                
-                is_valid, n_years = self.validate_input(years_str, 'positive_numeric', "Years to Maturity")
-                if not is_valid: return self.display_result(n_years, is_error=True)
-                
-                is_valid, comp_freq = self.validate_input(comp_freq_str, 'positive_integer', "Compounding Frequency")
-                if not is_valid: return self.display_result(comp_freq, is_error=True)
-            
-            elif solve_for == "FORWARD_RATE_YC":
-                is_valid, sr_t1 = self.validate_input(spot_rate_t1_str, 'numeric', "Spot Rate T1")
-                if not is_valid: return self.display_result(sr_t1, is_error=True)
-                sr_t1 /= 100.0 # Convert to decimal
-                
-                is_valid, t1 = self.validate_input(years_t1_str, 'positive_numeric', "Years T1")
-                if not is_valid: return self.display_result(t1, is_error=True)
-                
-                is_valid, sr_t2 = self.validate_input(spot_rate_t2_str, 'numeric', "Spot Rate T2")
-                if not is_valid: return self.display_result(sr_t2, is_error=True)
-                sr_t2 /= 100.0 # Convert to decimal
-                
-                is_valid, t2 = self.validate_input(years_t2_str, 'positive_numeric', "Years T2")
-                if not is_valid: return self.display_result(t2, is_error=True)
-
-                if t1 >= t2:
-                    self.display_result("Years T2 must be greater than Years T1 for Forward Rate calculation.", is_error=True)
-                    return
-            
-            elif solve_for == "SPOT_RATE_ZC":
-                is_valid, current_price = self.validate_input(current_price_str, 'positive_numeric', "Current Price")
-                if not is_valid: return self.display_result(current_price, is_error=True)
-                
-                is_valid, fv = self.validate_input(face_value_str, 'positive_numeric', "Face Value")
-                if not is_valid: return self.display_result(fv, is_error=True)
-                
-                is_valid, n_years = self.validate_input(years_str, 'positive_numeric', "Years to Maturity")
-                if not is_valid: return self.display_result(n_years, is_error=True)
+            # --- Get and Validate Inputs ---
+            # Note: All rates are entered as percentages (e.g., "5" for 5%) in the GUI and
+            # converted to decimals (e.g., 0.05) for the math functions.
+            args = {}
+            for field, validation_type, display_name, arg_name, is_percentage in schema:
+                value = require(widgets[field].get(), validation_type, display_name)
+                args[arg_name] = value / 100.0 if is_percentage else value
 
+            if solve_for == "FORWARD_RATE_YC" and args["t1"] >= args["t2"]:
+                raise InputError("Years T2", "Years T2 must be greater than Years T1 for Forward Rate calculation.")
 
             # --- Perform Calculation ---
-            result = None
-            if solve_for == "COUPON_BOND_PRICE":
-                result = calculate_bond_price(fv, cr, ytm, n_years, comp_freq)
-                self.display_result(f"Coupon Bond Price: {self.format_currency_output(result)}")
-            elif solve_for == "ZERO_COUPON_BOND_PRICE":
-                result = calculate_zero_coupon_bond_price(fv, ytm, n_years, comp_freq)
-                self.display_result(f"Zero-Coupon Bond Price: {self.format_currency_output(result)}")
-            elif solve_for == "ZERO_COUPON_BOND_YIELD":
-                result_decimal = calculate_zero_coupon_bond_yield(fv, current_price, n_years, comp_freq)
-                self.display_result(f"Zero-Coupon Bond Yield: {self.format_percentage_output(result_decimal)}")
-            elif solve_for == "MACAULAY_DURATION":
-                # Ensure the correct Macaulay duration is called (from fixed_income_advanced.py)
-                result = calculate_macaulay_duration(fv, cr, ytm, n_years, comp_freq)
-                self.display_result(f"Macaulay Duration: {self.format_number_output(result, 4)} periods")
-            elif solve_for == "MODIFIED_DURATION":
-                # Ensure the correct Modified duration is called (from bond_risk.py or fixed_income_advanced.py - both have it. Using bond_risk for variety)
-                # Note: If `calculate_macaulay_duration` is needed internally by `calculate_modified_duration`,
-                # ensure `bond_risk.py` or the aliased `_calculate_macaulay_duration_helper` is correctly structured.
-                # For now, assuming direct call.
-                result = calculate_modified_duration(fv, cr, ytm, n_years, comp_freq)
-                self.display_result(f"Modified Duration: {self.format_number_output(result, 4)}")
-            elif solve_for == "CONVEXITY":
-                # Using the Convexity from fixed_income_advanced.py
-                result = calculate_convexity(fv, cr, ytm, n_years, comp_freq)
-                self.display_result(f"Convexity: {self.format_number_output(result, 6)}")
-            elif solve_for == "FORWARD_RATE_YC":
-                result_decimal = calculate_forward_rate(sr_t1, t1, sr_t2, t2)
-                self.display_result(f"Implied Forward Rate: {self.format_percentage_output(result_decimal)}")
-            elif solve_for == "SPOT_RATE_ZC":
-                result_decimal = calculate_yield_curve_spot_rate(current_price, fv, n_years)
-                self.display_result(f"Calculated Spot Rate (from ZCB): {self.format_percentage_output(result_decimal)}")
-
-        except ValueError as e:
+            func_name, arg_names, formatter = self._DISPATCH[solve_for]
+            call_args = [args[name] for name in arg_names]
+
+            # Repeated clicks with unchanged inputs just redisplay the previous result
+            memo_key = (solve_for, tuple(call_args))
+            if memo_key == self._last_key:
+                return show(self._last_result)
+
+            analytics_field = self._ANALYTICS_FIELDS.get(solve_for)
+            if analytics_field is not None and memo_key[1] == self._analytics_args:
+                # Switching between duration and convexity on the same bond reuses one computation
+                return self._show_result(memo_key, formatter, getattr(self._analytics, analytics_field))
+
+            # Import and compute on the worker thread; the result is shown back on the Tk thread
+            self.calculate_button.config(state="disabled")
+            future = self._calc_future = self._pool.submit(lambda: getattr(_funcs(), func_name)(*call_args))
+            self.call_when_done(future, self._on_calculation_done, memo_key, formatter, analytics_field)
+
+        except Exception as e:
+            self._show_calculation_error(e)
+
+    def _on_calculation_done(self, future, memo_key, formatter, analytics_field):
+        """
+        Runs on the Tk thread when the worker finishes: re-enables Calculate and shows the result or error.
+        """
+        self.calculate_button.config(state="normal")
+        try:
+            result = future.result()
+            if analytics_field is not None:
+                self._analytics, self._analytics_args = result, memo_key[1]
+                result = getattr(result, analytics_field)
+            self._show_result(memo_key, formatter, result)
+        except Exception as e:
+            self._show_calculation_error(e)
+
+    def _show_result(self, memo_key, formatter, result):
+        self._last_result = formatter(self, result)
+        self._last_key = memo_key
+        self.display_result(self._last_result)
+
+    def _show_calculation_error(self, e: Exception):
+        show = self.display_result
+        if isinstance(e, InputError):
+            show(e.msg, is_error=True)
+        elif isinstance(e, ValueError):
             logger.error(f"Fixed Income Calculation Error (ValueError): {e}")
-            self.display_result(f"Calculation Error: {e}", is_error=True)
-        except ZeroDivisionError as e:
+            show(f"Calculation Error: {e}", is_error=True)
+        elif isinstance(e, ZeroDivisionError):
             logger.error(f"Fixed Income Calculation Error (ZeroDivisionError): {e}")
-            self.display_result(f"Calculation Error: Division by zero. Check inputs like rate or frequency.", is_error=True)
-        except Exception as e:
-            logger.critical(f"An unexpected error occurred during Fixed Income calculation: {e}", exc_info=True)
-            self.display_result(f"An unexpected error occurred: {e}", is_error=True)
+            show(f"Calculation Error: Division by zero. Check inputs like rate or frequency.", is_error=True)
+        else:
+            logger.critical(f"An unexpected error occurred during Fixed Income calculation: {e}", exc_info=e)
+            show(f"An unexpected error occurred: {e}", is_error=True)
 
     def clear_inputs(self):
         """
         Overrides BaseGUI's clear_inputs to also reset the solve_for_var and update state.
         """
         super().clear_inputs()
+        self._last_key = self._last_result = None # Inputs changed; drop the memoized results
+        self._analytics_args = self._analytics = None
         self.solve_for_var.set("COUPON_BOND_PRICE") # Reset to default
         self._update_input_fields_state() # Update UI based on reset
 
+    def destroy(self):
+        if self._calc_future is not None:
+            self._calc_future.cancel() # Only stops a job that has not started; BaseGUI.destroy stops polling a running one
+        # Pending after() callbacks would otherwise run against destroyed widgets
+        if self._state_update_after is not None:
+            self.after_cancel(self._state_update_after)
+            self._state_update_after = None
+        self.after_cancel(self._warmup_after) # No-op if the warm-up already ran
+        self._pool.shutdown(wait=False)
+        super().destroy()
+
 # Example usage (for testing FixedIncomeGUI in isolation if desired)
 if __name__ == "__main__":
     root = tk.Tk()
@@ -3,8 +3,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Union, List, Dict, Any
+import functools
+import concurrent.futures
+from typing import Union, Dict, Any, Tuple
 import re # Ensure this import is present
+import numpy as np
 
 # Import BaseGUI for inheritance
 from .base_gui import BaseGUI
@@ -30,15 +33,132 @@ from mathematical_functions.unit_conversions import (
 from config import DEFAULT_WINDOW_WIDTH # for example usage
 
 # Set up logging for this module
+# Output configuration is left to the application (main_app.py calls basicConfig)
 logger = logging.getLogger(__name__)
-if not logger.handlers:
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger.addHandler(logging.NullHandler())
+
+_KEY_RE = re.compile(r'[^a-z0-9]+')
+
+@functools.lru_cache(maxsize=128)
+def _label_to_key(label_text: str) -> str:
+    """
+    Replicates the field key generation logic from BaseGUI's create_input_row.
+    Memoized, since the same few labels are converted on every selection and calculation.
+    """
+    return _KEY_RE.sub(' ', label_text.lower()).strip().replace(' ', '_')
+
+# Memoized calculation backends. Repeated Calculate clicks on unchanged inputs are served
+# from these caches; GeneralToolsGUI.clear_inputs empties them. Data arrays are keyed on
+# their float64 bytes, since ndarrays are not hashable.
+@functools.lru_cache(maxsize=64)
+def _cached_descriptive_stats(data: bytes) -> dict:
+    return calculate_descriptive_stats(np.frombuffer(data, dtype=np.float64))
+
+@functools.lru_cache(maxsize=64)
+def _cached_linear_regression(x_data: bytes, y_data: bytes) -> dict:
+    return perform_simple_linear_regression(np.frombuffer(x_data, dtype=np.float64), np.frombuffer(y_data, dtype=np.float64))
+
+_cached_perpetuity = functools.lru_cache(maxsize=256)(calculate_perpetuity)
+_cached_growing_perpetuity = functools.lru_cache(maxsize=256)(calculate_growing_perpetuity)
+_cached_convert_currency = functools.lru_cache(maxsize=256)(convert_currency)
+_cached_forward_rate = functools.lru_cache(maxsize=256)(calculate_forward_rate)
+_cached_convert_time_periods = functools.lru_cache(maxsize=256)(convert_time_periods)
+
+def _validation_type_for(key: str) -> str:
+    """Determines a field's validation type from its key, based on key/common patterns."""
+    if 'data_comma_separated' in key:
+        return 'numeric_list'
+    elif 'value_to_convert' in key:
+        return 'numeric'
+    elif 'amount_to_convert' in key or 'spot_rate_from_to' in key or \
+         'payment_pmt' in key:
+        return 'positive_numeric_or_zero' # Allow 0 for payment/amount if meaningful
+    elif 'rate' in key or 'time' in key:
+        return 'numeric' # Rates/time can be zero, but not necessarily positive
+    elif 'unit' in key or 'currency' in key:
+        return 'string_not_empty' # For text fields
+    return 'numeric' # Default
+
+@functools.lru_cache(maxsize=32)
+def _stat_title(stat_key: str) -> str:
+    """Display title for a statistics result key, e.g. 'std_dev' -> 'Std Dev'."""
+    return stat_key.replace('_', ' ').title()
+
+def _require_numeric_array(arr: Union[np.ndarray, None], name: str, min_len: int = 1) -> np.ndarray:
+    """
+    Returns arr if it holds at least min_len values; otherwise raises ValueError with a
+    user-facing message, before any work is done on the data.
+    """
+    if arr is None or arr.size == 0:
+        raise ValueError(f"{name} cannot be empty.")
+    if arr.size < min_len:
+        raise ValueError(f"{name} must contain at least {min_len} values.")
+    return arr
+
+_CACHED_BACKENDS = (
+    _cached_descriptive_stats,
+    _cached_linear_regression,
+    _cached_perpetuity,
+    _cached_growing_perpetuity,
+    _cached_convert_currency,
+    _cached_forward_rate,
+    _cached_convert_time_periods,
+)
+
+# One worker shared by all GeneralToolsGUI instances: calculations (notably the statistics
+# tools on large pasted datasets) run off the Tk thread, one at a time
+_CALC_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="general-tools")
 
 class GeneralToolsGUI(BaseGUI):
     """
     GUI module for General Financial and Statistical Tools, adhering to PROJECT_STRUCTURE.md.
     Inherits from BaseGUI for common functionalities.
     """
+    # Input labels per tool, and per shared frame group ("*_Group"), in validation order.
+    # The currency code entries are added by hand; their keys match what their labels would derive.
+    _MODEL_FIELD_LABELS = {
+        "Descriptive Statistics": ("Data (comma-separated):",),
+        "Simple Linear Regression": ("X Data (comma-separated):", "Y Data (comma-separated):"),
+        "Perpetuity_Group": ("Payment (PMT):", "Discount Rate (%):", "Growth Rate (%):"),
+        "Perpetuity Value": ("Payment (PMT):", "Discount Rate (%):"),
+        "Growing Perpetuity Value": ("Payment (PMT):", "Discount Rate (%):", "Growth Rate (%):"),
+        "Forex_Group": ("Amount to Convert:", "Spot Rate (From/To):", "Domestic Rate (%):", "Foreign Rate (%):",
+                        "Time to Maturity (Years):", "Current Currency:", "Target Currency:"),
+        "Currency Conversion": ("Amount to Convert:", "Spot Rate (From/To):", "Current Currency:", "Target Currency:"),
+        "Forward Rate": ("Spot Rate (From/To):", "Domestic Rate (%):", "Foreign Rate (%):",
+                         "Time to Maturity (Years):", "Current Currency:", "Target Currency:"),
+        "Time Unit Conversion": ("Value to Convert:", "From Unit:", "To Unit:"),
+    }
+    # Field keys derived once at class definition rather than on every instantiation
+    _MODEL_FIELD_KEYS = {
+        model: tuple(_label_to_key(label) for label in labels)
+        for model, labels in _MODEL_FIELD_LABELS.items()
+    }
+    # (enabled keys, disabled keys) for each tool that shares a frame group: a tool's own
+    # fields are enabled and the rest of its group's fields disabled
+    _FIELD_STATES = {
+        tool: (frozenset(tool_keys), frozenset(group_keys) - frozenset(tool_keys))
+        for tool, tool_keys, group_keys in (
+            ("Perpetuity Value", _MODEL_FIELD_KEYS["Perpetuity Value"], _MODEL_FIELD_KEYS["Perpetuity_Group"]),
+            ("Growing Perpetuity Value", _MODEL_FIELD_KEYS["Growing Perpetuity Value"], _MODEL_FIELD_KEYS["Perpetuity_Group"]),
+            ("Currency Conversion", _MODEL_FIELD_KEYS["Currency Conversion"], _MODEL_FIELD_KEYS["Forex_Group"]),
+            ("Forward Rate", _MODEL_FIELD_KEYS["Forward Rate"], _MODEL_FIELD_KEYS["Forex_Group"]),
+        )
+    }
+    # Field name shown in validation messages, per input key
+    _FIELD_DISPLAY = {
+        key: key.replace('_', ' ').title()
+        for keys in _MODEL_FIELD_KEYS.values() for key in keys
+    }
+    # Validation type per input key, resolved once instead of on every Calculate click
+    _FIELD_VALIDATION = {key: _validation_type_for(key) for key in _FIELD_DISPLAY}
+    # Percentage inputs per tool, converted to decimals after validation
+    _PERCENT_KEYS = {
+        "Perpetuity Value": frozenset({_label_to_key("Discount Rate (%):")}),
+        "Growing Perpetuity Value": frozenset({_label_to_key("Discount Rate (%):"), _label_to_key("Growth Rate (%):")}),
+        "Forward Rate": frozenset({_label_to_key("Domestic Rate (%):"), _label_to_key("Foreign Rate (%):")}),
+    }
+
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
 
@@ -53,8 +173,17 @@ class GeneralToolsGUI(BaseGUI):
 
         # Dictionary to hold frames for each model group's inputs
         self.model_input_frames: Dict[str, ttk.LabelFrame] = {}
-        # Dictionary to store the specific input field keys for each model
-        self.model_field_keys: Dict[str, List[str]] = {}
+        # The specific input field keys for each model (shared, read-only class table)
+        self.model_field_keys: Dict[str, tuple] = self._MODEL_FIELD_KEYS
+        # Last state set on each shared-frame field, so unchanged fields are not reconfigured
+        self._field_states: Dict[str, str] = {}
+        # Tool whose field states were applied last; re-selecting it skips the update entirely
+        self._applied_submodel = None
+        # Pending after() id of a debounced tool selection (see _on_model_selected)
+        self._pending_select = None
+        # Bumped by each submitted calculation and by Clear; a worker result from an older
+        # generation is stale and is not displayed
+        self._calc_generation = 0
 
         self._create_model_selection_widgets(self.scrollable_frame, start_row=1)
         self._create_all_tool_input_widgets(start_row=2) # Start below model selection
@@ -89,120 +218,100 @@ class GeneralToolsGUI(BaseGUI):
             state="readonly"
         )
         self.model_combobox.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        self.model_combobox.bind("<<ComboboxSelected>>", self._on_model_selected)
+        self._combobox_bind_id = self.model_combobox.bind("<<ComboboxSelected>>", self._on_model_selected)
 
     def _create_all_tool_input_widgets(self, start_row: int):
         """
-        Creates all input fields and frames for each general tool,
-        but keeps them hidden initially.
+        Registers the widget factory for each general tool's input frame.
+        Frames are built on first selection (see _get_tool_frame), so only
+        the tools the user actually opens create any widgets.
         """
-        parent_for_tools = self.scrollable_frame
-        current_row = start_row
-
-        self.model_input_frames["Descriptive Statistics"] = self._create_descriptive_stats_widgets(parent_for_tools, "Descriptive Statistics Inputs")
-        self.model_input_frames["Descriptive Statistics"].grid(row=current_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        self.model_input_frames["Simple Linear Regression"] = self._create_linear_regression_widgets(parent_for_tools, "Simple Linear Regression Inputs")
-        self.model_input_frames["Simple Linear Regression"].grid(row=current_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Perpetuity and Growing Perpetuity can share a frame, as they have overlapping inputs
-        self.model_input_frames["Perpetuity_Group"] = self._create_perpetuity_widgets(parent_for_tools, "Perpetuity & Growing Perpetuity Inputs")
-        self.model_input_frames["Perpetuity_Group"].grid(row=current_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Currency Conversion and Forward Rate can share a frame
-        self.model_input_frames["Forex_Group"] = self._create_forex_widgets(parent_for_tools, "Foreign Exchange Tools Inputs")
-        self.model_input_frames["Forex_Group"].grid(row=current_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        self.model_input_frames["Time Unit Conversion"] = self._create_unit_conversion_widgets(parent_for_tools, "Time Unit Conversion Inputs")
-        self.model_input_frames["Time Unit Conversion"].grid(row=current_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        self._tool_frame_row = start_row
+        # All tool frames share one grid cell and are switched with tkraise; this empty
+        # frame sits in the same cell and is raised while no tool is selected
+        self._placeholder_frame = ttk.Frame(self.scrollable_frame)
+        self._grid_tool_frame(self._placeholder_frame)
+        # Frame key -> (factory, LabelFrame title)
+        self._frame_factories = {
+            "Descriptive Statistics": (self._create_descriptive_stats_widgets, "Descriptive Statistics Inputs"),
+            "Simple Linear Regression": (self._create_linear_regression_widgets, "Simple Linear Regression Inputs"),
+            # Perpetuity and Growing Perpetuity share a frame, as they have overlapping inputs
+            "Perpetuity_Group": (self._create_perpetuity_widgets, "Perpetuity & Growing Perpetuity Inputs"),
+            # Currency Conversion and Forward Rate share a frame
+            "Forex_Group": (self._create_forex_widgets, "Foreign Exchange Tools Inputs"),
+            "Time Unit Conversion": (self._create_unit_conversion_widgets, "Time Unit Conversion Inputs"),
+        }
 
         # Adjust common buttons and result frame positions relative to this GUI's grid
-        self.result_frame.grid(row=current_row + 1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
-        self.common_buttons_frame.grid(row=current_row + 2, column=0, columnspan=2, pady=5)
+        self.result_frame.grid(row=start_row + 1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+        self.common_buttons_frame.grid(row=start_row + 2, column=0, columnspan=2, pady=5)
+
+    def _get_tool_frame(self, frame_key: str) -> Union[ttk.LabelFrame, None]:
+        """Returns the input frame for frame_key, building and caching it on first use."""
+        frame = self.model_input_frames.get(frame_key)
+        if frame is None and frame_key in self._frame_factories:
+            factory, title = self._frame_factories[frame_key]
+            frame = self.model_input_frames[frame_key] = factory(self.scrollable_frame, title)
+            self._grid_tool_frame(frame)
+            logger.debug("Built General Tools input frame on first use: %s", frame_key)
+        return frame
+
+    def _grid_tool_frame(self, frame: ttk.Frame):
+        """Grids a frame once into the shared tool-input cell."""
+        frame.grid(row=self._tool_frame_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
 
     def _hide_all_input_frames(self):
-        """Hides all model-specific input frames by forgetting their grid positions."""
-        for frame in self.model_input_frames.values():
-            frame.grid_forget()
+        """Hides all model-specific input frames by raising the empty placeholder over them."""
+        self._placeholder_frame.tkraise()
         self.display_result("Select a tool to view its inputs and calculate.", is_error=False)
 
     def _on_model_selected(self, event=None):
-        """Callback when a model is selected from the combobox."""
-        selected_model = self.selected_model_var.get()
-        logger.info(f"Selected tool for General Tools: {selected_model}")
+        """
+        Callback when a model is selected from the combobox. Coalesces rapid selections
+        (e.g. scrolling through the dropdown) so only the last one is applied, 30 ms later.
+        """
+        if self._pending_select is not None:
+            self.after_cancel(self._pending_select)
+        self._pending_select = self.after(30, self._apply_model_selection, self.selected_model_var.get())
+
+    def _apply_model_selection(self, selected_model: str):
+        """Shows the input frame for selected_model and updates its field states."""
+        self._pending_select = None
+        logger.info("Selected tool for General Tools: %s", selected_model)
         self._hide_all_input_frames()
 
-        frame_to_show = None
-        # Handle showing the correct frame and updating specific fields within shared frames
-        if selected_model == "Descriptive Statistics":
-            frame_to_show = self.model_input_frames["Descriptive Statistics"]
-        elif selected_model == "Simple Linear Regression":
-            frame_to_show = self.model_input_frames["Simple Linear Regression"]
-        elif selected_model in ["Perpetuity Value", "Growing Perpetuity Value"]:
-            frame_to_show = self.model_input_frames["Perpetuity_Group"]
-            self._update_specific_perpetuity_states(selected_model)
-        elif selected_model in ["Currency Conversion", "Forward Rate"]:
-            frame_to_show = self.model_input_frames["Forex_Group"]
-            self._update_specific_forex_states(selected_model)
-        elif selected_model == "Time Unit Conversion":
-            frame_to_show = self.model_input_frames["Time Unit Conversion"]
-        else:
+        frame_spec = self._FRAME_MAP.get(selected_model)
+        if frame_spec is None:
             self.display_result("Please select a valid tool.", is_error=True)
             return
 
+        # Build the tool's frame if needed, updating specific fields within shared frames before showing it
+        frame_key, state_updater = frame_spec
+        frame_to_show = self._get_tool_frame(frame_key)
+        if frame_to_show and state_updater is not None:
+            state_updater(self, selected_model)
+
         if frame_to_show:
-            # Re-grid the selected frame
-            frame_to_show.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+            # Frames are already gridded in the shared cell; just bring this one to the top
+            frame_to_show.tkraise()
             self.display_result("Ready for calculation.", is_error=False)
         else:
             self.display_result("Error: Could not find frame for selected tool.", is_error=True)
 
-    def _get_field_key_from_label(self, label_text: str) -> str:
-        """
-        Replicates the field key generation logic from BaseGUI's create_input_row.
-        """
-        field_key = label_text.lower()
-        field_key = re.sub(r'[^a-z0-9]+', ' ', field_key).strip()
-        field_key = field_key.replace(' ', '_')
-        return field_key
-
-    def _update_specific_perpetuity_states(self, selected_model: str):
-        """
-        Manages enabling/disabling fields within the shared Perpetuity_Group frame.
-        """
-        all_perpetuity_fields = self.model_field_keys["Perpetuity_Group"]
-
-        # First, enable all fields in this group
-        for key in all_perpetuity_fields:
-            if key in self.input_fields:
-                self.input_fields[key].config(state="normal")
-
-        # Then, disable specific ones based on the sub-selection
-        if selected_model == "Perpetuity Value":
-            self.input_fields[self._get_field_key_from_label("Growth Rate (%):")].config(state="disabled")
-        elif selected_model == "Growing Perpetuity Value":
-            # All fields are needed
-            pass
-
-    def _update_specific_forex_states(self, selected_model: str):
+    def _update_shared_frame_states(self, selected_model: str):
         """
-        Manages enabling/disabling fields within the shared Forex_Group frame.
+        Enables/disables fields within a shared frame (Perpetuity_Group, Forex_Group)
+        for selected_model, skipping fields that are already in the wanted state.
         """
-        all_forex_fields = self.model_field_keys["Forex_Group"]
-
-        # First, enable all fields in this group
-        for key in all_forex_fields:
-            if key in self.input_fields:
-                self.input_fields[key].config(state="normal")
-
-        # Then, disable specific ones based on the sub-selection
-        if selected_model == "Currency Conversion":
-            self.input_fields[self._get_field_key_from_label("Domestic Rate (%):")].config(state="disabled")
-            self.input_fields[self._get_field_key_from_label("Foreign Rate (%):")].config(state="disabled")
-            self.input_fields[self._get_field_key_from_label("Time to Maturity (Years):")].config(state="disabled")
-        elif selected_model == "Forward Rate":
-            self.input_fields[self._get_field_key_from_label("Amount to Convert:")].config(state="disabled")
-            # Other fields are needed for Forward Rate
+        if selected_model == self._applied_submodel:
+            return
+        enable_keys, disable_keys = self._FIELD_STATES[selected_model]
+        for keys, state in ((enable_keys, "normal"), (disable_keys, "disabled")):
+            for key in keys:
+                if self._field_states.get(key, "normal") != state:
+                    self.input_fields[key].config(state=state)
+                    self._field_states[key] = state
+        self._applied_submodel = selected_model
 
     # --- Widget creation methods for each tool group ---
 
@@ -211,9 +320,7 @@ class GeneralToolsGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text=title)
         frame.grid_columnconfigure(1, weight=1)
 
-        key = self._get_field_key_from_label("Data (comma-separated):")
         self.create_input_row(frame, 0, "Data (comma-separated):", "1,2,3,4,5", "Enter numbers separated by commas (e.g., 1, 2.5, 3).")
-        self.model_field_keys["Descriptive Statistics"] = [key]
         return frame
 
     def _create_linear_regression_widgets(self, parent_frame: ttk.Frame, title: str) -> ttk.LabelFrame:
@@ -221,16 +328,8 @@ class GeneralToolsGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text=title)
         frame.grid_columnconfigure(1, weight=1)
 
-        keys = []
-        key_x = self._get_field_key_from_label("X Data (comma-separated):")
-        key_y = self._get_field_key_from_label("Y Data (comma-separated):")
-
         self.create_input_row(frame, 0, "X Data (comma-separated):", "1,2,3,4,5", "Enter X values separated by commas.")
         self.create_input_row(frame, 1, "Y Data (comma-separated):", "2,4,5,4,5", "Enter Y values separated by commas.")
-        
-        keys.append(key_x)
-        keys.append(key_y)
-        self.model_field_keys["Simple Linear Regression"] = keys
         return frame
 
     def _create_perpetuity_widgets(self, parent_frame: ttk.Frame, title: str) -> ttk.LabelFrame:
@@ -238,20 +337,9 @@ class GeneralToolsGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text=title)
         frame.grid_columnconfigure(1, weight=1)
 
-        keys = []
-        key_pmt = self._get_field_key_from_label("Payment (PMT):")
-        key_dr = self._get_field_key_from_label("Discount Rate (%):")
-        key_gr = self._get_field_key_from_label("Growth Rate (%):")
-
         self.create_input_row(frame, 0, "Payment (PMT):", "100.00", "Regular payment amount.")
         self.create_input_row(frame, 1, "Discount Rate (%):", "5.00", "Discount rate as a percentage (e.g., 5 for 5%).")
         self.create_input_row(frame, 2, "Growth Rate (%):", "2.00", "Growth rate as a percentage (for growing perpetuity, 0 if not growing).")
-        
-        keys.extend([key_pmt, key_dr, key_gr])
-        self.model_field_keys["Perpetuity_Group"] = keys # Use a group key for the shared frame
-        self.model_field_keys["Perpetuity Value"] = [key_pmt, key_dr]
-        self.model_field_keys["Growing Perpetuity Value"] = [key_pmt, key_dr, key_gr]
-
         return frame
 
     def _create_forex_widgets(self, parent_frame: ttk.Frame, title: str) -> ttk.LabelFrame:
@@ -259,13 +347,6 @@ class GeneralToolsGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text=title)
         frame.grid_columnconfigure(1, weight=1)
 
-        keys = []
-        key_amount = self._get_field_key_from_label("Amount to Convert:")
-        key_spot = self._get_field_key_from_label("Spot Rate (From/To):")
-        key_dr = self._get_field_key_from_label("Domestic Rate (%):")
-        key_fr = self._get_field_key_from_label("Foreign Rate (%):")
-        key_time = self._get_field_key_from_label("Time to Maturity (Years):")
-
         self.create_input_row(frame, 0, "Amount to Convert:", "100.00", "Amount in the 'From' currency.")
         self.create_input_row(frame, 1, "Spot Rate (From/To):", "1.10", "e.g., 1.10 for EUR/USD if converting EUR to USD (1 EUR = 1.10 USD).")
         self.create_input_row(frame, 2, "Domestic Rate (%):", "2.00", "Annual interest rate in the domestic currency (e.g., USD).")
@@ -279,19 +360,12 @@ class GeneralToolsGUI(BaseGUI):
         self.current_currency_entry.grid(row=5, column=1, sticky="ew", padx=5, pady=2)
         # Store for state management and value retrieval, using a consistent key format
         self.input_fields["current_currency"] = self.current_currency_entry
-        key_cc = "current_currency" # Manually define key for non-create_input_row fields
 
         ttk.Label(frame, text="Target Currency:").grid(row=6, column=0, sticky="w", padx=5, pady=2)
         self.target_currency_var = tk.StringVar(value="EUR") # Default
         self.target_currency_entry = ttk.Entry(frame, textvariable=self.target_currency_var, width=10)
         self.target_currency_entry.grid(row=6, column=1, sticky="ew", padx=5, pady=2)
         self.input_fields["target_currency"] = self.target_currency_entry
-        key_tc = "target_currency" # Manually define key
-
-        keys.extend([key_amount, key_spot, key_dr, key_fr, key_time, key_cc, key_tc])
-        self.model_field_keys["Forex_Group"] = keys # Use a group key for the shared frame
-        self.model_field_keys["Currency Conversion"] = [key_amount, key_spot, key_cc, key_tc]
-        self.model_field_keys["Forward Rate"] = [key_spot, key_dr, key_fr, key_time, key_cc, key_tc]
 
         return frame
 
@@ -300,17 +374,9 @@ class GeneralToolsGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text=title)
         frame.grid_columnconfigure(1, weight=1)
 
-        keys = []
-        key_value = self._get_field_key_from_label("Value to Convert:")
-        key_from_unit = self._get_field_key_from_label("From Unit:")
-        key_to_unit = self._get_field_key_from_label("To Unit:")
-
         self.create_input_row(frame, 0, "Value to Convert:", "12", "The numeric value to convert.")
         self.create_input_row(frame, 1, "From Unit:", "months", "e.g., 'days', 'weeks', 'months', 'quarters', 'years'.")
         self.create_input_row(frame, 2, "To Unit:", "years", "e.g., 'days', 'weeks', 'months', 'quarters', 'years'.")
-        
-        keys.extend([key_value, key_from_unit, key_to_unit])
-        self.model_field_keys["Time Unit Conversion"] = keys
         return frame
 
 
@@ -328,48 +394,35 @@ class GeneralToolsGUI(BaseGUI):
             return
 
         # Get the specific field keys for the selected model
-        field_keys_for_model = self.model_field_keys.get(selected_model, [])
-        # If the model is part of a group, get its specific keys from the group's definition
-        if not field_keys_for_model:
-            if selected_model in ["Perpetuity Value", "Growing Perpetuity Value"]:
-                field_keys_for_model = self.model_field_keys.get(selected_model, []) # Correctly gets the specific ones
-            elif selected_model in ["Currency Conversion", "Forward Rate"]:
-                field_keys_for_model = self.model_field_keys.get(selected_model, []) # Correctly gets the specific ones
-            
-        if not field_keys_for_model:
+        field_keys_for_model = self.model_field_keys.get(selected_model)
+        if field_keys_for_model is None:
             self.display_result("Internal error: Field keys not found for selected tool.", is_error=True)
-            logger.error(f"Field keys missing for tool: {selected_model}")
+            logger.error("Field keys missing for tool: %s", selected_model)
             return
+        # The tool's inputs live in a lazily built frame; make sure it exists before reading it
+        self._get_tool_frame(self._FRAME_MAP[selected_model][0])
 
         # Prepare a dictionary to hold all validated inputs for the current calculation
         validated_inputs = {}
+        # Keys of the fields entered as percentages for this tool
+        percent_keys = self._PERCENT_KEYS.get(selected_model, frozenset())
+
+        # Read every raw entry string in one pass, so validation below works on plain strings
+        raw_inputs = {key: self.get_input_value(key) for key in field_keys_for_model}
 
         try:
-            # Extract and validate values for relevant fields
-            for key in field_keys_for_model:
-                value_str = self.get_input_value(key)
-                # Fallback to the display label if key not directly from label generation
-                field_name_for_display = key.replace('_', ' ').title() 
-                if key == "current_currency": field_name_for_display = "Current Currency"
-                if key == "target_currency": field_name_for_display = "Target Currency"
-
-                validation_type = 'numeric' # Default
-                # Determine validation type based on key/common patterns
-                if 'data_comma_separated' in key:
-                    validation_type = 'numeric_list'
-                elif 'value_to_convert' in key:
-                    validation_type = 'numeric'
-                elif 'amount_to_convert' in key or 'spot_rate_from_to' in key or \
-                     'payment_pmt' in key:
-                    validation_type = 'positive_numeric_or_zero' # Allow 0 for payment/amount if meaningful
-                elif 'rate' in key or 'time' in key:
-                    validation_type = 'numeric' # Rates/time can be zero, but not necessarily positive
-                elif 'unit' in key or 'currency' in key:
-                    validation_type = 'string_not_empty' # For text fields
+            # Validate the values for the relevant fields
+            for key, value_str in raw_inputs.items():
+                field_name_for_display = self._FIELD_DISPLAY[key]
+
+                validation_type = self._FIELD_VALIDATION[key]
 
                 is_valid, processed_value = None, None
                 if validation_type == 'numeric_list':
                     is_valid, processed_value = self.validate_input_list(value_str, 'numeric', field_name_for_display)
+                    if is_valid:
+                        # Hand the statistics functions a contiguous float64 array rather than a list
+                        processed_value = np.array(processed_value, dtype=np.float64)
                 elif validation_type == 'string_not_empty':
                     if not value_str.strip():
                         is_valid, processed_value = False, f"{field_name_for_display} cannot be empty."
@@ -386,130 +439,185 @@ class GeneralToolsGUI(BaseGUI):
                     return self.display_result(processed_value, is_error=True)
 
                 # Convert percentages to decimals *after* validation
-                if 'rate' in key or 'yield' in key or 'growth_rate' in key and processed_value is not None:
-                    # Apply conversion only if the field value is indeed a percentage
-                    # This check makes sure we don't convert currency codes or other non-percentage numbers
-                    if selected_model in ["Perpetuity Value", "Growing Perpetuity Value", "Forward Rate"]:
-                        if key in [self._get_field_key_from_label("Discount Rate (%):"),
-                                   self._get_field_key_from_label("Growth Rate (%):"),
-                                   self._get_field_key_from_label("Domestic Rate (%):"),
-                                   self._get_field_key_from_label("Foreign Rate (%):")]:
-                            processed_value /= 100.0
+                if key in percent_keys:
+                    processed_value /= 100.0
 
                 validated_inputs[key] = processed_value
             
             # --- Perform Calculation based on selected_model ---
-            if selected_model == "Descriptive Statistics":
-                data_list = validated_inputs.get(self._get_field_key_from_label("Data (comma-separated):"))
-                if not data_list: return self.display_result("Data list cannot be empty.", is_error=True)
-                stats_result = calculate_descriptive_stats(data_list)
-                output_str = "Descriptive Statistics:\n"
-                for stat, value in stats_result.items():
-                    output_str += f"{stat.replace('_', ' ').title()}: {self.format_number_output(value, 4)}\n"
-                self.display_result(output_str.strip())
-            
-            elif selected_model == "Simple Linear Regression":
-                x_data = validated_inputs.get(self._get_field_key_from_label("X Data (comma-separated):"))
-                y_data = validated_inputs.get(self._get_field_key_from_label("Y Data (comma-separated):"))
-
-                if not x_data or not y_data: return self.display_result("X and Y data lists cannot be empty.", is_error=True)
-                if len(x_data) != len(y_data):
-                    self.display_result("X and Y data lists must have the same number of elements.", is_error=True)
-                    return
-                if len(x_data) < 2:
-                    self.display_result("At least two data points are required for linear regression.", is_error=True)
-                    return
-
-                slope, intercept, r_squared = perform_simple_linear_regression(x_data, y_data)
-                result_str = (
-                    f"Simple Linear Regression:\n"
-                    f"Slope (m): {self.format_number_output(slope, 6)}\n"
-                    f"Intercept (b): {self.format_number_output(intercept, 6)}\n"
-                    f"R-squared: {self.format_number_output(r_squared, 6)}"
-                )
-                self.display_result(result_str)
-
-            elif selected_model == "Perpetuity Value":
-                payment = validated_inputs.get(self._get_field_key_from_label("Payment (PMT):"))
-                rate = validated_inputs.get(self._get_field_key_from_label("Discount Rate (%):"))
-                
-                if rate <= 0:
-                    self.display_result("Discount Rate must be positive for Perpetuity Value.", is_error=True)
-                    return
-
-                result = calculate_perpetuity(payment, rate)
-                self.display_result(f"Perpetuity Value: {self.format_currency_output(result)}")
-
-            elif selected_model == "Growing Perpetuity Value":
-                payment = validated_inputs.get(self._get_field_key_from_label("Payment (PMT):"))
-                rate = validated_inputs.get(self._get_field_key_from_label("Discount Rate (%):"))
-                growth_rate = validated_inputs.get(self._get_field_key_from_label("Growth Rate (%):"))
-
-                if rate <= growth_rate:
-                    self.display_result("Discount Rate must be greater than Growth Rate for Growing Perpetuity.", is_error=True)
-                    return
-
-                result = calculate_growing_perpetuity(payment, rate, growth_rate)
-                self.display_result(f"Growing Perpetuity Value: {self.format_currency_output(result)}")
-
-            elif selected_model == "Currency Conversion":
-                amount = validated_inputs.get(self._get_field_key_from_label("Amount to Convert:"))
-                spot_rate = validated_inputs.get(self._get_field_key_from_label("Spot Rate (From/To):"))
-                from_currency = validated_inputs.get("current_currency")
-                to_currency = validated_inputs.get("target_currency")
-
-                converted_amount = convert_currency(amount, spot_rate)
-                self.display_result(f"{self.format_currency_output(amount, currency_symbol=from_currency)} is equal to {self.format_currency_output(converted_amount, currency_symbol=to_currency)}")
-
-            elif selected_model == "Forward Rate":
-                spot_rate = validated_inputs.get(self._get_field_key_from_label("Spot Rate (From/To):"))
-                domestic_rate = validated_inputs.get(self._get_field_key_from_label("Domestic Rate (%):"))
-                foreign_rate = validated_inputs.get(self._get_field_key_from_label("Foreign Rate (%):"))
-                time = validated_inputs.get(self._get_field_key_from_label("Time to Maturity (Years):"))
-                
-                from_currency = validated_inputs.get("current_currency")
-                to_currency = validated_inputs.get("target_currency")
-
-                forward_rate = calculate_forward_rate(spot_rate, domestic_rate, foreign_rate, time)
-                self.display_result(f"Calculated Forward Rate ({from_currency}/{to_currency}): {self.format_number_output(forward_rate, 6)}")
+            handler = self._HANDLERS.get(selected_model)
+            if handler is None:
+                self.display_result("Please select a calculation type.", is_error=True)
+                return
 
-            elif selected_model == "Time Unit Conversion":
-                value = validated_inputs.get(self._get_field_key_from_label("Value to Convert:"))
-                from_unit = validated_inputs.get(self._get_field_key_from_label("From Unit:"))
-                to_unit = validated_inputs.get(self._get_field_key_from_label("To Unit:"))
+            # Run the handler on the worker; Calculate stays disabled until the result is shown
+            self.calculate_button.config(state="disabled")
+            self._calc_generation += 1
+            generation = self._calc_generation
+            future = _CALC_POOL.submit(handler, self, validated_inputs)
+            self.call_when_done(future, self._on_calculation_done, selected_model, generation)
 
-                try:
-                    converted_value = convert_time_periods(value, from_unit, to_unit)
-                    self.display_result(f"{self.format_number_output(value, 4)} {from_unit} is {self.format_number_output(converted_value, 4)} {to_unit}")
-                except ValueError as unit_error:
-                    self.display_result(f"Unit Conversion Error: {unit_error}", is_error=True)
-                    return
+        except Exception as e:
+            self._show_calculation_error(selected_model, e)
 
-            else:
-                self.display_result("Please select a calculation type.", is_error=True)
+    def _on_calculation_done(self, future, selected_model: str, generation: int):
+        """
+        Runs on the Tk thread when the worker finishes: re-enables Calculate and shows the result or error,
+        unless the result is stale (inputs cleared or a newer calculation submitted).
+        """
+        self.calculate_button.config(state="normal")
+        if generation != self._calc_generation:
+            return
+        try:
+            message, is_error = future.result()
+            self.display_result(message, is_error=is_error)
+        except Exception as e:
+            self._show_calculation_error(selected_model, e)
 
-        except ValueError as e:
-            logger.error(f"General Tools Calculation Error (ValueError) for {selected_model}: {e}")
+    def _show_calculation_error(self, selected_model: str, e: Exception):
+        if isinstance(e, ValueError):
+            logger.error("General Tools Calculation Error (ValueError) for %s: %s", selected_model, e)
             self.display_result(f"Calculation Error: {e}", is_error=True)
-        except ZeroDivisionError as e:
-            logger.error(f"General Tools Calculation Error (ZeroDivisionError) for {selected_model}: {e}")
+        elif isinstance(e, ZeroDivisionError):
+            logger.error("General Tools Calculation Error (ZeroDivisionError) for %s: %s", selected_model, e)
             self.display_result(f"Calculation Error: Division by zero. Check inputs.", is_error=True)
-        except Exception as e:
-            logger.critical(f"An unexpected error occurred during General Tools calculation for {selected_model}: {e}", exc_info=True)
+        else:
+            logger.critical("An unexpected error occurred during General Tools calculation for %s: %s", selected_model, e, exc_info=e)
             self.display_result(f"An unexpected error occurred: {e}", is_error=True)
 
+    # --- Per-tool calculation handlers (dispatched through _HANDLERS) ---
+    # Each runs on the calculation worker thread and returns (message, is_error) for display.
+
+    def _run_descriptive_stats(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        try:
+            data_list = _require_numeric_array(validated_inputs.get(_label_to_key("Data (comma-separated):")), "Data list")
+        except ValueError as e:
+            return str(e), True
+        stats_result = _cached_descriptive_stats(data_list.tobytes())
+        return "\n".join([
+            "Descriptive Statistics:",
+            *(f"{_stat_title(stat)}: {self.format_number_output(value, 4)}" for stat, value in stats_result.items()),
+        ]), False
+
+    def _run_linear_regression(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        # Linear regression needs at least two points; reject short input before any array work
+        try:
+            x_data = _require_numeric_array(validated_inputs.get(_label_to_key("X Data (comma-separated):")), "X data list", min_len=2)
+            y_data = _require_numeric_array(validated_inputs.get(_label_to_key("Y Data (comma-separated):")), "Y data list", min_len=2)
+        except ValueError as e:
+            return str(e), True
+
+        if x_data.size != y_data.size:
+            return "X and Y data lists must have the same number of elements.", True
+
+        regression = _cached_linear_regression(x_data.tobytes(), y_data.tobytes())
+        result_str = (
+            f"Simple Linear Regression:\n"
+            f"Slope (m): {self.format_number_output(regression['slope'], 6)}\n"
+            f"Intercept (b): {self.format_number_output(regression['intercept'], 6)}\n"
+            f"R-squared: {self.format_number_output(regression['r_squared'], 6)}"
+        )
+        return result_str, False
+
+    def _run_perpetuity(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        payment = validated_inputs.get(_label_to_key("Payment (PMT):"))
+        rate = validated_inputs.get(_label_to_key("Discount Rate (%):"))
+        
+        if rate <= 0:
+            return "Discount Rate must be positive for Perpetuity Value.", True
+
+        result = _cached_perpetuity(payment, rate)
+        return f"Perpetuity Value: {self.format_currency_output(result)}", False
+
+    def _run_growing_perpetuity(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        payment = validated_inputs.get(_label_to_key("Payment (PMT):"))
+        rate = validated_inputs.get(_label_to_key("Discount Rate (%):"))
+        growth_rate = validated_inputs.get(_label_to_key("Growth Rate (%):"))
+
+        if rate <= growth_rate:
+            return "Discount Rate must be greater than Growth Rate for Growing Perpetuity.", True
+
+        result = _cached_growing_perpetuity(payment, rate, growth_rate)
+        return f"Growing Perpetuity Value: {self.format_currency_output(result)}", False
+
+    def _run_currency_conversion(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        amount = validated_inputs.get(_label_to_key("Amount to Convert:"))
+        spot_rate = validated_inputs.get(_label_to_key("Spot Rate (From/To):"))
+        from_currency = validated_inputs.get("current_currency")
+        to_currency = validated_inputs.get("target_currency")
+
+        converted_amount = _cached_convert_currency(amount, spot_rate)
+        return f"{self.format_currency_output(amount, currency_symbol=from_currency)} is equal to {self.format_currency_output(converted_amount, currency_symbol=to_currency)}", False
+
+    def _run_forward_rate(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        spot_rate = validated_inputs.get(_label_to_key("Spot Rate (From/To):"))
+        domestic_rate = validated_inputs.get(_label_to_key("Domestic Rate (%):"))
+        foreign_rate = validated_inputs.get(_label_to_key("Foreign Rate (%):"))
+        time = validated_inputs.get(_label_to_key("Time to Maturity (Years):"))
+        
+        from_currency = validated_inputs.get("current_currency")
+        to_currency = validated_inputs.get("target_currency")
+
+        forward_rate = _cached_forward_rate(spot_rate, domestic_rate, foreign_rate, time)
+        return f"Calculated Forward Rate ({from_currency}/{to_currency}): {self.format_number_output(forward_rate, 6)}", False
+
+    def _run_time_unit_conversion(self, validated_inputs: Dict[str, Any]) -> Tuple[str, bool]:
+        value = validated_inputs.get(_label_to_key("Value to Convert:"))
+        from_unit = validated_inputs.get(_label_to_key("From Unit:"))
+        to_unit = validated_inputs.get(_label_to_key("To Unit:"))
+
+        try:
+            converted_value = _cached_convert_time_periods(value, from_unit, to_unit)
+            return f"{self.format_number_output(value, 4)} {from_unit} is {self.format_number_output(converted_value, 4)} {to_unit}", False
+        except ValueError as unit_error:
+            return f"Unit Conversion Error: {unit_error}", True
+
+    # Tool -> (model_input_frames key, optional state updater for shared frames)
+    _FRAME_MAP = {
+        "Descriptive Statistics": ("Descriptive Statistics", None),
+        "Simple Linear Regression": ("Simple Linear Regression", None),
+        "Perpetuity Value": ("Perpetuity_Group", _update_shared_frame_states),
+        "Growing Perpetuity Value": ("Perpetuity_Group", _update_shared_frame_states),
+        "Currency Conversion": ("Forex_Group", _update_shared_frame_states),
+        "Forward Rate": ("Forex_Group", _update_shared_frame_states),
+        "Time Unit Conversion": ("Time Unit Conversion", None),
+    }
+
+    # Tool -> calculation handler, called as handler(self, validated_inputs)
+    _HANDLERS = {
+        "Descriptive Statistics": _run_descriptive_stats,
+        "Simple Linear Regression": _run_linear_regression,
+        "Perpetuity Value": _run_perpetuity,
+        "Growing Perpetuity Value": _run_growing_perpetuity,
+        "Currency Conversion": _run_currency_conversion,
+        "Forward Rate": _run_forward_rate,
+        "Time Unit Conversion": _run_time_unit_conversion,
+    }
+
     def clear_inputs(self):
         """
         Overrides BaseGUI's clear_inputs to also reset the model selection,
         and currency fields, then updates the UI state.
         """
         super().clear_inputs()
+        self._calc_generation += 1 # A calculation still running must not overwrite the cleared display
+        for backend in _CACHED_BACKENDS:
+            backend.cache_clear()
         self.selected_model_var.set("Select a Tool") # Reset combobox
-        # Reset the manually added currency fields
-        self.current_currency_var.set("USD")
-        self.target_currency_var.set("EUR")
+        # Reset the manually added currency fields (only present once the Forex frame is built)
+        if "Forex_Group" in self.model_input_frames:
+            self.current_currency_var.set("USD")
+            self.target_currency_var.set("EUR")
         self._on_model_selected() # Trigger UI update to hide frames and clear messages
 
+    def destroy(self):
+        # Release the combobox binding's Tcl command and any pending selection callback
+        self.model_combobox.unbind("<<ComboboxSelected>>", self._combobox_bind_id)
+        if self._pending_select is not None:
+            self.after_cancel(self._pending_select)
+            self._pending_select = None
+        super().destroy()
+
 # Example usage (for testing GeneralToolsGUI in isolation if desired)
 if __name__ == "__main__":
     root = tk.Tk()
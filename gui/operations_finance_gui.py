@@ -3,8 +3,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Dict, List, Any, Tuple
+import functools
+from enum import IntEnum
+from typing import Dict, List, Tuple, Union
 import re # Used for field key generation consistency
+import numpy as np
 
 # Import BaseGUI for inheritance
 from .base_gui import BaseGUI
@@ -15,7 +18,7 @@ try:
         calculate_eoq,
         calculate_reorder_point,
         calculate_newsvendor_optimal_quantity,
-        calculate_cascaded_pricing_protection_levels
+        calculate_cascaded_pricing_protection_levels_arrays
     )
 except ImportError:
     logging.error("Could not import operations_finance_models.py. Ensure it's in mathematical_functions and correct.")
@@ -29,18 +32,105 @@ except ImportError:
     def calculate_newsvendor_optimal_quantity(*args, **kwargs):
         logging.warning("Dummy calculate_newsvendor_optimal_quantity called.")
         return {"error": "Mathematical function not found."}
-    def calculate_cascaded_pricing_protection_levels(*args, **kwargs):
-        logging.warning("Dummy calculate_cascaded_pricing_protection_levels called.")
+    def calculate_cascaded_pricing_protection_levels_arrays(*args, **kwargs):
+        logging.warning("Dummy calculate_cascaded_pricing_protection_levels_arrays called.")
         return {"error": "Mathematical function not found."}
 
 # Import validation functions from utils
-from utils.validation import validate_newsvendor_demand_params, validate_fare_classes
+from utils.validation import validate_newsvendor_demand_params, validate_unique_prices, validate_numeric_array
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Field-key patterns, compiled once instead of on every _get_field_key_from_label call
+_FC_SUFFIX_RE = re.compile(r"(.*)(_fc\d+)$")
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Whole-unit quantities in result text. The format method is bound once, so each result line skips
+# rebuilding and re-parsing a format spec as format_number_output(value, 0) does.
+_UNITS_FORMAT = "{:,.0f}".format
+
+def _format_units(value: Union[float, int]) -> str:
+    """Formats a quantity with no decimals, with the same invalid-number fallback as format_number."""
+    try:
+        return _UNITS_FORMAT(value)
+    except (ValueError, TypeError) as e:
+        logger.error(f"Error formatting number {value}: {e}")
+        return "Error: Invalid Number"
+
+class _Field(IntEnum):
+    """Index of each fixed Operations Finance input field in OperationsFinanceGUI._widgets."""
+    EOQ_ANNUAL_DEMAND = 0
+    EOQ_ORDERING_COST = 1
+    EOQ_HOLDING_COST = 2
+    ROP_DAILY_DEMAND = 3
+    ROP_LEAD_TIME = 4
+    ROP_SERVICE_LEVEL = 5
+    ROP_STD_DEV = 6
+    NV_COST_UNDERSTOCK = 7
+    NV_COST_OVERSTOCK = 8
+    NV_DEMAND_MEAN = 9
+    NV_DEMAND_STD_DEV = 10
+    NV_DEMAND_MIN = 11
+    NV_DEMAND_MAX = 12
+    TOTAL_CAPACITY = 13
+
+# input_fields key that create_input_row derives from each _Field's label, indexed by _Field
+_FIELD_KEYS = (
+    "annual_demand_d",
+    "ordering_cost_per_order_s",
+    "holding_cost_per_unit_per_year_h",
+    "average_daily_demand",
+    "lead_time_days",
+    "desired_service_level",
+    "std_dev_of_daily_demand",
+    "cost_of_understocking_cu",
+    "cost_of_overstocking_co",
+    "mean_demand_newsvendor",
+    "standard_deviation_of_demand_newsvendor",
+    "min_demand_newsvendor",
+    "max_demand_newsvendor",
+    "total_capacity",
+)
+assert len(_FIELD_KEYS) == len(_Field), "_FIELD_KEYS must have one key per _Field"
+
+# (field, display name, validation type) for each model's fixed inputs, in validation order
+_EOQ_FIELDS = (
+    (_Field.EOQ_ANNUAL_DEMAND, "Annual Demand (D)", "positive_numeric"),
+    (_Field.EOQ_ORDERING_COST, "Ordering Cost per Order (S)", "positive_numeric"),
+    (_Field.EOQ_HOLDING_COST, "Holding Cost per Unit per Year (H)", "positive_numeric"),
+)
+_ROP_FIELDS = (
+    (_Field.ROP_DAILY_DEMAND, "Average Daily Demand", "non_negative_numeric"),
+    (_Field.ROP_LEAD_TIME, "Lead Time (Days)", "non_negative_numeric"),
+    (_Field.ROP_SERVICE_LEVEL, "Desired Service Level (%)", "numeric_range_0_100"),
+    (_Field.ROP_STD_DEV, "Std Dev of Daily Demand", "non_negative_numeric"),
+)
+# (validation type, display name) for each fare class's price, demand mean and demand std dev
+_FARE_CLASS_FIELD_CHECKS = (
+    ("positive_numeric", "Price"),
+    ("non_negative_numeric", "Demand Mean"),
+    ("non_negative_numeric", "Demand Std Dev"),
+)
+# validate_numeric_array constraint for each fare class column, in the same order
+_FARE_CLASS_ARRAY_CONSTRAINTS = ('positive', 'non_negative', 'non_negative')
+_NEWSVENDOR_COST_FIELDS = (
+    (_Field.NV_COST_UNDERSTOCK, "Cost of Understocking (Cu)", "positive_numeric"),
+    (_Field.NV_COST_OVERSTOCK, "Cost of Overstocking (Co)", "positive_numeric"),
+)
+# Newsvendor demand type -> (model demand_type, ((param name, field, display name), ...))
+_NEWSVENDOR_DEMAND_FIELDS = {
+    "Normal Distribution": ("normal", (
+        ("mean", _Field.NV_DEMAND_MEAN, "Mean Demand"),
+        ("std_dev", _Field.NV_DEMAND_STD_DEV, "Standard Deviation of Demand"),
+    )),
+    "Uniform Distribution": ("uniform", (
+        ("min", _Field.NV_DEMAND_MIN, "Min Demand"),
+        ("max", _Field.NV_DEMAND_MAX, "Max Demand"),
+    )),
+}
 
 class OperationsFinanceGUI(BaseGUI):
     """
@@ -48,6 +138,15 @@ class OperationsFinanceGUI(BaseGUI):
     Newsvendor, and Cascaded Pricing.
     Inherits from BaseGUI for common functionalities.
     """
+    # Combobox choices, shared by every instance
+    _MODEL_OPTIONS = (
+        "Economic Order Quantity (EOQ)",
+        "Reorder Point (ROP)",
+        "Newsvendor Model",
+        "Cascaded Pricing (Revenue Management)",
+    )
+    _NEWSVENDOR_DEMAND_OPTIONS = ("Normal Distribution", "Uniform Distribution")
+
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
 
@@ -57,7 +156,25 @@ class OperationsFinanceGUI(BaseGUI):
         self.scrollable_frame.grid_columnconfigure(1, weight=1)
 
         self.selected_model_var = tk.StringVar(value="Select a Model")
-        self.model_input_frames: Dict[str, ttk.LabelFrame] = {} # To hold all model-specific frames
+        self.model_input_frames: Dict[str, ttk.LabelFrame] = {} # Model frames built so far, by model name
+        # Direct Entry references indexed by _Field; None until the owning model frame is built
+        self._widgets: List[Union[ttk.Entry, None]] = [None] * len(_Field)
+        # Created here rather than with the Newsvendor frame, so clear_inputs can reset it before that frame exists
+        self.newsvendor_demand_type_var = tk.StringVar(value="Normal Distribution")
+        # after() ids of debounced combobox selections not yet applied
+        self._pending_model_select = None
+        self._pending_demand_select = None
+
+        # Specific members for Cascaded Pricing dynamic inputs
+        # Kept as parallel lists (one per field), indexed by fare class position
+        self._fc_price_vars: List[tk.StringVar] = []
+        self._fc_mean_vars: List[tk.StringVar] = []
+        self._fc_std_vars: List[tk.StringVar] = []
+        self._fc_frames: List[ttk.LabelFrame] = []
+        self._fc_field_keys: List[Tuple[str, str, str]] = [] # (price, demand mean, demand std dev) input-field keys
+        self._next_fare_class_id = 1 # Input-key suffix for the next fare class frame built; never reused
+        self._fc_pool: List[tuple] = [] # Unpacked fare class frames ready for reuse (see _build_fare_class_frame)
+        self._pending_fc_prewarm = None
 
         self._create_model_selection_widgets(self.scrollable_frame, start_row=1)
         self._create_all_model_input_widgets(start_row=2)
@@ -67,10 +184,6 @@ class OperationsFinanceGUI(BaseGUI):
         self.calculate_button.config(text="Calculate", command=self.calculate_selected_model)
         logger.info("OperationsFinanceGUI initialized.")
 
-        # Specific members for Cascaded Pricing dynamic inputs
-        self.fare_class_entries: List[Dict[str, Any]] = [] # Stores Tkinter vars and frames for dynamic fare classes
-        self.fare_class_frames: List[ttk.LabelFrame] = [] # Stores just the frames for easier destruction
-
     def _create_model_selection_widgets(self, parent_frame: ttk.Frame, start_row: int):
         """Creates the dropdown for selecting the specific Operations Finance model."""
         model_select_frame = ttk.LabelFrame(parent_frame, text="Select Operations Finance Model")
@@ -79,74 +192,93 @@ class OperationsFinanceGUI(BaseGUI):
 
         ttk.Label(model_select_frame, text="Model:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
 
-        self.model_options = [
-            "Economic Order Quantity (EOQ)",
-            "Reorder Point (ROP)",
-            "Newsvendor Model",
-            "Cascaded Pricing (Revenue Management)"
-        ]
         self.model_combobox = ttk.Combobox(
             model_select_frame,
             textvariable=self.selected_model_var,
-            values=self.model_options,
+            values=self._MODEL_OPTIONS,
             state="readonly"
         )
         self.model_combobox.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         self.model_combobox.bind("<<ComboboxSelected>>", self._on_model_selected)
 
     def _create_all_model_input_widgets(self, start_row: int):
-        """Creates all input fields and frames for each model, keeps them hidden."""
-        parent_for_models = self.scrollable_frame
-
-        # EOQ Inputs
-        self.model_input_frames["Economic Order Quantity (EOQ)"] = self._create_eoq_widgets(parent_for_models)
-        self.model_input_frames["Economic Order Quantity (EOQ)"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # ROP Inputs
-        self.model_input_frames["Reorder Point (ROP)"] = self._create_rop_widgets(parent_for_models)
-        self.model_input_frames["Reorder Point (ROP)"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Newsvendor Inputs
-        self.model_input_frames["Newsvendor Model"] = self._create_newsvendor_widgets(parent_for_models)
-        self.model_input_frames["Newsvendor Model"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-        # Cascaded Pricing Inputs
-        self.model_input_frames["Cascaded Pricing (Revenue Management)"] = self._create_cascaded_pricing_widgets(parent_for_models)
-        self.model_input_frames["Cascaded Pricing (Revenue Management)"].grid(row=start_row, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
+        """
+        Registers the frame factory for each model. Frames are built on first selection
+        (see _get_model_frame), so startup does not lay out inputs for models never used.
+        """
+        self._frame_factories = {
+            "Economic Order Quantity (EOQ)": self._create_eoq_widgets,
+            "Reorder Point (ROP)": self._create_rop_widgets,
+            "Newsvendor Model": self._create_newsvendor_widgets,
+            "Cascaded Pricing (Revenue Management)": self._create_cascaded_pricing_widgets,
+        }
+        # All model frames live in one holder cell; only the visible one is gridded
+        self._models_holder = ttk.Frame(self.scrollable_frame)
+        self._models_holder.grid(row=start_row, column=0, columnspan=2, sticky="nsew")
+        self._models_holder.grid_columnconfigure(0, weight=1)
+        self._visible_model_frame = None
 
         self.result_frame.grid(row=start_row + 1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
         self.common_buttons_frame.grid(row=start_row + 2, column=0, columnspan=2, pady=5)
 
 
+    def _get_model_frame(self, model_name: str) -> Union[ttk.LabelFrame, None]:
+        """Returns the input frame for model_name, building and caching it on first use."""
+        frame = self.model_input_frames.get(model_name)
+        if frame is None and model_name in self._frame_factories:
+            frame = self.model_input_frames[model_name] = self._frame_factories[model_name](self._models_holder)
+            input_fields = self.input_fields
+            for field in _Field:
+                if self._widgets[field] is None and _FIELD_KEYS[field] in input_fields:
+                    self._widgets[field] = input_fields[_FIELD_KEYS[field]]
+            # Grid once so Tk remembers the options, then hide; later shows are a bare grid()
+            frame.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
+            frame.grid_remove()
+            logger.debug("Built Operations Finance input frame on first use: %s", model_name)
+        return frame
+
     def _hide_all_input_frames(self):
-        """Hides all model-specific input frames."""
-        for frame in self.model_input_frames.values():
-            frame.grid_forget()
+        """Hides the visible model-specific input frame, if any."""
+        if self._visible_model_frame is not None:
+            self._visible_model_frame.grid_remove()
+            self._visible_model_frame = None
         self.display_result("Select a model to view its inputs and calculate.", is_error=False)
 
     def _on_model_selected(self, event=None):
-        """Callback when a model is selected from the combobox."""
-        selected_model = self.selected_model_var.get()
+        """
+        Callback when a model is selected from the combobox. Coalesces rapid selections
+        (e.g. keyboarding through the dropdown) so only the last one is applied, 50 ms later.
+        """
+        if self._pending_model_select is not None:
+            self.after_cancel(self._pending_model_select)
+        self._pending_model_select = self.after(50, self._apply_model_selection, self.selected_model_var.get())
+
+    def _apply_model_selection(self, selected_model: str):
+        """Shows the input frame for selected_model, building it on first use."""
+        self._pending_model_select = None
         logger.info(f"Selected Operations Finance model: {selected_model}")
         self._hide_all_input_frames()
-        if selected_model in self.model_input_frames:
-            self.model_input_frames[selected_model].grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        model_frame = self._get_model_frame(selected_model)
+        if model_frame is not None:
+            model_frame.grid()
+            self._visible_model_frame = model_frame
             # If Cascaded Pricing, ensure at least two fare classes are present (or desired minimum)
             if selected_model == "Cascaded Pricing (Revenue Management)":
-                if not self.fare_class_entries: # Only add if none exist
+                if not self._fc_frames: # Only add if none exist
                     self.add_fare_class_inputs()
                     self.add_fare_class_inputs()
-                self._update_cascaded_pricing_fare_class_numbers() # Re-label if needed
         else:
             self.display_result("Please select a valid model.", is_error=True)
             logger.error(f"Invalid model selected: {selected_model}")
 
-    def _get_field_key_from_label(self, label_text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _get_field_key_from_label(label_text: str) -> str:
         """
         Generates a consistent key from a label text, handling suffixes for dynamic fields.
+        Memoized, since the same labels are converted on every calculation.
         """
-        match = re.match(r"(.*)(_fc\d+)$", label_text)
+        match = _FC_SUFFIX_RE.match(label_text)
         if match:
             base_label = match.group(1)
             suffix_part = match.group(2)
@@ -155,10 +287,26 @@ class OperationsFinanceGUI(BaseGUI):
             suffix_part = ""
 
         field_key = base_label.lower()
-        field_key = re.sub(r'[^a-z0-9]+', ' ', field_key).strip()
+        field_key = _NON_ALNUM_RE.sub(' ', field_key).strip()
         field_key = field_key.replace(' ', '_') + suffix_part
         return field_key
 
+    def _validate_fields(self, field_specs: Tuple[Tuple[_Field, str, str], ...]) -> Union[List[float], None]:
+        """
+        Validates the (field, display name, validation type) inputs in order. Returns their
+        values, or shows the first validation error and returns None.
+        """
+        values = []
+        widgets = self._widgets
+        validate_input = self.validate_input
+        for field, label, vtype in field_specs:
+            is_valid, processed_value = validate_input(widgets[field].get(), vtype, label)
+            if not is_valid:
+                self.display_result(processed_value, is_error=True)
+                return None
+            values.append(processed_value)
+        return values
+
     # --- EOQ Widgets and Calculation ---
     def _create_eoq_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
         """Creates the input fields for the EOQ model."""
@@ -176,27 +324,10 @@ class OperationsFinanceGUI(BaseGUI):
 
     def _calculate_eoq_model(self):
         """Calculates EOQ and displays results."""
-        fields = {
-            "annual_demand_d": {"label": "Annual Demand (D):", "type": "positive_numeric"},
-            "ordering_cost_per_order_s": {"label": "Ordering Cost per Order (S):", "type": "positive_numeric"},
-            "holding_cost_per_unit_per_year_h": {"label": "Holding Cost per Unit per Year (H):", "type": "positive_numeric"},
-        }
-        validated_inputs = {}
-        all_valid = True
-        for key, info in fields.items():
-            value_str = self.get_input_value(key)
-            is_valid, processed_value = self.validate_input(value_str, info["type"], info["label"].replace(":", ""))
-            if not is_valid:
-                self.display_result(processed_value, is_error=True)
-                all_valid = False
-                break
-            validated_inputs[key] = processed_value
-        if not all_valid:
+        values = self._validate_fields(_EOQ_FIELDS)
+        if values is None:
             return
-
-        D = validated_inputs["annual_demand_d"]
-        S = validated_inputs["ordering_cost_per_order_s"]
-        H = validated_inputs["holding_cost_per_unit_per_year_h"]
+        D, S, H = values
 
         result = calculate_eoq(annual_demand=D, ordering_cost_per_order=S, holding_cost_per_unit_per_year=H)
 
@@ -204,7 +335,7 @@ class OperationsFinanceGUI(BaseGUI):
             self.display_result(result["error"], is_error=True)
         else:
             result_text = (
-                f"Optimal Order Quantity (EOQ): {self.format_number_output(result['eoq'], 0)} units\n"
+                f"Optimal Order Quantity (EOQ): {_format_units(result['eoq'])} units\n"
                 f"Total Annual Cost: {self.format_currency_output(result['total_annual_cost'])}"
             )
             self.display_result(result_text)
@@ -228,29 +359,10 @@ class OperationsFinanceGUI(BaseGUI):
 
     def _calculate_rop_model(self):
         """Calculates ROP and displays results."""
-        fields = {
-            "average_daily_demand": {"label": "Average Daily Demand:", "type": "non_negative_numeric"},
-            "lead_time_days": {"label": "Lead Time (Days):", "type": "non_negative_numeric"},
-            "desired_service_level": {"label": "Desired Service Level (%):", "type": "numeric_range_0_100"},
-            "std_dev_of_daily_demand": {"label": "Std Dev of Daily Demand:", "type": "non_negative_numeric"},
-        }
-        validated_inputs = {}
-        all_valid = True
-        for key, info in fields.items():
-            value_str = self.get_input_value(key)
-            is_valid, processed_value = self.validate_input(value_str, info["type"], info["label"].replace(":", ""))
-            if not is_valid:
-                self.display_result(processed_value, is_error=True)
-                all_valid = False
-                break
-            validated_inputs[key] = processed_value
-        if not all_valid:
+        values = self._validate_fields(_ROP_FIELDS)
+        if values is None:
             return
-
-        daily_demand = validated_inputs["average_daily_demand"]
-        lead_time_days = validated_inputs["lead_time_days"]
-        service_level_percent = validated_inputs["desired_service_level"]
-        std_dev_daily_demand = validated_inputs["std_dev_of_daily_demand"]
+        daily_demand, lead_time_days, service_level_percent, std_dev_daily_demand = values
 
         # Convert service level percentage to a fraction (0 to 1) for the model
         service_level = service_level_percent / 100.0
@@ -266,8 +378,8 @@ class OperationsFinanceGUI(BaseGUI):
             self.display_result(result["error"], is_error=True)
         else:
             result_text = (
-                f"Reorder Point (ROP): {self.format_number_output(result['reorder_point'], 0)} units\n"
-                f"Calculated Safety Stock: {self.format_number_output(result['safety_stock'], 0)} units"
+                f"Reorder Point (ROP): {_format_units(result['reorder_point'])} units\n"
+                f"Calculated Safety Stock: {_format_units(result['safety_stock'])} units"
             )
             self.display_result(result_text)
 
@@ -294,12 +406,10 @@ class OperationsFinanceGUI(BaseGUI):
         row_idx += 1 # Increment row_idx for the next set of widgets (demand parameters)
 
         ttk.Label(demand_type_frame, text="Select Type:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.newsvendor_demand_type_var = tk.StringVar(value="Normal Distribution")
-        newsvendor_demand_options = ["Normal Distribution", "Uniform Distribution"]
         self.newsvendor_demand_combobox = ttk.Combobox(
             demand_type_frame,
             textvariable=self.newsvendor_demand_type_var,
-            values=newsvendor_demand_options,
+            values=self._NEWSVENDOR_DEMAND_OPTIONS,
             state="readonly"
         )
         self.newsvendor_demand_combobox.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
@@ -308,7 +418,6 @@ class OperationsFinanceGUI(BaseGUI):
 
         # Demand Parameters Containers (hidden initially)
         self.newsvendor_demand_frames: Dict[str, ttk.LabelFrame] = {}
-        self.newsvendor_demand_field_keys: Dict[str, List[str]] = {} # To keep track of keys for dynamic validation
 
         # Create and grid both demand type frames, then immediately hide them.
         # Store their intended grid row for later display.
@@ -328,7 +437,7 @@ class OperationsFinanceGUI(BaseGUI):
         self._hide_all_newsvendor_demand_frames() # Hide all initially
 
         # Show the default selected one (Normal Distribution) using its stored row
-        self._on_newsvendor_demand_type_selected(initial_call=True)
+        self._apply_newsvendor_demand_type(initial_call=True)
 
         return frame
 
@@ -337,11 +446,18 @@ class OperationsFinanceGUI(BaseGUI):
         for frame in self.newsvendor_demand_frames.values():
             frame.grid_forget()
 
-    def _on_newsvendor_demand_type_selected(self, event=None, initial_call=False):
+    def _on_newsvendor_demand_type_selected(self, event=None):
         """
         Callback when a Newsvendor demand type is selected from the combobox.
-        Hides all demand parameter frames and displays the selected one at a fixed row.
+        Debounced like _on_model_selected; the last selection is applied 50 ms later.
         """
+        if self._pending_demand_select is not None:
+            self.after_cancel(self._pending_demand_select)
+        self._pending_demand_select = self.after(50, self._apply_newsvendor_demand_type)
+
+    def _apply_newsvendor_demand_type(self, initial_call=False):
+        """Hides all demand parameter frames and displays the selected one at a fixed row."""
+        self._pending_demand_select = None
         selected_type = self.newsvendor_demand_type_var.get()
         self._hide_all_newsvendor_demand_frames()
 
@@ -365,17 +481,13 @@ class OperationsFinanceGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text="Normal Distribution Demand Inputs")
         frame.grid_columnconfigure(1, weight=1)
 
-        field_keys = []
         row_idx = 0
         self.create_input_row(frame, row_idx, "Mean Demand (μ)_newsvendor:", "1000", "Average demand expected.")
-        field_keys.append(self._get_field_key_from_label("Mean Demand (μ)_newsvendor:"))
         row_idx += 1
 
         self.create_input_row(frame, row_idx, "Standard Deviation of Demand (σ)_newsvendor:", "100", "Variability of demand.")
-        field_keys.append(self._get_field_key_from_label("Standard Deviation of Demand (σ)_newsvendor:"))
         row_idx += 1
 
-        self.newsvendor_demand_field_keys["Normal Distribution"] = field_keys
         return frame
 
     def _create_uniform_demand_widgets_newsvendor(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
@@ -383,72 +495,44 @@ class OperationsFinanceGUI(BaseGUI):
         frame = ttk.LabelFrame(parent_frame, text="Uniform Distribution Demand Inputs")
         frame.grid_columnconfigure(1, weight=1)
 
-        field_keys = []
         row_idx = 0
         self.create_input_row(frame, row_idx, "Min Demand_newsvendor:", "800", "Minimum possible demand.")
-        field_keys.append(self._get_field_key_from_label("Min Demand_newsvendor:"))
         row_idx += 1
 
         self.create_input_row(frame, row_idx, "Max Demand_newsvendor:", "1200", "Maximum possible demand.")
-        field_keys.append(self._get_field_key_from_label("Max Demand_newsvendor:"))
         row_idx += 1
 
-        self.newsvendor_demand_field_keys["Uniform Distribution"] = field_keys
         return frame
 
     def _calculate_newsvendor_model(self):
         """Calculates Newsvendor optimal quantity and displays results."""
-        cu_key = self._get_field_key_from_label("Cost of Understocking (Cu):")
-        co_key = self._get_field_key_from_label("Cost of Overstocking (Co):")
+        display_result = self.display_result
+        widgets = self._widgets
 
         # Validate core costs first
-        is_valid_cu, cu = self.validate_input(self.get_input_value(cu_key), 'positive_numeric', "Cost of Understocking (Cu)")
-        is_valid_co, co = self.validate_input(self.get_input_value(co_key), 'positive_numeric', "Cost of Overstocking (Co)")
-
-        if not is_valid_cu:
-            self.display_result(cu, is_error=True)
-            return
-        if not is_valid_co:
-            self.display_result(co, is_error=True)
+        costs = self._validate_fields(_NEWSVENDOR_COST_FIELDS)
+        if costs is None:
             return
+        cu, co = costs
 
         selected_demand_type = self.newsvendor_demand_type_var.get()
-        demand_params_raw = {}
-        all_demand_valid = True
-
-        if selected_demand_type == "Normal Distribution":
-            mean_key = self._get_field_key_from_label("Mean Demand (μ)_newsvendor:")
-            std_dev_key = self._get_field_key_from_label("Standard Deviation of Demand (σ)_newsvendor:")
-
-            is_valid_mean, mean_val = self.validate_input(self.get_input_value(mean_key), 'non_negative_numeric', "Mean Demand")
-            is_valid_std_dev, std_dev_val = self.validate_input(self.get_input_value(std_dev_key), 'non_negative_numeric', "Standard Deviation of Demand")
-
-            if not is_valid_mean: all_demand_valid = False; self.display_result(mean_val, is_error=True); return
-            if not is_valid_std_dev: all_demand_valid = False; self.display_result(std_dev_val, is_error=True); return
-
-            demand_params_raw = {'mean': mean_val, 'std_dev': std_dev_val}
-            demand_type_for_func = "normal"
-
-        elif selected_demand_type == "Uniform Distribution":
-            min_key = self._get_field_key_from_label("Min Demand_newsvendor:")
-            max_key = self._get_field_key_from_label("Max Demand_newsvendor:")
-
-            is_valid_min, min_val = self.validate_input(self.get_input_value(min_key), 'non_negative_numeric', "Min Demand")
-            is_valid_max, max_val = self.validate_input(self.get_input_value(max_key), 'non_negative_numeric', "Max Demand")
-
-            if not is_valid_min: all_demand_valid = False; self.display_result(min_val, is_error=True); return
-            if not is_valid_max: all_demand_valid = False; self.display_result(max_val, is_error=True); return
+        if selected_demand_type not in _NEWSVENDOR_DEMAND_FIELDS:
+            display_result("Please select a valid demand type for Newsvendor.", is_error=True)
+            return
+        demand_type_for_func, param_fields = _NEWSVENDOR_DEMAND_FIELDS[selected_demand_type]
 
-            demand_params_raw = {'min': min_val, 'max': max_val}
-            demand_type_for_func = "uniform"
-        else:
-            self.display_result("Please select a valid demand type for Newsvendor.", is_error=True)
+        # Check all demand parameters in one vectorized pass
+        raw_values = [widgets[field].get() for _, field, _ in param_fields]
+        is_valid, param_values = validate_numeric_array(raw_values, 'non_negative', [name for _, _, name in param_fields])
+        if not is_valid:
+            display_result(param_values, is_error=True)
             return
+        demand_params_raw = dict(zip((param for param, _, _ in param_fields), param_values.tolist()))
 
         # Validate demand parameters using the model's internal validation function
         is_demand_params_valid, demand_params_processed = validate_newsvendor_demand_params(demand_type_for_func, demand_params_raw)
         if not is_demand_params_valid:
-            self.display_result(demand_params_processed, is_error=True) # `demand_params_processed` holds the error message here
+            display_result(demand_params_processed, is_error=True) # `demand_params_processed` holds the error message here
             return
 
         result = calculate_newsvendor_optimal_quantity(
@@ -459,19 +543,19 @@ class OperationsFinanceGUI(BaseGUI):
         )
 
         if "error" in result:
-            self.display_result(result["error"], is_error=True)
+            display_result(result["error"], is_error=True)
         else:
-            result_text = (
-                f"Critical Ratio: {self.format_percentage_output(result['critical_ratio'])}\n"
-                f"Optimal Order Quantity: {self.format_number_output(result['optimal_quantity'], 0)} units\n"
-            )
+            result_lines = [
+                f"Critical Ratio: {self.format_percentage_output(result['critical_ratio'])}",
+                f"Optimal Order Quantity: {_format_units(result['optimal_quantity'])} units",
+            ]
             # Only show expected leftover/stockout if they are non-None
             if result.get('expected_leftover') is not None:
-                result_text += f"Expected Leftover: {self.format_number_output(result['expected_leftover'], 0)} units\n"
+                result_lines.append(f"Expected Leftover: {_format_units(result['expected_leftover'])} units")
             if result.get('expected_stockout') is not None:
-                result_text += f"Expected Stockout: {self.format_number_output(result['expected_stockout'], 0)} units"
+                result_lines.append(f"Expected Stockout: {_format_units(result['expected_stockout'])} units")
 
-            self.display_result(result_text)
+            display_result("\n".join(result_lines))
 
     # --- Cascaded Pricing Widgets and Calculation ---
     def _create_cascaded_pricing_widgets(self, parent_frame: ttk.Frame) -> ttk.LabelFrame:
@@ -499,178 +583,167 @@ class OperationsFinanceGUI(BaseGUI):
         self.fare_classes_container.grid(row=row_idx, column=0, columnspan=2, padx=5, pady=5, sticky="nsew")
         self.fare_classes_container.grid_columnconfigure(1, weight=1)
         # No row_idx increment here as its content is managed by pack, not grid, relative to this frame.
+        self._pending_fc_prewarm = self.after_idle(self._prewarm_fare_class_pool)
         return frame
 
-    def add_fare_class_inputs(self):
-        """Dynamically adds a new set of input fields for a fare class."""
-        fare_class_num = len(self.fare_class_entries) + 1
-        frame_text = f"Fare Class {fare_class_num}"
-        fare_class_frame = ttk.LabelFrame(self.fare_classes_container, text=frame_text)
-        fare_class_frame.pack(fill="x", padx=5, pady=5) # Pack within the fare_classes_container
+    def _build_fare_class_frame(self) -> Tuple[ttk.LabelFrame, Tuple[tk.StringVar, ...], Tuple[str, ...], Tuple[ttk.Entry, ...]]:
+        """
+        Builds an unpacked fare class frame and returns (frame, vars, input-field keys, entries).
+        The entries are left out of self.input_fields until the frame is put in use.
+        """
+        # The input keys use a stable per-frame id; only the frame title shows the position
+        fc_id = self._next_fare_class_id
+        self._next_fare_class_id += 1
+        fare_class_frame = ttk.LabelFrame(self.fare_classes_container)
         fare_class_frame.grid_columnconfigure(1, weight=1)
 
-        # Use StringVar for dynamic entries
-        price_var = tk.StringVar(value="100.00")
-        demand_mean_var = tk.StringVar(value="50.00")
-        demand_std_dev_var = tk.StringVar(value="10.00")
-
         # Create input rows. The key suffix is crucial for uniqueness and retrieval.
+        field_labels = (f"Price_fc{fc_id}:", f"Demand Mean_fc{fc_id}:", f"Demand Std Dev_fc{fc_id}:")
         row_idx = 0
-        self.create_input_row(fare_class_frame, row_idx, f"Price_fc{fare_class_num}:", price_var, "Price of this fare class.")
+        price_var = self.create_input_row(fare_class_frame, row_idx, field_labels[0], "100.00", "Price of this fare class.")
         row_idx += 1
-        self.create_input_row(fare_class_frame, row_idx, f"Demand Mean_fc{fare_class_num}:", demand_mean_var, "Average demand for this class.")
+        mean_var = self.create_input_row(fare_class_frame, row_idx, field_labels[1], "50.00", "Average demand for this class.")
         row_idx += 1
-        self.create_input_row(fare_class_frame, row_idx, f"Demand Std Dev_fc{fare_class_num}:", demand_std_dev_var, "Standard deviation of demand for this class.")
+        std_var = self.create_input_row(fare_class_frame, row_idx, field_labels[2], "10.00", "Standard deviation of demand for this class.")
         row_idx += 1
 
-        self.fare_class_entries.append({
-            'price_var': price_var,
-            'demand_mean_var': demand_mean_var,
-            'demand_std_dev_var': demand_std_dev_var,
-            'frame': fare_class_frame
-        })
-        self.fare_class_frames.append(fare_class_frame)
+        keys = tuple(self._get_field_key_from_label(label) for label in field_labels)
+        entries = tuple(self.input_fields.pop(key) for key in keys)
+        return fare_class_frame, (price_var, mean_var, std_var), keys, entries
+
+    def _prewarm_fare_class_pool(self, size: int = 2):
+        """Builds spare fare class frames while idle, so the next few "Add Fare Class" clicks only pack one."""
+        self._pending_fc_prewarm = None
+        while len(self._fc_pool) < size:
+            self._fc_pool.append(self._build_fare_class_frame())
+
+    def add_fare_class_inputs(self):
+        """Adds a set of input fields for a fare class, reusing a pooled frame when one is available."""
+        fare_class_num = len(self._fc_frames) + 1
+        fare_class_frame, (price_var, mean_var, std_var), keys, entries = (
+            self._fc_pool.pop() if self._fc_pool else self._build_fare_class_frame())
+        fare_class_frame.config(text=f"Fare Class {fare_class_num}")
+        # Reused frames start from the defaults, like new ones
+        price_var.set("100.00")
+        mean_var.set("50.00")
+        std_var.set("10.00")
+        self.input_fields.update(zip(keys, entries))
+        fare_class_frame.pack(fill="x", padx=5, pady=5) # Pack within the fare_classes_container
+
+        self._fc_price_vars.append(price_var)
+        self._fc_mean_vars.append(mean_var)
+        self._fc_std_vars.append(std_var)
+        self._fc_frames.append(fare_class_frame)
+        self._fc_field_keys.append(keys)
         logger.info(f"Added Fare Class {fare_class_num}.")
 
     def remove_last_fare_class_inputs(self):
         """Removes the last added set of input fields for a fare class."""
-        if len(self.fare_class_entries) > 1: # Always keep at least one fare class
-            last_fc_dict = self.fare_class_entries.pop()
-            last_frame = self.fare_class_frames.pop()
-            last_frame.destroy()
-
-            # Remove corresponding entries from self.input_fields
-            # The keys are tied to the fare class number, so we need to know WHICH one was removed.
-            # This is implicitly the highest numbered one if always removing the last.
-            fare_class_num = len(self.fare_class_entries) + 1 # This is the number of the one just removed
-            keys_to_remove = [
-                self._get_field_key_from_label(f"Price_fc{fare_class_num}:"),
-                self._get_field_key_from_label(f"Demand Mean_fc{fare_class_num}:"),
-                self._get_field_key_from_label(f"Demand Std Dev_fc{fare_class_num}:"),
-            ]
-            for key in keys_to_remove:
-                if key in self.input_fields:
-                    del self.input_fields[key]
-                else:
-                    logger.warning(f"Attempted to delete non-existent input field key: {key}")
-
-            # Re-label remaining fare classes if necessary (optional, but good for UI)
-            self._update_cascaded_pricing_fare_class_numbers()
-            logger.info(f"Removed Fare Class {fare_class_num}.")
-        elif len(self.fare_class_entries) == 1:
+        if len(self._fc_frames) > 1: # Always keep at least one fare class
+            self._release_last_fare_class()
+            logger.info(f"Removed Fare Class {len(self._fc_frames) + 1}.")
+        elif len(self._fc_frames) == 1:
             messagebox.showinfo("Cascaded Pricing", "You must have at least one fare class.")
         else:
             messagebox.showinfo("Cascaded Pricing", "No fare classes to remove.")
 
-    def _update_cascaded_pricing_fare_class_numbers(self):
-        """Updates the label frame titles and input keys if fare classes are removed from the middle or reordered."""
-        # This function is primarily useful if you allow removal from anywhere,
-        # or want to re-number after a "clear all" then "add".
-        # For simple "remove last", it's less critical but harmless.
-        for i, fc_dict in enumerate(self.fare_class_entries):
-            old_frame_text = fc_dict['frame'].cget("text")
-            new_frame_text = f"Fare Class {i+1}"
-            if old_frame_text != new_frame_text:
-                fc_dict['frame'].config(text=new_frame_text)
-                # If we were strictly re-indexing internal self.input_fields keys,
-                # this would be the place to update them.
-                # Currently, our system generates keys like `price_fc1` and `price_fc2`,
-                # and when one is removed, the remaining ones keep their old numbers.
-                # For simplicity and correctness with our current key mapping,
-                # we are relying on the actual *key* in self.input_fields remaining unchanged
-                # if the entry itself isn't destroyed.
-                # Since we always destroy the last one, this re-labeling is purely cosmetic
-                # in this specific implementation, but good practice.
-                # If we ever allowed arbitrary removal (not just last),
-                # a more complex re-keying logic would be needed here.
+    def _release_last_fare_class(self):
+        """Unpacks the last fare class and returns its frame to the pool instead of destroying it."""
+        fc_vars = (self._fc_price_vars.pop(), self._fc_mean_vars.pop(), self._fc_std_vars.pop())
+        fare_class_frame = self._fc_frames.pop()
+        fare_class_frame.pack_forget()
+        # Take its entries out of self.input_fields; keys of the remaining classes are untouched,
+        # so there is nothing to re-number.
+        keys = self._fc_field_keys.pop()
+        entries = tuple(self.input_fields.pop(key) for key in keys)
+        self._fc_pool.append((fare_class_frame, fc_vars, keys, entries))
+
+    def _gather_fare_class_arrays(self) -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray], None]:
+        """
+        Returns the fare classes' prices, demand means and demand std devs as three float64 arrays,
+        parsed from the entry text and checked one column at a time with validate_numeric_array.
+        If any entry is bad, rechecks the classes one by one so the first error is reported as
+        before, shows it and returns None.
+        """
+        fc_vars = (self._fc_price_vars, self._fc_mean_vars, self._fc_std_vars)
+        columns = []
+        for variables, constraint, (_, field_name) in zip(fc_vars, _FARE_CLASS_ARRAY_CONSTRAINTS, _FARE_CLASS_FIELD_CHECKS):
+            field_names = [f"Fare Class {i} {field_name}" for i in range(1, len(variables) + 1)]
+            is_valid, column = validate_numeric_array([var.get() for var in variables], constraint, field_names)
+            if not is_valid:
+                break
+            columns.append(column)
+        else:
+            return tuple(columns)
 
+        validate_input = self.validate_input
+        for i, class_vars in enumerate(zip(*fc_vars)):
+            fc_num = i + 1 # For identification in error messages
+            for var, (vtype, field_name) in zip(class_vars, _FARE_CLASS_FIELD_CHECKS):
+                is_valid, message = validate_input(var.get(), vtype, f"Fare Class {fc_num} {field_name}")
+                if not is_valid:
+                    self.display_result(message, is_error=True)
+                    return None # Stop at first error
+        # Every entry passed on its own, so the column check failed on a value that overflows to inf
+        self.display_result(column, is_error=True)
+        return None
 
     def _calculate_cascaded_pricing_model(self):
         """Calculates Cascaded Pricing protection levels and displays results."""
-        capacity_key = self._get_field_key_from_label("Total Capacity:")
-        is_valid_capacity, capacity = self.validate_input(self.get_input_value(capacity_key), 'positive_numeric', "Total Capacity")
+        is_valid_capacity, capacity = self.validate_input(self._widgets[_Field.TOTAL_CAPACITY].get(), 'positive_numeric', "Total Capacity")
 
         if not is_valid_capacity:
             self.display_result(capacity, is_error=True)
             return
 
-        fare_classes_data_for_model = []
-        all_fare_classes_valid = True
-
-        if not self.fare_class_entries:
+        if not self._fc_frames:
             self.display_result("Please add at least one fare class.", is_error=True)
             return
 
-        # Gather data from dynamic fare class inputs
-        for i, fc_dict in enumerate(self.fare_class_entries):
-            fc_num = i + 1 # For identification in error messages
-            price_key = self._get_field_key_from_label(f"Price_fc{fc_num}:")
-            demand_mean_key = self._get_field_key_from_label(f"Demand Mean_fc{fc_num}:")
-            demand_std_dev_key = self._get_field_key_from_label(f"Demand Std Dev_fc{fc_num}:")
-
-            price_str = self.get_input_value(price_key)
-            demand_mean_str = self.get_input_value(demand_mean_key)
-            demand_std_dev_str = self.get_input_value(demand_std_dev_key)
-
-            # Validate individual fields within the fare class
-            is_valid_price, price = self.validate_input(price_str, 'positive_numeric', f"Fare Class {fc_num} Price")
-            is_valid_mean, demand_mean = self.validate_input(demand_mean_str, 'non_negative_numeric', f"Fare Class {fc_num} Demand Mean")
-            is_valid_std_dev, demand_std_dev = self.validate_input(demand_std_dev_str, 'non_negative_numeric', f"Fare Class {fc_num} Demand Std Dev")
-
-            if not all([is_valid_price, is_valid_mean, is_valid_std_dev]):
-                all_fare_classes_valid = False
-                if not is_valid_price: self.display_result(price, is_error=True)
-                elif not is_valid_mean: self.display_result(demand_mean, is_error=True)
-                elif not is_valid_std_dev: self.display_result(demand_std_dev, is_error=True)
-                return # Stop at first error
-
-            fare_classes_data_for_model.append({
-                'price': price,
-                'demand_mean': demand_mean,
-                'demand_std_dev': demand_std_dev,
-                'name': f"Fare Class {fc_num}" # Optional name for debugging in model
-            })
-
-        if not all_fare_classes_valid:
-            return # Already displayed error above
-
-        # Now, pass the gathered and individually validated data to the centralized validator
-        is_fare_classes_structurally_valid, validation_message_or_data = validate_fare_classes(fare_classes_data_for_model)
-
-        if not is_fare_classes_structurally_valid:
-            self.display_result(validation_message_or_data, is_error=True)
+        # Gather the fare classes as three float64 arrays (one per field), range-checked in bulk
+        fare_class_arrays = self._gather_fare_class_arrays()
+        if fare_class_arrays is None:
             return
+        prices, demand_means, demand_std_devs = fare_class_arrays
 
-        # Proceed with calculation using the validated and potentially reordered/cleaned data from validator
-        # Note: validate_fare_classes returns the *original* list if valid, so we use that.
-        result = calculate_cascaded_pricing_protection_levels(
-            total_capacity=capacity,
-            fare_classes=validation_message_or_data # This now contains the fully validated list
-        )
+        is_unique, unique_error = validate_unique_prices(prices)
+        if not is_unique:
+            self.display_result(unique_error, is_error=True)
+            return
+
+        # _gather_fare_class_arrays and validate_unique_prices have established every precondition the
+        # model checks (equal-length 1-D float64 arrays, finite positive unique prices, finite
+        # non-negative demands), so its own validation pass is skipped
+        result = calculate_cascaded_pricing_protection_levels_arrays(
+            capacity, prices, demand_means, demand_std_devs, validate=False)
 
         if "error" in result:
             self.display_result(result["error"], is_error=True)
         else:
             protection_levels = result['protection_levels']
-            result_text = "Optimal Protection Levels (Booking Limits):\n"
+            format_currency_output = self.format_currency_output
+            result_lines = ["Optimal Protection Levels (Booking Limits):"]
             # It's important to present results back in the user's input order for clarity
             # The `protection_levels` result from the function is already re-ordered to match original input indices.
-            for i, level in enumerate(protection_levels):
-                # We need to retrieve the original price for display, assuming fare_classes_data_for_model is still in order
-                original_price = fare_classes_data_for_model[i]['price']
-                result_text += (
-                    f"  Fare Class {i+1} (Price: {self.format_currency_output(original_price)}): "
-                    f"{self.format_number_output(level, 0)} units\n"
+            for i, (level, original_price) in enumerate(zip(protection_levels, prices.tolist())):
+                result_lines.append(
+                    f"  Fare Class {i+1} (Price: {format_currency_output(original_price)}): "
+                    f"{_format_units(level)} units"
                 )
-            # Add total available capacity for context
-            result_text += f"\nTotal Capacity: {self.format_number_output(capacity, 0)} units"
-            self.display_result(result_text)
+            # Add total available capacity for context, after a blank line
+            result_lines.append("")
+            result_lines.append(f"Total Capacity: {_format_units(capacity)} units")
+            self.display_result("\n".join(result_lines))
 
     # --- Main Calculation Dispatcher ---
     def calculate_selected_model(self):
         """Dispatches to the appropriate calculation method based on selected model."""
+        # Apply a selection still waiting on its debounce, so its frame exists before inputs are read
+        if self._pending_model_select is not None:
+            self.after_cancel(self._pending_model_select)
+            self._apply_model_selection(self.selected_model_var.get())
+
         self.display_result("Calculating...", is_error=False)
-        self.display_result("")
 
         selected_model = self.selected_model_var.get()
 
@@ -702,14 +775,29 @@ class OperationsFinanceGUI(BaseGUI):
         super().clear_inputs()
         self.selected_model_var.set("Select a Model")
         self.newsvendor_demand_type_var.set("Normal Distribution") # Reset newsvendor default
-        self._on_model_selected() # Trigger main model UI update to hide frames and clear messages
-
-        # Clear and reset Cascaded Pricing dynamic fare classes
-        for frame in self.fare_class_frames:
-            frame.destroy()
-        self.fare_class_frames.clear()
-        self.fare_class_entries.clear()
-        # No need to add defaults here, _on_model_selected handles it when Cascaded is picked again.
+        self._cancel_pending_selections()
+        self._apply_model_selection(self.selected_model_var.get()) # Hide frames and clear messages now
+
+        # Clear Cascaded Pricing dynamic fare classes; their frames go back to the pool
+        while self._fc_frames:
+            self._release_last_fare_class()
+        # No need to add defaults here, _apply_model_selection handles it when Cascaded is picked again.
+
+    def _cancel_pending_selections(self):
+        """Cancels any debounced combobox selection that has not been applied yet."""
+        if self._pending_model_select is not None:
+            self.after_cancel(self._pending_model_select)
+            self._pending_model_select = None
+        if self._pending_demand_select is not None:
+            self.after_cancel(self._pending_demand_select)
+            self._pending_demand_select = None
+
+    def destroy(self):
+        self._cancel_pending_selections()
+        if self._pending_fc_prewarm is not None:
+            self.after_cancel(self._pending_fc_prewarm)
+            self._pending_fc_prewarm = None
+        super().destroy()
 
 
 # Example usage (for testing OperationsFinanceGUI in isolation)
@@ -3,6 +3,20 @@
 import math
 import numpy as np
 
+def _pv_cash_flows(coupon_payment: float, face_value: float, periodic_yield: float, total_periods: int):
+    """
+    (HELPER FUNCTION)
+    Builds the period vector t = 1..total_periods and the present value of each period's
+    cash flow (coupon, plus face value in the final period), computed as NumPy arrays.
+
+    Returns:
+        tuple: (t, pv_cash_flows), both float64 arrays of length total_periods.
+    """
+    t = np.arange(1, total_periods + 1, dtype=np.float64)
+    cash_flows = np.full(total_periods, coupon_payment, dtype=np.float64)
+    cash_flows[-1] += face_value
+    return t, cash_flows / (1 + periodic_yield) ** t
+
 def _calculate_macaulay_duration_helper(face_value: float, coupon_rate: float, yield_to_maturity: float, n_years: float, compounding_freq_per_year: int) -> float:
     """
     (HELPER FUNCTION)
@@ -46,20 +60,10 @@ def _calculate_macaulay_duration_helper(face_value: float, coupon_rate: float, y
 
     coupon_payment = face_value * periodic_coupon_rate
 
-    # Calculate bond price (PV of all cash flows) and weighted time in a consistent loop
-    calculated_bond_price = 0.0
-    weighted_time_cash_flows = 0.0
-
-    for t in range(1, total_periods + 1):
-        cash_flow = coupon_payment
-        if t == total_periods:
-            cash_flow += face_value
-
-        # Present value of each cash flow
-        pv_cf_t = cash_flow / ((1 + periodic_yield)**t)
-        
-        calculated_bond_price += pv_cf_t
-        weighted_time_cash_flows += pv_cf_t * t
+    # Calculate bond price (PV of all cash flows) and weighted time over the whole period vector
+    t, pv_cash_flows = _pv_cash_flows(coupon_payment, face_value, periodic_yield, total_periods)
+    calculated_bond_price = float(pv_cash_flows.sum())
+    weighted_time_cash_flows = float(np.dot(pv_cash_flows, t))
 
     if calculated_bond_price <= 0:
         raise ValueError("Calculated bond price is zero or negative, Macaulay Duration cannot be calculated.")
@@ -140,17 +144,9 @@ def calculate_convexity(face_value: float, coupon_rate: float, yield_to_maturity
 
     coupon_payment = face_value * periodic_coupon_rate
 
-    calculated_bond_price = 0.0
-    sum_pv_time_sq_plus_time = 0.0
-
-    for t in range(1, total_periods + 1):
-        cash_flow = coupon_payment
-        if t == total_periods:
-            cash_flow += face_value
-        
-        pv_cf_t = cash_flow / ((1 + periodic_yield)**t)
-        calculated_bond_price += pv_cf_t
-        sum_pv_time_sq_plus_time += cash_flow * t * (t + 1) / ((1 + periodic_yield)**t)
+    t, pv_cash_flows = _pv_cash_flows(coupon_payment, face_value, periodic_yield, total_periods)
+    calculated_bond_price = float(pv_cash_flows.sum())
+    sum_pv_time_sq_plus_time = float(np.dot(pv_cash_flows, t * (t + 1)))
 
     if calculated_bond_price <= 0:
         raise ValueError("Bond price is zero or negative, convexity cannot be calculated.")
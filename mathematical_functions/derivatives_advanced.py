@@ -66,28 +66,24 @@ def binomial_option_price(S: float, K: float, T: float, r: float, sigma: float,
     else:  # put
         option_values = np.maximum(K - stock_prices_at_maturity, 0)
 
-    # Work backwards through the tree
+    discount = math.exp(-r * dt)
+    is_call = option_type.lower() == 'call'
+
+    # Work backwards through the tree, one whole time step per vectorized operation
     for i in range(n_steps - 1, -1, -1): # i represents the current time step (from n-1 down to 0)
-        temp_option_values = np.zeros(i + 1)
-        
-        for j in range(i + 1): # j represents the j-th node at current time step i
-            holding_value = (p * option_values[j] + (1 - p) * option_values[j+1]) * math.exp(-r * dt)
-            
-            current_stock_price = S * (u ** (i - j)) * (d ** j)
-            
-            if option_type.lower() == 'call':
-                intrinsic_value = max(current_stock_price - K, 0)
+        # Holding value at every node j of step i from its up (j) and down (j+1) children
+        option_values = (p * option_values[:-1] + (1 - p) * option_values[1:]) * discount
+
+        if american:
+            # Stock price at node j of step i is S * u^(i - j) * d^j
+            current_stock_prices = S * (u ** np.arange(i, -1, -1)) * (d ** np.arange(0, i + 1, 1))
+            if is_call:
+                intrinsic_values = np.maximum(current_stock_prices - K, 0)
             else: # put
-                intrinsic_value = max(K - current_stock_price, 0)
-
-            if american:
-                temp_option_values[j] = max(intrinsic_value, holding_value)
-            else:
-                temp_option_values[j] = holding_value
-        
-        option_values = temp_option_values
+                intrinsic_values = np.maximum(K - current_stock_prices, 0)
+            option_values = np.maximum(intrinsic_values, option_values)
             
-    return option_values[0] # The option price at time 0
+    return float(option_values[0]) # The option price at time 0
 
 def black_scholes_option_price(S: float, K: float, T: float, r: float, sigma: float, option_type: str = 'call', q: float = 0) -> float:
     """
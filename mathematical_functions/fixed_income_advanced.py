@@ -1,8 +1,35 @@
 # mathematical_functions/fixed_income_advanced.py
 
 import math
+from collections import namedtuple
 import numpy as np
 
+from .bond_risk import _pv_cash_flows
+
+# Price and risk measures of one bond, produced together by calculate_bond_analytics
+BondAnalytics = namedtuple("BondAnalytics", ["price", "macaulay_duration", "modified_duration", "convexity"])
+
+def _validate_bond_inputs(face_value: float, coupon_rate: float, yield_to_maturity: float, n_years: float, compounding_freq_per_year: int) -> None:
+    """
+    (HELPER FUNCTION)
+    Checks the bond inputs shared by the duration, convexity and analytics functions.
+
+    Raises:
+        ValueError: If face value, years or frequency is non-positive, the coupon rate is negative,
+                    or the yield to maturity is below -1.
+    """
+    if face_value <= 0:
+        raise ValueError("Face value must be positive.")
+    if coupon_rate < 0:
+        raise ValueError("Coupon rate cannot be negative.")
+    if n_years <= 0:
+        raise ValueError("Number of years must be positive.")
+    if not isinstance(compounding_freq_per_year, int) or compounding_freq_per_year <= 0:
+        raise ValueError("Compounding frequency per year must be a positive integer.")
+    # Yield to maturity can be negative in real markets, but not below -1 (-100%)
+    if yield_to_maturity < -1:
+        raise ValueError("Yield to maturity cannot be less than -1 (or -100%).")
+
 def calculate_macaulay_duration(face_value: float, coupon_rate: float, yield_to_maturity: float, n_years: float, compounding_freq_per_year: int) -> float:
     """
     Calculates the Macaulay Duration of a coupon-paying bond.
@@ -23,17 +50,7 @@ def calculate_macaulay_duration(face_value: float, coupon_rate: float, yield_to_
                     negative rates, or if bond price becomes zero/undefined).
     """
     # --- Input Validations ---
-    if face_value <= 0:
-        raise ValueError("Face value must be positive.")
-    if coupon_rate < 0:
-        raise ValueError("Coupon rate cannot be negative.")
-    if n_years <= 0:
-        raise ValueError("Number of years must be positive.")
-    if not isinstance(compounding_freq_per_year, int) or compounding_freq_per_year <= 0:
-        raise ValueError("Compounding frequency per year must be a positive integer.")
-    # Yield to maturity can be negative in real markets, but not below -1 (-100%)
-    if yield_to_maturity < -1:
-        raise ValueError("Yield to maturity cannot be less than -1 (or -100%).")
+    _validate_bond_inputs(face_value, coupon_rate, yield_to_maturity, n_years, compounding_freq_per_year)
 
         # --- Calculations Setup ---
     periodic_coupon_payment = (face_value * coupon_rate) / compounding_freq_per_year
@@ -43,27 +60,11 @@ def calculate_macaulay_duration(face_value: float, coupon_rate: float, yield_to_
     if total_periods == 0:
         return 0.0
 
-    pv_of_cash_flows_sum = 0.0
-    weighted_pv_cash_flows_sum = 0.0
+    # PV of every period's cash flow in one vector
+    t, pv_cash_flows = _pv_cash_flows(periodic_coupon_payment, face_value, periodic_yield, total_periods)
 
-    # Iterate through each period to calculate PV of cash flows and weighted PV
-    for i in range(1, total_periods + 1):
-        # Calculate cash flow for the current period (coupon payment)
-        current_cash_flow = periodic_coupon_payment
-
-        # Add face value to the last cash flow period
-        if i == total_periods:
-            current_cash_flow += face_value
-
-        # Discount factor
-        if periodic_yield == 0:
-            discount_factor = 1.0
-        else:
-            discount_factor = 1 / ((1 + periodic_yield) ** i)
-        
-        pv_cf = current_cash_flow * discount_factor
-        pv_of_cash_flows_sum += pv_cf
-        weighted_pv_cash_flows_sum += pv_cf * i # Weighted by period 'i'
+    pv_of_cash_flows_sum = float(pv_cash_flows.sum())
+    weighted_pv_cash_flows_sum = float(np.dot(pv_cash_flows, t)) # Weighted by period 't'
 
     # --- Handle effectively zero bond price (denominator) ---
     # Define dynamic tolerance based on face_value: 0.05% of face_value, with a minimum of 1e-9.
@@ -102,25 +103,13 @@ def calculate_convexity(face_value: float, coupon_rate: float, yield_to_maturity
                     negative rates, or if bond price becomes zero/undefined).
     """
     # --- Input Validations ---
-    if face_value <= 0:
-        raise ValueError("Face value must be positive.")
-    if coupon_rate < 0:
-        raise ValueError("Coupon rate cannot be negative.")
-    if n_years <= 0:
-        raise ValueError("Number of years must be positive.")
-    if not isinstance(compounding_freq_per_year, int) or compounding_freq_per_year <= 0:
-        raise ValueError("Compounding frequency per year must be a positive integer.")
-    if yield_to_maturity < -1:
-        raise ValueError("Yield to maturity cannot be less than -1 (or -100%).")
+    _validate_bond_inputs(face_value, coupon_rate, yield_to_maturity, n_years, compounding_freq_per_year)
     # Special case for 0 YTM in convexity, as the formula involves (1+y)^4 etc.,
     # and division by (1+y)^2 and so on. This implementation doesn't handle y=0 gracefully for convexity.
     if math.isclose(yield_to_maturity, 0.0, abs_tol=1e-9): # Use a small tolerance for exact zero YTM
          raise ValueError("Convexity calculation is not precisely defined for zero yield to maturity in this implementation.")
 
     # --- Calculations Setup ---
-    sum_convexity_numerator_terms = 0.0
-    bond_price_denominator = 0.0
-
     periodic_coupon_payment = (face_value * coupon_rate) / compounding_freq_per_year
     periodic_yield = yield_to_maturity / compounding_freq_per_year
     total_periods = int(n_years * compounding_freq_per_year)
@@ -128,21 +117,14 @@ def calculate_convexity(face_value: float, coupon_rate: float, yield_to_maturity
     if total_periods == 0:
         return 0.0
 
-    # Iterate through each period
-    for t in range(1, total_periods + 1):
-        cash_flow = periodic_coupon_payment
-        if t == total_periods:
-            cash_flow += face_value # Add face value to the last cash flow
+    # One discount vector serves both sums
+    t, pv_cash_flows = _pv_cash_flows(periodic_coupon_payment, face_value, periodic_yield, total_periods)
 
-        # Discount factor for bond price (PV of cash flow)
-        pv_factor = 1 / ((1 + periodic_yield) ** t)
-        
-        # Term for Convexity numerator: CF_t * t * (t+1) / (1 + periodic_yield)^(t+2)
-        convexity_term_numerator = (cash_flow * t * (t + 1)) / ((1 + periodic_yield) ** (t + 2))
-        sum_convexity_numerator_terms += convexity_term_numerator
-            
-        # Calculate bond price along the way (sum of PV of all cash flows)
-        bond_price_denominator += cash_flow * pv_factor
+    # Convexity numerator terms: CF_t * t * (t+1) / (1 + periodic_yield)^(t+2)
+    sum_convexity_numerator_terms = float(np.dot(pv_cash_flows, t * (t + 1))) / (1 + periodic_yield) ** 2
+
+    # Bond price (sum of PV of all cash flows)
+    bond_price_denominator = float(pv_cash_flows.sum())
 
     # --- Handle effectively zero bond price (denominator) ---
     # Define dynamic tolerance based on face_value: 0.05% of face_value, with a minimum of 1e-9.
@@ -162,6 +144,53 @@ def calculate_convexity(face_value: float, coupon_rate: float, yield_to_maturity
     return convexity_in_years_squared
 
 
+def calculate_bond_analytics(face_value: float, coupon_rate: float, yield_to_maturity: float, n_years: float, compounding_freq_per_year: int) -> BondAnalytics:
+    """
+    Calculates price, Macaulay Duration, Modified Duration and Convexity of a coupon-paying bond
+    from a single discounted cash-flow vector, for callers that need several of these measures
+    for the same bond.
+
+    Args:
+        face_value (float): The par value or maturity value of the bond.
+        coupon_rate (float): The annual coupon rate (as a decimal).
+        yield_to_maturity (float): The annual yield to maturity (as a decimal).
+        n_years (float): The number of years until the bond matures.
+        compounding_freq_per_year (int): Number of times interest is compounded/coupons are paid per year.
+
+    Returns:
+        BondAnalytics: (price, macaulay_duration, modified_duration, convexity), with durations
+                       in years and convexity in years squared.
+
+    Raises:
+        ValueError: If inputs are invalid (same rules as calculate_macaulay_duration)
+                    or the bond price is effectively zero, leaving duration and convexity undefined.
+    """
+    # --- Input Validations ---
+    _validate_bond_inputs(face_value, coupon_rate, yield_to_maturity, n_years, compounding_freq_per_year)
+
+    # --- Calculations Setup ---
+    periodic_coupon_payment = (face_value * coupon_rate) / compounding_freq_per_year
+    periodic_yield = yield_to_maturity / compounding_freq_per_year
+    total_periods = int(n_years * compounding_freq_per_year)
+
+    if total_periods == 0:
+        return BondAnalytics(0.0, 0.0, 0.0, 0.0)
+
+    t, pv_cash_flows = _pv_cash_flows(periodic_coupon_payment, face_value, periodic_yield, total_periods)
+    price = float(pv_cash_flows.sum())
+
+    effectively_zero_threshold = max(face_value * 0.00051, 1e-9) # 0.05% of face value, or min 1e-9
+    if math.isclose(price, 0.0, abs_tol=effectively_zero_threshold):
+        raise ValueError("Bond price (sum of PV of cash flows) is effectively zero, duration and convexity are undefined.")
+
+    # --- Final Calculation (all measures share the price and period vector) ---
+    macaulay_duration = float(np.dot(pv_cash_flows, t)) / price / compounding_freq_per_year
+    modified_duration = macaulay_duration / (1 + periodic_yield)
+    convexity = float(np.dot(pv_cash_flows, t * (t + 1))) / ((1 + periodic_yield) ** 2 * price * compounding_freq_per_year ** 2)
+
+    return BondAnalytics(price, macaulay_duration, modified_duration, convexity)
+
+
 def calculate_forward_rate(spot_rate_t1: float, t1_years: float, spot_rate_t2: float, t2_years: float) -> float:
     """
     Calculates the implied annual effective forward rate between two future points
@@ -0,0 +1,10 @@
+# mathematical_functions/normal_distribution.py
+
+import math
+
+# Standard normal density shared by the pricing and operations models; a single exp(), no scipy needed.
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+def norm_pdf(x: float) -> float:
+    """Standard normal probability density function."""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
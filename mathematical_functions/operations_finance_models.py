@@ -1,14 +1,38 @@
 # financial_calculator/models/operations_finance_models.py
 
 import math
-from scipy.stats import norm
+import functools
+import numpy as np
 import logging
 from utils.validation import validate_newsvendor_demand_params, validate_fare_classes
+from .normal_distribution import norm_pdf
 
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+@functools.lru_cache(maxsize=64)
+def _critical_ratio_quantile(critical_ratio: float) -> float:
+    """
+    Standard normal quantile of a Newsvendor critical ratio. Cached so repeated calculations
+    that only change the demand parameters skip the ndtri call.
+    """
+    from scipy.special import ndtri # Deferred so importing this module (and the EOQ path) skips scipy
+    return float(ndtri(critical_ratio))
+
+def _newsvendor_normal_core(z_star: float, mean_demand: float, std_dev_demand: float) -> tuple[float, float, float]:
+    """
+    Optimal quantity, expected stockout and expected leftover for normal demand with std_dev_demand > 0,
+    given the critical-ratio quantile z_star.
+    """
+    from scipy.special import ndtr
+    pdf_z = norm_pdf(z_star)
+    cdf_z = float(ndtr(z_star))
+    optimal_quantity = mean_demand + std_dev_demand * z_star
+    expected_stockout = std_dev_demand * (pdf_z - z_star * (1 - cdf_z))
+    expected_leftover = std_dev_demand * (pdf_z + z_star * cdf_z)
+    return optimal_quantity, expected_stockout, expected_leftover
+
 def calculate_eoq(annual_demand: float, ordering_cost_per_order: float, holding_cost_per_unit_per_year: float) -> dict:
     """
     Calculates the Economic Order Quantity (EOQ) and total annual cost.
@@ -61,7 +85,8 @@ def calculate_reorder_point(daily_demand: float, lead_time_days: float, service_
         safety_stock = 0.0
 
         if std_dev_daily_demand > 0 and service_level > 0.5:
-            z_score = norm.ppf(service_level)
+            from scipy.special import ndtri # Deferred to the only branch that needs it
+            z_score = float(ndtri(service_level)) # Standard normal inverse CDF
             std_dev_lead_time_demand = math.sqrt(lead_time_days) * std_dev_daily_demand
             safety_stock = z_score * std_dev_lead_time_demand
         elif std_dev_daily_demand == 0 and service_level > 0.5: # Clarify case where SS is 0
@@ -126,10 +151,8 @@ def calculate_newsvendor_optimal_quantity(cost_understock: float, cost_overstock
                 expected_stockout = max(0, mean_demand - optimal_quantity)
                 expected_leftover = max(0, optimal_quantity - mean_demand)
             else:
-                optimal_quantity = norm.ppf(critical_ratio, loc=mean_demand, scale=std_dev_demand)
-                z_star = (optimal_quantity - mean_demand) / std_dev_demand
-                expected_stockout = std_dev_demand * (norm.pdf(z_star) - z_star * (1 - norm.cdf(z_star)))
-                expected_leftover = std_dev_demand * (norm.pdf(z_star) + z_star * norm.cdf(z_star))
+                optimal_quantity, expected_stockout, expected_leftover = _newsvendor_normal_core(
+                    _critical_ratio_quantile(critical_ratio), mean_demand, std_dev_demand)
 
         elif demand_type.lower() == 'uniform':
             min_demand = demand_params['min'] # Safe to access directly
@@ -166,6 +189,39 @@ def calculate_newsvendor_optimal_quantity(cost_understock: float, cost_overstock
         return {"error": f"An unexpected error occurred during Newsvendor calculation: {e}"}
 
 
+def _protection_levels_core(prices: np.ndarray, demand_means: np.ndarray, demand_std_devs: np.ndarray) -> np.ndarray:
+    """
+    EMSR-a protection levels for validated fare-class arrays, returned in input order.
+    Sorts once by descending price, then uses cumulative sums and one vectorized ppf
+    instead of re-summing the higher-priced classes for every class.
+    """
+    from scipy.special import ndtri
+    order = np.argsort(-prices, kind='stable')
+    sorted_prices = prices[order]
+
+    # Combined demand of each class and all classes priced above it
+    combined_means = np.cumsum(demand_means[order])[:-1]
+    combined_std_devs = np.sqrt(np.cumsum(demand_std_devs[order] ** 2))[:-1]
+
+    price_higher, price_lower = sorted_prices[:-1], sorted_prices[1:]
+    # P(Demand for higher bundle > Q) = P_lower / P_higher, clamped to avoid ppf errors
+    prob_thresholds = np.clip(1 - price_lower / price_higher, 0.0001, 0.9999)
+    calculated_limits = np.where(
+        combined_std_devs == 0,
+        combined_means,
+        combined_means + combined_std_devs * ndtri(prob_thresholds),
+    )
+    calculated_limits[price_higher <= price_lower] = 0.0
+
+    # Nesting: each limit is at least the limit of the next lower class, and never negative.
+    # The lowest price class has a booking limit of 0.
+    booking_limits = np.zeros(prices.size)
+    booking_limits[:-1] = np.maximum.accumulate(np.maximum(calculated_limits, 0.0)[::-1])[::-1]
+
+    protection_levels = np.empty_like(booking_limits)
+    protection_levels[order] = booking_limits
+    return protection_levels
+
 def calculate_cascaded_pricing_protection_levels(total_capacity: float, fare_classes: list) -> dict:
     """
     Calculates optimal protection levels (booking limits) for multiple fare classes
@@ -194,87 +250,80 @@ def calculate_cascaded_pricing_protection_levels(total_capacity: float, fare_cla
         logger.error(f"Cascaded Pricing failed: Fare classes validation error: {validated_fare_classes_or_error}")
         return {"error": validated_fare_classes_or_error}
 
-    # Use the potentially corrected/validated fare_classes for the rest of the logic
-    # Note: Our validation function returns the original list if valid.
-    # fare_classes = validated_fare_classes_or_error # No, original is already fine if valid.
+    prices = np.fromiter((fc['price'] for fc in fare_classes), dtype=np.float64, count=len(fare_classes))
+    demand_means = np.fromiter((fc['demand_mean'] for fc in fare_classes), dtype=np.float64, count=len(fare_classes))
+    demand_std_devs = np.fromiter((fc['demand_std_dev'] for fc in fare_classes), dtype=np.float64, count=len(fare_classes))
 
-    # Store original index to return results in original order (keep this)
-    # This must be done BEFORE sorting to preserve original order mapping.
-    for idx, fc in enumerate(fare_classes):
-        fc['original_index'] = idx
-    
     try:
-        # Sort fare classes by price in descending order for calculation logic
-        # This step can raise KeyError if 'price' is missing (but validate_fare_classes should prevent this now)
-        # Or TypeError if price is not comparable (also prevented by validation)
-        # So, the try-except here becomes a general safeguard, rather than primary validation.
-        sorted_fare_classes = sorted(fare_classes, key=lambda x: x['price'], reverse=True)
-    except Exception as e: # Broaden to catch any unexpected sorting issues, though less likely now
-        logger.error(f"Cascaded Pricing failed during sorting: {e}")
-        return {"error": f"An unexpected error occurred during fare class sorting: {e}"}
-
-    # REMOVE THE FOLLOWING BLOCK: It's now handled by validate_fare_classes
-    # for i, fc in enumerate(sorted_fare_classes):
-    #     if not all(k in fc for k in ['price', 'demand_mean', 'demand_std_dev']):
-    #         logger.error(f"Cascaded Pricing failed: Fare class {i+1} missing required keys.")
-    #         return {"error": f"Fare class {i+1} is missing required parameters."}
-    #     if not (isinstance(fc['price'], (int, float)) and fc['price'] > 0):
-    #         logger.error(f"Cascaded Pricing failed: Fare class {i+1} price must be positive.")
-    #         return {"error": f"Fare class {i+1} price must be positive."}
-    #     if not (isinstance(fc['demand_mean'], (int, float)) and fc['demand_mean'] >= 0):
-    #         logger.error(f"Cascaded Pricing failed: Fare class {i+1} demand mean must be non-negative.")
-    #         return {"error": f"Fare class {i+1} demand mean must be non-negative."}
-    #     if not (isinstance(fc['demand_std_dev'], (int, float)) and fc['demand_std_dev'] >= 0):
-    #         logger.error(f"Cascaded Pricing failed: Fare class {i+1} demand std dev must be non-negative.")
-    #         return {"error": f"Fare class {i+1} demand std dev must be non-negative."}
-
-    num_classes = len(sorted_fare_classes)
-    # booking_limits[i] = total units to protect for classes with index 0 to i (highest prices)
-    booking_limits_temp = [0.0] * num_classes
+        return {
+            "protection_levels": _protection_levels_core(prices, demand_means, demand_std_devs).tolist(),
+            "expected_revenue": None # Complex to calculate accurately without simulation/more inputs
+        }
+    except Exception as e:
+        logger.error(f"Error calculating Cascaded Pricing: {e}")
+        return {"error": f"An unexpected error occurred during Cascaded Pricing calculation: {e}"}
 
-    try:
-        # Lowest price class (last in sorted list) has a booking limit of 0.
-        booking_limits_temp[num_classes - 1] = 0.0
-
-        # Iterate from the second lowest price class up to the highest price class (index 0)
-        # This calculates booking_limits[i] (for class i and all higher-priced classes).
-        for i in range(num_classes - 2, -1, -1):
-            current_fc_sorted = sorted_fare_classes[i] # Higher price class in current comparison
-            next_lower_fc_sorted = sorted_fare_classes[i+1] # Lower price class for comparison (opportunity cost)
-
-            price_higher = current_fc_sorted['price']
-            price_lower = next_lower_fc_sorted['price']
-
-            # Sum of demands for the current class AND all classes ABOVE it (for this bundle)
-            combined_mean_for_bl = sum(fc['demand_mean'] for fc in sorted_fare_classes[:i+1])
-            combined_variance_for_bl = sum(fc['demand_std_dev']**2 for fc in sorted_fare_classes[:i+1])
-            combined_std_dev_for_bl = math.sqrt(combined_variance_for_bl)
-
-            if price_higher <= price_lower:
-                logger.warning(f"Price for class '{current_fc_sorted.get('name', 'N/A')}' ({price_higher}) is not strictly higher than class '{next_lower_fc_sorted.get('name', 'N/A')}' ({price_lower}). Setting calculated limit to 0.")
-                calculated_limit = 0.0
-            elif combined_std_dev_for_bl == 0:
-                calculated_limit = combined_mean_for_bl
-            else:
-                # Probability threshold for norm.ppf: P(Demand for higher bundle > Q) = P_lower / P_higher
-                # So, CDF(Q) = 1 - (P_lower / P_higher)
-                prob_threshold = 1 - (price_lower / price_higher)
-                prob_threshold = max(0.0001, min(0.9999, prob_threshold)) # Clamp to avoid ppf errors
-                calculated_limit = norm.ppf(prob_threshold, loc=combined_mean_for_bl, scale=combined_std_dev_for_bl)
-            
-            # Booking limit for class `i` ensures nesting: it's the max of its calculated limit
-            # and the booking limit for the next higher class (i+1).
-            booking_limits_temp[i] = max(0.0, calculated_limit, booking_limits_temp[i+1]) # Ensure non-negative and nested
+def calculate_cascaded_pricing_protection_levels_arrays(total_capacity: float, prices, demand_means, demand_std_devs,
+                                                        validate: bool = True) -> dict:
+    """
+    Array form of calculate_cascaded_pricing_protection_levels: the fare classes are given
+    as three parallel arrays instead of a list of dicts, and validated in vectorized passes.
+
+    Args:
+        total_capacity (float): Total available capacity. Must be positive.
+        prices (array-like): Price of each fare class. Must be positive and unique.
+        demand_means (array-like): Mean demand of each fare class. Must be non-negative.
+        demand_std_devs (array-like): Std dev of demand of each fare class. Must be non-negative.
+        validate (bool, optional): Check the fare class arrays. Callers that have already checked
+                                   them (finite, positive unique prices, non-negative demands,
+                                   equal-length 1-D float64 arrays) may pass False. Defaults to True.
+
+    Returns:
+        dict: 'protection_levels' (booking limits for each class in input order).
+              Returns 'error' key on invalid input/exception.
+    """
+    if not isinstance(total_capacity, (int, float)) or total_capacity <= 0:
+        logger.error("Cascaded Pricing failed: Total capacity must be a positive number.")
+        return {"error": "Total capacity must be a positive number."}
 
-        # Reorder booking limits to match original input order
-        final_ordered_protection_levels = [0.0] * num_classes
-        for i, fc in enumerate(sorted_fare_classes):
-            original_idx = fc['original_index']
-            final_ordered_protection_levels[original_idx] = booking_limits_temp[i]
+    if not validate:
+        return _protection_levels_result(prices, demand_means, demand_std_devs)
 
+    try:
+        prices = np.asarray(prices, dtype=np.float64)
+        demand_means = np.asarray(demand_means, dtype=np.float64)
+        demand_std_devs = np.asarray(demand_std_devs, dtype=np.float64)
+    except (TypeError, ValueError):
+        logger.error("Cascaded Pricing failed: Fare class prices and demands must be numeric.")
+        return {"error": "Fare class prices and demands must be numbers."}
+
+    if prices.ndim != 1 or prices.shape != demand_means.shape or prices.shape != demand_std_devs.shape:
+        logger.error("Cascaded Pricing failed: Fare class arrays must be one-dimensional and of equal length.")
+        return {"error": "Fare class prices, demand means and demand standard deviations must have the same length."}
+    if prices.size == 0:
+        logger.error("Cascaded Pricing failed: At least one fare class must be provided.")
+        return {"error": "At least one fare class must be provided for Cascaded Pricing."}
+    if not (np.isfinite(prices).all() and np.isfinite(demand_means).all() and np.isfinite(demand_std_devs).all()):
+        logger.error("Cascaded Pricing failed: Fare class prices and demands must be finite.")
+        return {"error": "Fare class prices and demands must be finite numbers."}
+    if (prices <= 0).any():
+        logger.error("Cascaded Pricing failed: Fare class prices must be positive.")
+        return {"error": "Fare class prices must be positive."}
+    if np.unique(prices).size != prices.size:
+        logger.error("Cascaded Pricing failed: Fare class prices must be unique.")
+        return {"error": "Fare class prices must be unique."}
+    if (demand_means < 0).any() or (demand_std_devs < 0).any():
+        logger.error("Cascaded Pricing failed: Fare class demand means and standard deviations cannot be negative.")
+        return {"error": "Fare class demand means and standard deviations cannot be negative."}
+
+    return _protection_levels_result(prices, demand_means, demand_std_devs)
+
+def _protection_levels_result(prices: np.ndarray, demand_means: np.ndarray, demand_std_devs: np.ndarray) -> dict:
+    """Result dict of calculate_cascaded_pricing_protection_levels_arrays for validated arrays."""
+    try:
         return {
-            "protection_levels": final_ordered_protection_levels,
-            "expected_revenue": None # Complex to calculate accurately without simulation/more inputs
+            "protection_levels": _protection_levels_core(prices, demand_means, demand_std_devs).tolist(),
+            "expected_revenue": None
         }
     except Exception as e:
         logger.error(f"Error calculating Cascaded Pricing: {e}")
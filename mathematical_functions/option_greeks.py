@@ -1,7 +1,8 @@
 # mathematical_functions/option_greeks.py
 
 import math
-from scipy.stats import norm
+from scipy.special import ndtr
+from .normal_distribution import norm_pdf
 
 def _d1_d2(S: float, K: float, T: float, r: float, sigma: float, q: float) -> tuple[float, float]:
     """
@@ -62,9 +63,9 @@ def black_scholes_delta(S: float, K: float, T: float, r: float, sigma: float, op
     d1, _ = _d1_d2(S, K, T, r, sigma, q)
     
     if option_type.lower() == 'call':
-        delta = math.exp(-q * T) * norm.cdf(d1)
+        delta = math.exp(-q * T) * ndtr(d1)
     elif option_type.lower() == 'put':
-        delta = math.exp(-q * T) * (norm.cdf(d1) - 1)
+        delta = math.exp(-q * T) * (ndtr(d1) - 1)
     else:
         raise ValueError("option_type must be 'call' or 'put'.")
         
@@ -94,7 +95,7 @@ def black_scholes_gamma(S: float, K: float, T: float, r: float, sigma: float, q:
     d1, _ = _d1_d2(S, K, T, r, sigma, q)
     
     # Probability density function of standard normal distribution
-    N_prime_d1 = norm.pdf(d1)
+    N_prime_d1 = norm_pdf(d1)
     
     gamma = math.exp(-q * T) * N_prime_d1 / (S * sigma * math.sqrt(T))
     return gamma
@@ -124,11 +125,11 @@ def black_scholes_theta(S: float, K: float, T: float, r: float, sigma: float, op
     """
     d1, d2 = _d1_d2(S, K, T, r, sigma, q)
     
-    N_prime_d1 = norm.pdf(d1)
-    N_d1 = norm.cdf(d1)
-    N_d2 = norm.cdf(d2)
-    N_neg_d1 = norm.cdf(-d1)
-    N_neg_d2 = norm.cdf(-d2)
+    N_prime_d1 = norm_pdf(d1)
+    N_d1 = ndtr(d1)
+    N_d2 = ndtr(d2)
+    N_neg_d1 = ndtr(-d1)
+    N_neg_d2 = ndtr(-d2)
 
     term1 = -(S * math.exp(-q * T) * N_prime_d1 * sigma) / (2 * math.sqrt(T))
     term2_call = q * S * math.exp(-q * T) * N_d1
@@ -169,7 +170,7 @@ def black_scholes_vega(S: float, K: float, T: float, r: float, sigma: float, q:
     """
     d1, _ = _d1_d2(S, K, T, r, sigma, q)
     
-    N_prime_d1 = norm.pdf(d1)
+    N_prime_d1 = norm_pdf(d1)
     
     vega = S * math.exp(-q * T) * N_prime_d1 * math.sqrt(T)
     return vega
@@ -199,8 +200,8 @@ def black_scholes_rho(S: float, K: float, T: float, r: float, sigma: float, opti
     """
     _, d2 = _d1_d2(S, K, T, r, sigma, q)
     
-    N_d2 = norm.cdf(d2)
-    N_neg_d2 = norm.cdf(-d2)
+    N_d2 = ndtr(d2)
+    N_neg_d2 = ndtr(-d2)
     
     if option_type.lower() == 'call':
         rho = K * T * math.exp(-r * T) * N_d2
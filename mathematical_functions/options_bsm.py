@@ -1,7 +1,7 @@
 # mathematical_functions/options_bsm.py
 
 import math
-from scipy.stats import norm
+from scipy.special import ndtr
 
 def _d1_d2(S: float, K: float, T: float, r: float, sigma: float, q: float = 0) -> tuple[float, float]:
     """
@@ -71,8 +71,8 @@ def black_scholes_call_price(S: float, K: float, T: float, r: float, sigma: floa
     d1, d2 = _d1_d2(S, K, T, r, sigma, q)
     
     # Cumulative distribution function of standard normal distribution
-    N_d1 = norm.cdf(d1)
-    N_d2 = norm.cdf(d2)
+    N_d1 = ndtr(d1)
+    N_d2 = ndtr(d2)
     
     call_price = S * math.exp(-q * T) * N_d1 - K * math.exp(-r * T) * N_d2
     return call_price
@@ -111,8 +111,8 @@ def black_scholes_put_price(S: float, K: float, T: float, r: float, sigma: float
     d1, d2 = _d1_d2(S, K, T, r, sigma, q)
     
     # Cumulative distribution function of standard normal distribution
-    N_neg_d1 = norm.cdf(-d1)
-    N_neg_d2 = norm.cdf(-d2)
+    N_neg_d1 = ndtr(-d1)
+    N_neg_d2 = ndtr(-d2)
     
     put_price = K * math.exp(-r * T) * N_neg_d2 - S * math.exp(-q * T) * N_neg_d1
     return put_price
\ No newline at end of file
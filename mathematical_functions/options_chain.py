@@ -0,0 +1,55 @@
+# mathematical_functions/options_chain.py
+
+import numpy as np
+from scipy.special import ndtr
+
+def black_scholes_option_price_vec(S, K, T, r: float, sigma, option_type: str = 'call', q: float = 0) -> np.ndarray:
+    """
+    Prices a whole chain of European options (call or put) with the Black-Scholes-Merton model
+    in a single vectorized pass. Any of S, K, T and sigma may be scalars or arrays; they are
+    broadcast against each other, so a chain of strikes and maturities is priced with one call
+    instead of a Python loop over black_scholes_option_price.
+
+    Args:
+        S (float or array-like): Current stock price(s). Must be positive.
+        K (float or array-like): Option strike price(s). Must be positive.
+        T (float or array-like): Time(s) to expiration (in years). Must be positive.
+        r (float): Risk-free interest rate (annualized, continuous compounding, as a decimal). Must be finite.
+        sigma (float or array-like): Volatility (annualized, as a decimal). Must be positive.
+        option_type (str, optional): Type of option, 'call' or 'put'. Case-insensitive. Defaults to 'call'.
+        q (float, optional): Continuous dividend yield (annualized, as a decimal). Must be finite. Defaults to 0.
+
+    Returns:
+        np.ndarray: Option prices with the broadcast shape of S, K, T and sigma.
+
+    Raises:
+        ValueError: If any S, K, T or sigma is non-positive or not finite, r or q is not finite,
+                    the inputs cannot be broadcast, or option_type is not 'call' or 'put'.
+    """
+    if option_type.lower() not in ['call', 'put']:
+        raise ValueError("Invalid option_type. Must be 'call' or 'put'.")
+
+    S, K, T, sigma = np.broadcast_arrays(
+        np.asarray(S, dtype=np.float64),
+        np.asarray(K, dtype=np.float64),
+        np.asarray(T, dtype=np.float64),
+        np.asarray(sigma, dtype=np.float64),
+    )
+    # isfinite as well as the sign: nan <= 0 is False, so a sign test alone lets NaN through
+    invalid = (~np.isfinite(S) | (S <= 0)) | (~np.isfinite(K) | (K <= 0)) | (~np.isfinite(T) | (T <= 0)) | (~np.isfinite(sigma) | (sigma <= 0))
+    if invalid.any():
+        raise ValueError("S, K, T, and sigma must be positive.")
+    if not (np.isfinite(r) and np.isfinite(q)):
+        raise ValueError("r and q must be finite.")
+
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+
+    discounted_S = S * np.exp(-q * T)
+    discounted_K = K * np.exp(-r * T)
+
+    if option_type.lower() == 'call':
+        return discounted_S * ndtr(d1) - discounted_K * ndtr(d2)
+    else: # 'put'
+        return discounted_K * ndtr(-d2) - discounted_S * ndtr(-d1)
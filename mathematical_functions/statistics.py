@@ -4,7 +4,7 @@ import numpy as np
 from scipy import stats
 import math
 
-def calculate_descriptive_stats(data_list: list | tuple[list, list]) -> dict:
+def calculate_descriptive_stats(data_list: list | np.ndarray | tuple[list, list]) -> dict:
     """
     Calculates descriptive statistics for one or two lists of numerical data.
 
@@ -14,8 +14,8 @@ def calculate_descriptive_stats(data_list: list | tuple[list, list]) -> dict:
     the covariance and correlation between them.
 
     Args:
-        data_list (list | tuple[list, list]):
-            - A single list of numerical data (e.g., [1, 2, 3, 4, 5]).
+        data_list (list | np.ndarray | tuple[list, list]):
+            - A single list or 1-D array of numerical data (e.g., [1, 2, 3, 4, 5]).
             - A tuple containing two lists of numerical data
               (e.g., ([1, 2, 3], [4, 5, 6])) for which covariance and
               correlation will also be calculated.
@@ -52,28 +52,29 @@ def calculate_descriptive_stats(data_list: list | tuple[list, list]) -> dict:
     # Determine if input is a single list or a tuple of two lists
     if isinstance(data_list, tuple) and len(data_list) == 2:
         # Ensure both lists in the tuple are not empty before processing
-        if not data_list[0] or not data_list[1]:
+        if len(data_list[0]) == 0 or len(data_list[1]) == 0:
             raise ValueError("Input data list(s) cannot be empty.")
         try:
-            data1 = np.array(data_list[0], dtype=float)
-            data2 = np.array(data_list[1], dtype=float)
+            data1 = np.asarray(data_list[0], dtype=float)
+            data2 = np.asarray(data_list[1], dtype=float)
         except ValueError:
             # Catch conversion errors for non-numeric values
             raise ValueError("Input data list(s) contain non-numeric values.")
         is_two_lists = True
-    elif isinstance(data_list, list):
+    elif isinstance(data_list, (list, np.ndarray)):
         # Ensure the single list is not empty
-        if not data_list:
+        if len(data_list) == 0:
             raise ValueError("Input data list(s) cannot be empty.")
         try:
-            data1 = np.array(data_list, dtype=float)
+            # asarray avoids a copy when the caller already passes a float64 array
+            data1 = np.asarray(data_list, dtype=float)
         except ValueError:
             # Catch conversion errors for non-numeric values
             raise ValueError("Input data list(s) contain non-numeric values.")
         is_two_lists = False
     else:
         # Raise error for invalid input type
-        raise ValueError("Input 'data_list' must be a list or a tuple of two lists.")
+        raise ValueError("Input 'data_list' must be a list, an array or a tuple of two lists.")
 
     # The isnan check is still good for detecting NaNs that might arise from other operations,
     # though the primary non-numeric string conversion is now handled above.
@@ -145,15 +146,15 @@ def calculate_descriptive_stats(data_list: list | tuple[list, list]) -> dict:
 
     return results
 
-def perform_simple_linear_regression(x_data: list[float], y_data: list[float]) -> dict:
+def perform_simple_linear_regression(x_data: list[float] | np.ndarray, y_data: list[float] | np.ndarray) -> dict:
     """
     Performs a simple linear regression (y = mx + b) and returns the slope, intercept, and R-squared.
 
     Uses `scipy.stats.linregress` for robust calculation.
 
     Args:
-        x_data (list[float]): The independent variable data (list of floats).
-        y_data (list[float]): The dependent variable data (list of floats).
+        x_data (list[float] | np.ndarray): The independent variable data (list or array of floats).
+        y_data (list[float] | np.ndarray): The dependent variable data (list or array of floats).
 
     Returns:
         dict: A dictionary containing the regression results:
@@ -170,7 +171,7 @@ def perform_simple_linear_regression(x_data: list[float], y_data: list[float]) -
             - If x_data has no variance (all x values are the same), as
               regression cannot be performed in such a case.
     """
-    if not x_data or not y_data:
+    if len(x_data) == 0 or len(y_data) == 0:
         raise ValueError("Input data lists cannot be empty.")
     if len(x_data) != len(y_data):
         raise ValueError("Input X and Y data lists must have the same length.")
@@ -178,8 +179,8 @@ def perform_simple_linear_regression(x_data: list[float], y_data: list[float]) -
         raise ValueError("At least two data points are required for linear regression.")
 
     try:
-        x_np = np.array(x_data, dtype=float)
-        y_np = np.array(y_data, dtype=float)
+        x_np = np.asarray(x_data, dtype=float)
+        y_np = np.asarray(y_data, dtype=float)
     except ValueError:
         raise ValueError("Input data lists contain non-numeric values.")
 
@@ -7,8 +7,10 @@ from mathematical_functions.fixed_income_advanced import (
     calculate_forward_rate,
     calculate_yield_curve_spot_rate,
     calculate_par_rate,
-    bootstrap_yield_curve
+    bootstrap_yield_curve,
+    calculate_bond_analytics
 )
+from mathematical_functions.bonds import calculate_bond_price
 import numpy as np
 import math
 
@@ -89,6 +91,38 @@ def test_convexity_invalid_inputs():
     with pytest.raises(ValueError, match="Bond price is effectively zero, convexity is undefined."):
         calculate_convexity(FACE_VALUE, COUPON_RATE, 100.0, N_YEARS, COMP_FREQ) # YTM = 100%
 
+@pytest.mark.parametrize("freq", [1, 2, 4, 12])
+def test_duration_and_convexity_match_period_loop_by_payment_frequency(freq):
+    """Vectorized sums agree with a per-period loop on a 30-year bond, for each payment frequency."""
+    face_value, coupon_rate, ytm, n_years = 1000.0, 0.045, 0.052, 30
+    y = ytm / freq
+    cash_flows = [face_value * coupon_rate / freq] * (n_years * freq)
+    cash_flows[-1] += face_value
+    price = sum(cf / (1 + y) ** t for t, cf in enumerate(cash_flows, start=1))
+    weighted = sum(t * cf / (1 + y) ** t for t, cf in enumerate(cash_flows, start=1))
+    curvature = sum(cf * t * (t + 1) / (1 + y) ** (t + 2) for t, cf in enumerate(cash_flows, start=1))
+
+    assert calculate_macaulay_duration(face_value, coupon_rate, ytm, n_years, freq) == pytest.approx(weighted / price / freq, rel=1e-12)
+    assert calculate_convexity(face_value, coupon_rate, ytm, n_years, freq) == pytest.approx(curvature / price / freq ** 2, rel=1e-12)
+
+# --- calculate_bond_analytics tests ---
+def test_bond_analytics_matches_individual_functions():
+    """Fused analytics agree with the standalone duration and convexity functions."""
+    analytics = calculate_bond_analytics(FACE_VALUE, COUPON_RATE, YTM, 10, COMP_FREQ)
+    assert analytics.price == pytest.approx(calculate_bond_price(FACE_VALUE, COUPON_RATE, YTM, 10, COMP_FREQ))
+    assert analytics.macaulay_duration == pytest.approx(calculate_macaulay_duration(FACE_VALUE, COUPON_RATE, YTM, 10, COMP_FREQ))
+    assert analytics.modified_duration == pytest.approx(analytics.macaulay_duration / (1 + YTM / COMP_FREQ))
+    assert analytics.convexity == pytest.approx(calculate_convexity(FACE_VALUE, COUPON_RATE, YTM, 10, COMP_FREQ))
+
+def test_bond_analytics_invalid_inputs():
+    """Fused analytics apply the shared bond input validation rules."""
+    with pytest.raises(ValueError, match="Face value must be positive."):
+        calculate_bond_analytics(0, COUPON_RATE, YTM, N_YEARS, COMP_FREQ)
+    with pytest.raises(ValueError, match="Compounding frequency per year must be a positive integer."):
+        calculate_bond_analytics(FACE_VALUE, COUPON_RATE, YTM, N_YEARS, 0)
+    with pytest.raises(ValueError, match=r"Bond price \(sum of PV of cash flows\) is effectively zero, duration and convexity are undefined."):
+        calculate_bond_analytics(FACE_VALUE, COUPON_RATE, 100.0, N_YEARS, COMP_FREQ)
+
 # --- calculate_forward_rate tests ---
 def test_forward_rate_basic():
     """Test implied forward rate calculation with basic spot rates."""
@@ -2,11 +2,13 @@
 
 import pytest
 import math
+import numpy as np
 from mathematical_functions.operations_finance_models import (
     calculate_eoq,
     calculate_reorder_point,
     calculate_newsvendor_optimal_quantity,
-    calculate_cascaded_pricing_protection_levels
+    calculate_cascaded_pricing_protection_levels,
+    calculate_cascaded_pricing_protection_levels_arrays
 )
 # --- Tests for calculate_eoq ---
 
@@ -85,6 +87,13 @@ def test_calculate_reorder_point_invalid_inputs(daily_demand, lead_time_days, se
     assert isinstance(result["error"], str)
 
 
+@pytest.mark.parametrize("service_level", [0.51, 0.8, 0.95, 0.9999])
+def test_calculate_reorder_point_safety_stock_matches_scipy_stats(service_level):
+    """Safety stock uses the exact standard normal quantile (same as norm.ppf)."""
+    from scipy.stats import norm
+    result = calculate_reorder_point(40, 9, service_level, 6)
+    assert result["safety_stock"] == pytest.approx(norm.ppf(service_level) * 3 * 6, rel=1e-12)
+
 # --- Tests for calculate_newsvendor_optimal_quantity ---
 
 @pytest.mark.parametrize(
@@ -115,6 +124,18 @@ def test_calculate_newsvendor_valid_inputs(cu, co, demand_type, demand_params, e
     if expected_es is not None:
         assert math.isclose(result["expected_stockout"], expected_es, rel_tol=1e-2)
 
+@pytest.mark.parametrize("cu, co", [(1, 99), (10, 90), (50, 50), (97, 3)])
+def test_calculate_newsvendor_normal_matches_scipy_stats(cu, co):
+    """The ndtri/ndtr normal core agrees with the scipy.stats norm formulas."""
+    from scipy.stats import norm
+    mean, std_dev = 250.0, 40.0
+    result = calculate_newsvendor_optimal_quantity(cu, co, 'normal', {'mean': mean, 'std_dev': std_dev})
+    q = norm.ppf(cu / (cu + co), loc=mean, scale=std_dev)
+    z = (q - mean) / std_dev
+    assert result["optimal_quantity"] == pytest.approx(q, rel=1e-12)
+    assert result["expected_stockout"] == pytest.approx(std_dev * (norm.pdf(z) - z * (1 - norm.cdf(z))), rel=1e-9)
+    assert result["expected_leftover"] == pytest.approx(std_dev * (norm.pdf(z) + z * norm.cdf(z)), rel=1e-9)
+
 @pytest.mark.parametrize(
     "cu, co, demand_type, demand_params",
     [
@@ -207,10 +228,61 @@ def test_calculate_cascaded_pricing_valid_inputs(total_capacity, fare_classes, e
             {'price': 100, 'demand_mean': 30, 'demand_std_dev': 10, 'name': 'First'},
             {'price': 100, 'demand_mean': 80, 'demand_std_dev': 20, 'name': 'Economy'}
         ]),
+        (100, [ # Duplicate prices that are not adjacent in input order
+            {'price': 150, 'demand_mean': 30, 'demand_std_dev': 10},
+            {'price': 200, 'demand_mean': 20, 'demand_std_dev': 5},
+            {'price': 150, 'demand_mean': 80, 'demand_std_dev': 20}
+        ]),
     ]
 )
 def test_calculate_cascaded_pricing_invalid_inputs(total_capacity, fare_classes):
     """Test calculate_cascaded_pricing_protection_levels with invalid inputs, expecting an error."""
     result = calculate_cascaded_pricing_protection_levels(total_capacity, fare_classes)
     assert "error" in result
-    assert isinstance(result["error"], str)
\ No newline at end of file
+    assert isinstance(result["error"], str)
+
+def test_calculate_cascaded_pricing_arrays_matches_dict_form():
+    """The array form returns the same protection levels as the list-of-dicts form, in input order."""
+    fare_classes = [
+        {'price': 120, 'demand_mean': 40, 'demand_std_dev': 12},
+        {'price': 300, 'demand_mean': 20, 'demand_std_dev': 5},
+        {'price': 80, 'demand_mean': 100, 'demand_std_dev': 0},
+        {'price': 200, 'demand_mean': 50, 'demand_std_dev': 10},
+    ]
+    expected = calculate_cascaded_pricing_protection_levels(200, fare_classes)["protection_levels"]
+    result = calculate_cascaded_pricing_protection_levels_arrays(
+        200,
+        np.array([fc['price'] for fc in fare_classes]),
+        np.array([fc['demand_mean'] for fc in fare_classes]),
+        np.array([fc['demand_std_dev'] for fc in fare_classes]),
+    )
+    assert "error" not in result
+    assert result["protection_levels"] == pytest.approx(expected, rel=1e-12)
+
+def test_calculate_cascaded_pricing_arrays_skips_validation_for_checked_inputs():
+    """validate=False gives the same protection levels for arrays the caller already checked."""
+    prices = np.array([120.0, 300.0, 80.0])
+    demand_means = np.array([40.0, 20.0, 100.0])
+    demand_std_devs = np.array([12.0, 5.0, 0.0])
+    validated = calculate_cascaded_pricing_protection_levels_arrays(150, prices, demand_means, demand_std_devs)
+    trusted = calculate_cascaded_pricing_protection_levels_arrays(150, prices, demand_means, demand_std_devs, validate=False)
+    assert trusted["protection_levels"] == validated["protection_levels"]
+
+@pytest.mark.parametrize(
+    "total_capacity, prices, demand_means, demand_std_devs",
+    [
+        (0, [100], [50], [10]),                     # Zero capacity
+        (100, [], [], []),                          # No fare classes
+        (100, [200, 100], [30], [10, 20]),          # Mismatched lengths
+        (100, [200, -100], [30, 80], [10, 20]),     # Negative price
+        (100, [200, 200], [30, 80], [10, 20]),      # Duplicate prices
+        (100, [200, 100], [30, -80], [10, 20]),     # Negative mean demand
+        (100, [200, 100], [30, 80], [10, float('nan')]), # Non-finite std dev
+        (100, [200, "abc"], [30, 80], [10, 20]),    # Non-numeric price
+    ]
+)
+def test_calculate_cascaded_pricing_arrays_invalid_inputs(total_capacity, prices, demand_means, demand_std_devs):
+    """Test calculate_cascaded_pricing_protection_levels_arrays with invalid inputs, expecting an error."""
+    result = calculate_cascaded_pricing_protection_levels_arrays(total_capacity, prices, demand_means, demand_std_devs)
+    assert "error" in result
+    assert isinstance(result["error"], str)
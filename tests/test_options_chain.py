@@ -0,0 +1,68 @@
+# tests/test_options_chain.py
+
+import pytest
+import numpy as np
+from mathematical_functions.options_chain import black_scholes_option_price_vec
+from mathematical_functions.derivatives_advanced import black_scholes_option_price
+
+# Common parameters for testing
+S_test = 100
+r_test = 0.05
+q_test = 0.02
+strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+maturities = np.array([0.25, 0.5, 1.0, 1.5, 2.0])
+sigmas = np.array([0.15, 0.20, 0.25, 0.30, 0.35])
+
+@pytest.mark.parametrize("option_type", ['call', 'put', 'CALL', 'Put'])
+def test_vec_matches_scalar_pricing(option_type):
+    """Each element of the chain should match the scalar BSM price."""
+    prices = black_scholes_option_price_vec(S_test, strikes, maturities, r_test, sigmas, option_type, q_test)
+    expected = [
+        black_scholes_option_price(S_test, k, t, r_test, sigma, option_type, q_test)
+        for k, t, sigma in zip(strikes, maturities, sigmas)
+    ]
+    assert prices.shape == strikes.shape
+    assert prices == pytest.approx(expected, rel=1e-9)
+
+def test_vec_broadcasts_strike_by_maturity_grid():
+    """A column of strikes against a row of maturities prices the full grid."""
+    prices = black_scholes_option_price_vec(S_test, strikes[:, None], maturities[None, :], r_test, 0.2)
+    assert prices.shape == (len(strikes), len(maturities))
+    assert prices[2, 2] == pytest.approx(black_scholes_option_price(S_test, 100.0, 1.0, r_test, 0.2))
+
+def test_vec_put_call_parity():
+    """C - P = S*exp(-qT) - K*exp(-rT) for every contract in the chain."""
+    calls = black_scholes_option_price_vec(S_test, strikes, maturities, r_test, sigmas, 'call', q_test)
+    puts = black_scholes_option_price_vec(S_test, strikes, maturities, r_test, sigmas, 'put', q_test)
+    parity = S_test * np.exp(-q_test * maturities) - strikes * np.exp(-r_test * maturities)
+    assert calls - puts == pytest.approx(parity, rel=1e-9)
+
+def test_vec_scalar_inputs_return_zero_dim():
+    """Scalar inputs still work and return a 0-d array."""
+    price = black_scholes_option_price_vec(S_test, 100, 1.0, r_test, 0.2)
+    assert price.shape == ()
+    assert float(price) == pytest.approx(black_scholes_option_price(S_test, 100, 1.0, r_test, 0.2))
+
+@pytest.mark.parametrize("K, T, sigma", [
+    ([100, 0], 1.0, 0.2),
+    ([100, 110], [1.0, -0.5], 0.2),
+    ([100, 110], 1.0, [0.2, 0.0]),
+    ([float('nan'), 100], [1.0, float('inf')], 0.2), # NaN and inf are not positive finite inputs
+    (100, 1.0, float('nan')),
+])
+def test_vec_non_positive_inputs_raise_error(K, T, sigma):
+    with pytest.raises(ValueError, match="S, K, T, and sigma must be positive."):
+        black_scholes_option_price_vec(S_test, K, T, r_test, sigma)
+
+@pytest.mark.parametrize("r, q", [
+    (float('nan'), 0.0),
+    (r_test, float('inf')),
+    (float('-inf'), q_test),
+])
+def test_vec_non_finite_rates_raise_error(r, q):
+    with pytest.raises(ValueError, match="r and q must be finite."):
+        black_scholes_option_price_vec(S_test, strikes, 1.0, r, 0.2, 'call', q)
+
+def test_vec_invalid_option_type_raises_error():
+    with pytest.raises(ValueError, match="Invalid option_type. Must be 'call' or 'put'."):
+        black_scholes_option_price_vec(S_test, strikes, 1.0, r_test, 0.2, 'straddle')
@@ -199,4 +199,33 @@ def test_linear_regression_invalid_no_x_variance():
     This makes the slope undefined. Expects a ValueError.
     """
     with pytest.raises(ValueError, match=r"Cannot perform regression: X data has no variance \(all X values are the same\)."): # Fixed regex escape
-        perform_simple_linear_regression([1, 1, 1], [2, 3, 4])
\ No newline at end of file
+        perform_simple_linear_regression([1, 1, 1], [2, 3, 4])
+
+
+def test_descriptive_stats_accepts_numpy_array():
+    """
+    A float64 array (as produced by the General Tools GUI) gives the same results as a list.
+    """
+    data = [2.5, 1.0, 4.0, 4.0, 7.5]
+    from_array = calculate_descriptive_stats(np.array(data, dtype=np.float64))
+    from_list = calculate_descriptive_stats(data)
+    for key, value in from_list.items():
+        assert from_array[key] == pytest.approx(value)
+
+def test_descriptive_stats_empty_numpy_array():
+    with pytest.raises(ValueError, match=r"Input data list\(s\) cannot be empty."):
+        calculate_descriptive_stats(np.array([], dtype=np.float64))
+
+def test_linear_regression_accepts_numpy_arrays():
+    """
+    Regression on float64 arrays matches regression on the equivalent lists.
+    """
+    x_data = [1, 2, 3, 4, 5]
+    y_data = [2, 4, 5, 4, 5]
+    from_arrays = perform_simple_linear_regression(np.array(x_data, dtype=np.float64), np.array(y_data, dtype=np.float64))
+    from_lists = perform_simple_linear_regression(x_data, y_data)
+    assert from_arrays == pytest.approx(from_lists)
+
+def test_linear_regression_empty_numpy_arrays():
+    with pytest.raises(ValueError, match=r"Input data lists cannot be empty."):
+        perform_simple_linear_regression(np.array([]), np.array([]))
@@ -0,0 +1,97 @@
+# tests/test_validation.py
+
+import pytest
+import numpy as np
+from utils.validation import validate_numeric_input, validate_numeric_array, validate_positive_numeric_input
+
+# --- Tests for validate_numeric_input ---
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (".5", 0.5),
+        ("5.", 5.0),
+        ("1e5", 100000.0),
+        ("-2.5E-3", -0.0025),
+        ("+7", 7.0),
+        ("  42  ", 42.0),   # Surrounding whitespace
+    ]
+)
+def test_validate_numeric_input_accepts_decimal_and_scientific(value, expected):
+    assert validate_numeric_input(value, "X") == (True, pytest.approx(expected))
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-Infinity", "1_000", "0x10", "abc", "1e", ".", "1,000", "--1"])
+def test_validate_numeric_input_rejects_non_decimal_text(value):
+    assert validate_numeric_input(value, "X") == (False, "X must be a valid number.")
+
+@pytest.mark.parametrize("value", ["", "   "])
+def test_validate_numeric_input_empty(value):
+    assert validate_numeric_input(value, "X") == (False, "X cannot be empty.")
+
+# --- Tests for validate_numeric_array ---
+
+@pytest.mark.parametrize(
+    "values, constraint, expected",
+    [
+        (["1", "2.5", " 3e2 "], 'numeric', [1.0, 2.5, 300.0]),   # GUI strings
+        (["0", "4"], 'non_negative', [0.0, 4.0]),                # Zero is non-negative
+        ([1, 2.0], 'positive', [1.0, 2.0]),                      # Plain numbers
+        (np.array([1.5, 2.5]), 'positive', [1.5, 2.5]),          # NumPy array
+        (["1", 2.0], 'positive', [1.0, 2.0]),                    # Mixed strings and numbers
+    ]
+)
+def test_validate_numeric_array_valid_inputs(values, constraint, expected):
+    is_valid, result = validate_numeric_array(values, constraint)
+    assert is_valid
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == pytest.approx(expected)
+
+@pytest.mark.parametrize(
+    "values, constraint, expected_message",
+    [
+        (["1", ""], 'numeric', "B cannot be empty."),                     # Empty string
+        (["abc", "1"], 'numeric', "A must be a valid number."),           # Malformed string
+        (["1", "x", 2.0], 'numeric', "B must be a valid number."),        # Malformed string in a mixed list
+        (["1", float('inf')], 'numeric', "B must be a valid number."),    # inf in a mixed list
+        ([1.0, float('nan')], 'numeric', "B must be a valid number."),    # NaN number
+        (["1e999", "1"], 'numeric', "A must be a valid number."),         # Overflows to inf
+        (["5", "-1"], 'non_negative', "B must be a non-negative number."),
+        (["0", "1"], 'positive', "A must be a positive number."),
+    ]
+)
+def test_validate_numeric_array_invalid_inputs(values, constraint, expected_message):
+    is_valid, message = validate_numeric_array(values, constraint, ["A", "B", "C"][:len(values)])
+    assert not is_valid
+    assert message == expected_message
+
+@pytest.mark.parametrize(
+    "values, expected_message",
+    [
+        (["1", "2", "-3"], "Input must be a non-negative number."),      # String path
+        ([1.0, 2.0, -3.0], "Input must be a non-negative number."),      # Numeric path
+        (["1", "2", "x"], "Input must be a valid number."),              # Scalar fallback path
+    ]
+)
+def test_validate_numeric_array_fewer_names_than_values(values, expected_message):
+    assert validate_numeric_array(values, 'non_negative', ["a", "b"]) == (False, expected_message)
+
+def test_validate_numeric_array_unsupported_constraint():
+    is_valid, message = validate_numeric_array(["1"], 'integer')
+    assert not is_valid
+    assert message == "Internal error: Invalid validation type."
+
+# --- Tests for validate_positive_numeric_input ---
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("010", 10.0),   # Leading zero is decimal, not octal
+        ("100.00", 100.0),
+    ]
+)
+def test_validate_positive_numeric_input_parses_decimal(value, expected):
+    assert validate_positive_numeric_input(value, "Price") == (True, expected)
+
+@pytest.mark.parametrize("value", ["0x10", "0b101", "0o10"])
+def test_validate_positive_numeric_input_rejects_prefixed_integers(value):
+    assert validate_positive_numeric_input(value, "Price") == (False, "Price must be a valid number.")
@@ -1,12 +1,31 @@
 # financial_calculator/utils/validation.py
 
 import logging
-from typing import Union, List, Dict
+import re
+from typing import Union, List, Dict, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Plain decimal or scientific notation, optionally signed and padded with whitespace.
+# Anything else is rejected up front instead of letting float() raise.
+_NUM_RE = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+
+class InputError(ValueError):
+    """
+    Raised when a GUI input fails validation.
+
+    Attributes:
+        field (str): The name of the offending input field.
+        msg (str): The user-facing validation message.
+    """
+    def __init__(self, field: str, msg: str):
+        super().__init__(msg)
+        self.field, self.msg = field, msg
+
 def validate_numeric_input(value: str, field_name: str = "Input") -> tuple[bool, float | str]:
     """
     Validates if a string can be converted to a float.
@@ -20,12 +39,10 @@ def validate_numeric_input(value: str, field_name: str = "Input") -> tuple[bool,
     """
     if not value.strip():
         return False, f"{field_name} cannot be empty."
-    try:
-        numeric_value = float(value)
-        return True, numeric_value
-    except ValueError:
+    if _NUM_RE.fullmatch(value) is None:
         logger.warning(f"Validation failed for '{field_name}': '{value}' is not a valid number.")
         return False, f"{field_name} must be a valid number."
+    return True, float(value)
 
 def validate_positive_numeric_input(value: str, field_name: str = "Input") -> tuple[bool, float | str]:
     """
@@ -128,6 +145,10 @@ def validate_list_input(input_str: str, expected_type: str, field_name: str) ->
 
     validated_list = []
     if expected_type == 'numeric':
+        # Fast path: when every item is a well-formed number, convert them all in one pass
+        if all(map(_NUM_RE.fullmatch, items)):
+            return True, list(map(float, items))
+        # Otherwise walk the items to report the first invalid one
         for item in items:
             is_valid, numeric_value = validate_numeric_input(item, f"item in {field_name}")
             if not is_valid:
@@ -143,6 +164,68 @@ def validate_list_input(input_str: str, expected_type: str, field_name: str) ->
         logger.error(f"Internal error: Unsupported validation type '{expected_type}' requested for list input '{field_name}'.")
         return False, f"Internal error: Invalid validation type for {field_name}."
         
+def validate_numeric_array(values: Sequence[Union[str, float]], constraint: str = 'numeric', field_names: Sequence[str] = ()) -> tuple[bool, np.ndarray | str]:
+    """
+    Validates a batch of numeric inputs in one vectorized pass instead of one
+    validate_*_input call per value.
+
+    Args:
+        values (Sequence[str | float]): GUI strings or numbers to validate.
+        constraint (str): 'numeric', 'non_negative' (>= 0) or 'positive' (> 0).
+        field_names (Sequence[str]): Names of the fields, in the same order as values,
+                                     for error messages. Values without a name are called "Input".
+
+    Returns:
+        tuple[bool, np.ndarray | str]: (True, float64_array) if every value is valid,
+                                       (False, error_message) for the first invalid value otherwise.
+    """
+    names = list(field_names)[:len(values)]
+    names += ["Input"] * (len(values) - len(names))
+    scalar_validators = {
+        'numeric': validate_numeric_input,
+        'non_negative': validate_non_negative_numeric_input,
+        'positive': validate_positive_numeric_input,
+    }
+    if constraint not in scalar_validators:
+        logger.error(f"Internal error: Unsupported constraint '{constraint}' requested for numeric array validation.")
+        return False, "Internal error: Invalid validation type."
+
+    if isinstance(values, np.ndarray) or not any(isinstance(v, str) for v in values):
+        arr = np.asarray(values, dtype=np.float64)
+    else:
+        texts = [v if isinstance(v, str) else str(v) for v in values] # Mixed lists: numbers are checked as text too
+        if all(map(_NUM_RE.fullmatch, texts)):
+            arr = np.fromiter(map(float, texts), dtype=np.float64, count=len(texts))
+        else:
+            # Malformed strings: walk them with the scalar validator to report the first one
+            parsed = []
+            for text, name in zip(texts, names):
+                is_valid, result = scalar_validators[constraint](text, name)
+                if not is_valid:
+                    return False, result
+                parsed.append(result)
+            # Every value passed on its own; still run the finite check below (e.g. '1e999' parses to inf)
+            arr = np.asarray(parsed, dtype=np.float64)
+
+    ok = np.isfinite(arr)
+    if constraint == 'non_negative':
+        ok &= arr >= 0
+    elif constraint == 'positive':
+        ok &= arr > 0
+    if ok.all():
+        return True, arr
+
+    bad = int(np.flatnonzero(~ok)[0])
+    name, value = names[bad], arr[bad]
+    if not np.isfinite(value):
+        logger.warning(f"Validation failed for '{name}': '{value}' is not a valid number.")
+        return False, f"{name} must be a valid number."
+    if constraint == 'non_negative':
+        logger.warning(f"Validation failed for '{name}': '{value}' must be non-negative.")
+        return False, f"{name} must be a non-negative number."
+    logger.warning(f"Validation failed for '{name}': '{value}' must be positive.")
+    return False, f"{name} must be a positive number."
+
 def validate_numeric_range(value: str, min_val: Union[int, float], max_val: Union[int, float], field_name: str = "Input") -> tuple[bool, float | str]:
     """
     Validates if a string can be converted to a float and falls within a specified inclusive range.
@@ -272,6 +355,28 @@ def validate_newsvendor_demand_params(demand_type: str, demand_params: dict) ->
     
     return True, demand_params
 
+def validate_unique_prices(prices: Sequence[float]) -> tuple[bool, np.ndarray | str]:
+    """
+    Checks that fare class prices are unique in one vectorized pass.
+
+    Args:
+        prices (Sequence[float]): Price of each fare class, in fare class order.
+
+    Returns:
+        tuple[bool, np.ndarray | str]: (True, float64_array) if no price repeats,
+                                       (False, error_message) naming the first class that repeats an earlier price otherwise.
+    """
+    arr = np.asarray(prices, dtype=np.float64)
+    # A stable sort puts equal prices next to each other in input order; the later one of each pair is a repeat
+    order = np.argsort(arr, kind='stable')
+    repeats = order[1:][arr[order[1:]] == arr[order[:-1]]]
+    if repeats.size:
+        i = int(repeats.min())
+        price = prices[i]
+        logger.warning(f"Validation failed: Fare Class {i+1} has a duplicate price of {price}. Prices must be unique.")
+        return False, f"Fare Class {i+1} has a duplicate price of {price}. Prices must be unique."
+    return True, arr
+
 def validate_fare_classes(fare_classes: List[Dict[str, Union[float, str]]]) -> tuple[bool, List[Dict[str, Union[float, str]]] | str]:
     """
     Validates a list of fare class dictionaries for Cascaded Pricing.
@@ -294,7 +399,6 @@ def validate_fare_classes(fare_classes: List[Dict[str, Union[float, str]]]) -> t
         logger.warning("Validation failed: At least one fare class must be provided for Cascaded Pricing.")
         return False, "At least one fare class must be provided for Cascaded Pricing."
 
-    prices_seen = set()
     for i, fc in enumerate(fare_classes):
         if not isinstance(fc, dict):
             logger.warning(f"Validation failed: Fare class entry {i+1} is not a dictionary.")
@@ -318,11 +422,6 @@ def validate_fare_classes(fare_classes: List[Dict[str, Union[float, str]]]) -> t
         if price <= 0:
             logger.warning(f"Validation failed: Fare Class {i+1} price ({price}) must be positive.")
             return False, f"Fare Class {i+1} price must be positive."
-        # Keep this check: Prices must be unique.
-        if price in prices_seen:
-            logger.warning(f"Validation failed: Fare Class {i+1} has a duplicate price of {price}. Prices must be unique.")
-            return False, f"Fare Class {i+1} has a duplicate price of {price}. Prices must be unique."
-        prices_seen.add(price)
 
         if not isinstance(demand_mean, (int, float)):
             logger.warning(f"Validation failed: Fare Class {i+1} demand mean '{demand_mean}' must be numeric.")
@@ -337,7 +436,12 @@ def validate_fare_classes(fare_classes: List[Dict[str, Union[float, str]]]) -> t
         if demand_std_dev < 0:
             logger.warning(f"Validation failed: Fare Class {i+1} demand standard deviation ({demand_std_dev}) cannot be negative.")
             return False, f"Fare Class {i+1} demand standard deviation cannot be negative."
-    
+
+    # Keep this check: Prices must be unique.
+    is_unique, unique_error = validate_unique_prices([fc['price'] for fc in fare_classes])
+    if not is_unique:
+        return False, unique_error
+
     return True, fare_classes
 # --- Example Usage (for testing purposes, won't run when imported) ---
 if __name__ == '__main__':